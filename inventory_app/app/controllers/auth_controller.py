@@ -1,9 +1,8 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Form
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, Form
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.database import SessionLocal
-from app.core.security import verify_password, create_access_token, hash_password
-from app.models.user import User
+from app.core.deps import get_db
+from app.services import auth_service
 
 router = APIRouter(
     prefix="/auth",
@@ -11,32 +10,16 @@ router = APIRouter(
 )
 
 
-def get_db():
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
-
-
 # -------------------------
 # LOGIN
 # -------------------------
 @router.post("/login")
-def login(
+async def login(
     username: str = Form(...),
     password: str = Form(...),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
-    user = db.query(User).filter(User.username == username).first()
-
-    if not user or not verify_password(password, user.password):
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Invalid username or password"
-        )
-
-    token = create_access_token(user.id)
+    token = await auth_service.authenticate_user(db, username, password)
 
     return {
         "access_token": token,
@@ -48,19 +31,11 @@ def login(
 # REGISTER
 # -------------------------
 @router.post("/register")
-def register(
+async def register(
     username: str = Form(...),
     password: str = Form(...),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
-    if db.query(User).filter(User.username == username).first():
-        raise HTTPException(status_code=400, detail="User already exists")
-
-    user = User(
-        username=username,
-        password=hash_password(password)
-    )
-    db.add(user)
-    db.commit()
+    await auth_service.register_user(db, username, password)
 
     return {"message": "User registered successfully"}
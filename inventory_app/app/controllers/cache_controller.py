@@ -0,0 +1,18 @@
+from fastapi import APIRouter, Depends
+
+from app.core.cache import reference_cache
+from app.core.deps import require_user
+from app.core.security import token_cache
+
+router = APIRouter(
+    prefix="/api/cache",
+    tags=["Cache"]
+)
+
+
+@router.get("/stats")
+async def cache_stats(user_id: int = Depends(require_user)):
+    return {
+        "reference": reference_cache.stats(),
+        "tokens": token_cache.stats(),
+    }
@@ -1,10 +1,12 @@
-from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, Query, status
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.database import SessionLocal
-from app.core.deps import require_user
-from app.models.category import Category
+from app.core.deps import get_db, require_user
+from app.core.etag import etag_guard
+from app.core.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
 from app.schemas.category import CategoryCreate, CategoryOut
+from app.schemas.pagination import Page
+from app.services import category_service
 
 router = APIRouter(
     prefix="/api/categories",
@@ -12,17 +14,6 @@ router = APIRouter(
 )
 
 
-# -------------------------
-# DB DEPENDENCY
-# -------------------------
-def get_db():
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
-
-
 # -------------------------
 # CREATE CATEGORY
 # -------------------------
@@ -31,26 +22,12 @@ def get_db():
     response_model=CategoryOut,
     status_code=status.HTTP_201_CREATED
 )
-def create_category(
+async def create_category(
     payload: CategoryCreate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     user_id: int = Depends(require_user)
 ):
-    existing = db.query(Category).filter(
-        Category.name.ilike(payload.name)
-    ).first()
-
-    if existing:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Category already exists"
-        )
-
-    category = Category(name=payload.name)
-    db.add(category)
-    db.commit()
-    db.refresh(category)
-    return category
+    return await db.run_sync(category_service.create_category, payload)
 
 
 # -------------------------
@@ -58,21 +35,20 @@ def create_category(
 # -------------------------
 @router.get(
     "/",
-    response_model=list[CategoryOut]
+    response_model=Page[CategoryOut],
+    dependencies=[Depends(etag_guard("categories"))]
 )
-def list_categories(
+async def list_categories(
     search: str | None = Query(default=None),
-    db: Session = Depends(get_db),
+    limit: int = Query(default=DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: str | None = Query(default=None),
+    db: AsyncSession = Depends(get_db),
     user_id: int = Depends(require_user)
 ):
-    query = db.query(Category)
-
-    if search:
-        query = query.filter(
-            Category.name.ilike(f"%{search}%")
-        )
-
-    return query.order_by(Category.id.desc()).all()
+    items, next_cursor = await db.run_sync(
+        category_service.list_categories, search, limit, cursor
+    )
+    return {"items": items, "next_cursor": next_cursor}
 
 
 # -------------------------
@@ -82,24 +58,15 @@ def list_categories(
     "/{category_id}",
     response_model=CategoryOut
 )
-def update_category(
+async def update_category(
     category_id: int,
     payload: CategoryCreate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     user_id: int = Depends(require_user)
 ):
-    category = db.get(Category, category_id)
-
-    if not category:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Category not found"
-        )
-
-    category.name = payload.name
-    db.commit()
-    db.refresh(category)
-    return category
+    return await db.run_sync(
+        category_service.update_category, category_id, payload
+    )
 
 
 # -------------------------
@@ -109,19 +76,10 @@ def update_category(
     "/{category_id}",
     status_code=status.HTTP_200_OK
 )
-def delete_category(
+async def delete_category(
     category_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     user_id: int = Depends(require_user)
 ):
-    category = db.get(Category, category_id)
-
-    if not category:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Category not found"
-        )
-
-    db.delete(category)
-    db.commit()
+    await db.run_sync(category_service.delete_category, category_id)
     return {"message": "Category deleted successfully"}
@@ -0,0 +1,13 @@
+from fastapi import APIRouter, Response
+
+from app.core.metrics import render
+
+router = APIRouter(tags=["Metrics"])
+
+
+# unauthenticated like any scrape target; keep it off public listeners.
+# Sync on purpose: multiprocess mode reads every worker's files from disk.
+@router.get("/metrics", include_in_schema=False)
+def prometheus_metrics():
+    body, content_type = render()
+    return Response(body, media_type=content_type)
@@ -1,103 +1,135 @@
-from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy.orm import Session
+import csv
+import io
 
-from app.core.database import SessionLocal
-from app.core.deps import require_user
-from app.models.product import Product
-from app.models.category import Category
-from app.models.supplier import Supplier
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.deps import get_db, require_user
+from app.core.etag import etag_guard
+from app.core.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
+from app.core.responses import fast_json, row_dicts
+from app.schemas.pagination import Page
 from app.schemas.product import ProductCreate, ProductOut
+from app.services import product_service
 
 router = APIRouter(
     prefix="/api/products",
     tags=["Products"]
 )
 
-def get_db():
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
-
-
 @router.post("/", response_model=ProductOut)
-def create_product(
+async def create_product(
     payload: ProductCreate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     user_id: int = Depends(require_user)
 ):
-    # Validate FK
-    if not db.get(Category, payload.category_id):
-        raise HTTPException(400, "Invalid category")
-
-    if not db.get(Supplier, payload.supplier_id):
-        raise HTTPException(400, "Invalid supplier")
-
-    if db.query(Product).filter(Product.sku == payload.sku).first():
-        raise HTTPException(400, "SKU already exists")
-
-    product = Product(**payload.dict())
-    db.add(product)
-    db.commit()
-    db.refresh(product)
-    return product
-
-
-@router.get("/", response_model=list[ProductOut])
-def list_products(
+    return await db.run_sync(product_service.create_product, payload)
+
+
+@router.post(
+    "/bulk",
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {
+                "application/json": {
+                    "schema": {
+                        "type": "array",
+                        "items": {"$ref": "#/components/schemas/ProductCreate"}
+                    }
+                },
+                "multipart/form-data": {
+                    "schema": {
+                        "type": "object",
+                        "properties": {
+                            "file": {"type": "string", "format": "binary"}
+                        }
+                    }
+                }
+            }
+        }
+    }
+)
+async def bulk_create_products(
+    request: Request,
+    atomic: bool = Query(default=False),
+    db: AsyncSession = Depends(get_db),
+    user_id: int = Depends(require_user)
+):
+    """
+    Import a JSON array of products, or a CSV upload (form field `file`)
+    with ProductCreate column headers.
+    """
+    if request.headers.get("content-type", "").startswith("multipart/form-data"):
+        form = await request.form()
+        upload = form.get("file")
+        if upload is None or isinstance(upload, str):
+            raise HTTPException(400, "Expected a CSV file in field 'file'")
+        text = (await upload.read()).decode("utf-8-sig")
+        rows = list(csv.DictReader(io.StringIO(text)))
+    else:
+        try:
+            rows = await request.json()
+        except ValueError:
+            rows = None
+        if not isinstance(rows, list):
+            raise HTTPException(400, "Expected a JSON array of products")
+
+    return await db.run_sync(
+        product_service.bulk_create_products, rows, atomic
+    )
+
+
+@router.get(
+    "/",
+    response_model=Page[ProductOut],
+    dependencies=[Depends(etag_guard("products"))]
+)
+async def list_products(
+    response: Response,
     search: str | None = Query(default=None),
     category_id: int | None = None,
     supplier_id: int | None = None,
-    db: Session = Depends(get_db),
+    limit: int = Query(default=DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: str | None = Query(default=None),
+    db: AsyncSession = Depends(get_db),
     user_id: int = Depends(require_user)
 ):
-    query = db.query(Product)
-
-    if search:
-        query = query.filter(
-            (Product.name.ilike(f"%{search}%")) |
-            (Product.sku.ilike(f"%{search}%"))
-        )
-
-    if category_id:
-        query = query.filter(Product.category_id == category_id)
-
-    if supplier_id:
-        query = query.filter(Product.supplier_id == supplier_id)
-
-    return query.order_by(Product.id.desc()).all()
+    items, next_cursor = await db.run_sync(
+        product_service.list_products,
+        search=search,
+        category_id=category_id,
+        supplier_id=supplier_id,
+        limit=limit,
+        cursor=cursor
+    )
+    # rows already hold exactly ProductOut's fields: skip re-validation
+    return fast_json(
+        {
+            "items": row_dicts(items, ProductOut.model_fields),
+            "next_cursor": next_cursor
+        },
+        response
+    )
 
 
 @router.put("/{product_id}", response_model=ProductOut)
-def update_product(
+async def update_product(
     product_id: int,
     payload: ProductCreate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     user_id: int = Depends(require_user)
 ):
-    product = db.get(Product, product_id)
-    if not product:
-        raise HTTPException(404, "Product not found")
-
-    for key, value in payload.dict().items():
-        setattr(product, key, value)
-
-    db.commit()
-    db.refresh(product)
-    return product
+    return await db.run_sync(
+        product_service.update_product, product_id, payload
+    )
 
 
 @router.delete("/{product_id}")
-def delete_product(
+async def delete_product(
     product_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     user_id: int = Depends(require_user)
 ):
-    product = db.get(Product, product_id)
-    if not product:
-        raise HTTPException(404, "Product not found")
-
-    db.delete(product)
-    db.commit()
+    await db.run_sync(product_service.delete_product, product_id)
     return {"message": "Product deleted"}
@@ -1,71 +1,158 @@
-from fastapi import APIRouter, Depends
-from sqlalchemy.orm import Session
-import pandas as pd
+from datetime import date, datetime
 
-from app.core.database import SessionLocal
-from app.core.deps import require_user
-from app.models.product import Product
-from app.models.category import Category
-from app.models.supplier import Supplier
-from app.models.sale import Sale
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.deps import get_db, require_user
+from app.core.etag import etag_guard
+from app.core.export import stream_export
+from app.core.read_routing import read_primary, sessionmaker_for
+from app.core.responses import fast_json, row_dicts
+from app.schemas.report import InventoryRow, Report, SaleRow
+from app.services import report_service
 
 router = APIRouter(
     prefix="/api/reports",
     tags=["Reports"]
 )
 
-def get_db():
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
+REPORT_FORMATS = "^(json|ndjson|csv|parquet|arrow)$"
+GRANULARITIES = "^(hour|day|week|month)$"
+GROUP_BY = "^(product|category|supplier)$"
+MAX_WINDOWS = 6
+
 
+def _json_format(request: Request) -> bool:
+    # streamed exports are returned as-is, without the guard's ETag
+    return request.query_params.get("format", "json") == "json"
 
-@router.get("/inventory")
-def inventory_report(
-    db: Session = Depends(get_db),
+
+@router.get(
+    "/inventory",
+    response_model=Report[InventoryRow],
+    dependencies=[Depends(etag_guard(
+        "products", "categories", "suppliers", only_if=_json_format
+    ))]
+)
+async def inventory_report(
+    request: Request,
+    response: Response,
+    format: str = Query(default="json", pattern=REPORT_FORMATS),
+    db: AsyncSession = Depends(get_db),
     user_id: int = Depends(require_user)
 ):
-    query = (
-        db.query(
-            Product.id,
-            Product.name,
-            Product.sku,
-            Product.price,
-            Product.quantity,
-            Category.name.label("category"),
-            Supplier.name.label("supplier")
+    statement = report_service.inventory_statement()
+
+    if format != "json":
+        return stream_export(
+            statement, format, "inventory", sessionmaker_for(request)
         )
-        .join(Category, Product.category_id == Category.id)
-        .join(Supplier, Product.supplier_id == Supplier.id)
-    )
 
-    df = pd.DataFrame(query.all())
+    result = await db.execute(statement)
+    data = row_dicts(result, result.keys())
 
-    return {
-        "count": len(df),
-        "data": df.to_dict(orient="records")
-    }
+    return fast_json({"count": len(data), "data": data}, response)
 
 
-@router.get("/sales")
-def sales_report(
-    db: Session = Depends(get_db),
+@router.get(
+    "/sales",
+    response_model=Report[SaleRow],
+    dependencies=[Depends(etag_guard("sales", "products", only_if=_json_format))]
+)
+async def sales_report(
+    request: Request,
+    response: Response,
+    format: str = Query(default="json", pattern=REPORT_FORMATS),
+    db: AsyncSession = Depends(get_db),
     user_id: int = Depends(require_user)
 ):
-    query = (
-        db.query(
-            Sale.id,
-            Sale.product_id,
-            Sale.quantity_sold,
-            Sale.created_at
+    statement = report_service.sales_statement()
+
+    if format != "json":
+        return stream_export(
+            statement, format, "sales", sessionmaker_for(request)
         )
+
+    result = await db.execute(statement)
+    data = row_dicts(result, result.keys())
+
+    return fast_json({"count": len(data), "data": data}, response)
+
+
+@router.get(
+    "/sales/summary",
+    dependencies=[
+        Depends(etag_guard("sales", "products", "categories", "suppliers"))
+    ]
+)
+async def sales_summary(
+    response: Response,
+    granularity: str = Query(default="day", pattern=GRANULARITIES),
+    start: datetime | None = Query(default=None, alias="from"),
+    end: datetime | None = Query(default=None, alias="to"),
+    group_by: str | None = Query(default=None, pattern=GROUP_BY),
+    db: AsyncSession = Depends(get_db),
+    user_id: int = Depends(require_user)
+):
+    data = await db.run_sync(
+        report_service.sales_summary,
+        granularity,
+        start=start,
+        end=end,
+        group_by=group_by
     )
 
-    df = pd.DataFrame(query.all())
+    return fast_json({"count": len(data), "data": data}, response)
+
+
+# read_primary even without ETags: the result is cached across requests
+@router.get(
+    "/valuation",
+    dependencies=[
+        Depends(read_primary),
+        Depends(etag_guard("products", "categories", "suppliers"))
+    ]
+)
+async def valuation_report(
+    db: AsyncSession = Depends(get_db),
+    user_id: int = Depends(require_user)
+):
+    return await db.run_sync(report_service.inventory_valuation)
+
+
+# No ETag guard: the default as_of is today, so the same query string
+# answers differently after midnight with no table version change
+@router.get("/reorder")
+async def reorder_report(
+    windows: list[int] = Query(default=list(report_service.VELOCITY_WINDOWS)),
+    lead_time_days: int = Query(default=14, ge=0, le=365),
+    safety_days: int = Query(default=7, ge=0, le=365),
+    review_days: int = Query(default=30, ge=0, le=365),
+    as_of: date | None = Query(default=None),
+    supplier_id: int | None = Query(default=None),
+    db: AsyncSession = Depends(get_db),
+    user_id: int = Depends(require_user)
+):
+    windows = tuple(sorted(set(windows)))
+    if len(windows) > MAX_WINDOWS or not all(
+        1 <= window <= report_service.MAX_VELOCITY_WINDOW for window in windows
+    ):
+        raise HTTPException(
+            400,
+            f"Expected up to {MAX_WINDOWS} windows of 1 to "
+            f"{report_service.MAX_VELOCITY_WINDOW} days"
+        )
+    if lead_time_days + safety_days == 0:
+        raise HTTPException(400, "lead_time_days + safety_days must be positive")
+
+    report = await db.run_sync(
+        report_service.reorder_report,
+        windows,
+        lead_time_days=lead_time_days,
+        safety_days=safety_days,
+        review_days=review_days,
+        as_of=as_of,
+        supplier_id=supplier_id
+    )
 
-    return {
-        "count": len(df),
-        "data": df.to_dict(orient="records")
-    }
+    return fast_json(report)
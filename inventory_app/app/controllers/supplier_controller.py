@@ -1,10 +1,12 @@
-from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, Query, status
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.database import SessionLocal
-from app.core.deps import require_user
-from app.models.supplier import Supplier
+from app.core.deps import get_db, require_user
+from app.core.etag import etag_guard
+from app.core.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
+from app.schemas.pagination import Page
 from app.schemas.supplier import SupplierCreate, SupplierOut
+from app.services import supplier_service
 
 router = APIRouter(
     prefix="/api/suppliers",
@@ -12,69 +14,50 @@ router = APIRouter(
 )
 
 
-def get_db():
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
-
-
 @router.post("/", response_model=SupplierOut, status_code=status.HTTP_201_CREATED)
-def create_supplier(
+async def create_supplier(
     payload: SupplierCreate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     user_id: int = Depends(require_user)
 ):
-    if db.query(Supplier).filter(Supplier.name.ilike(payload.name)).first():
-        raise HTTPException(status_code=400, detail="Supplier already exists")
-
-    supplier = Supplier(name=payload.name)
-    db.add(supplier)
-    db.commit()
-    db.refresh(supplier)
-    return supplier
+    return await db.run_sync(supplier_service.create_supplier, payload)
 
 
-@router.get("/", response_model=list[SupplierOut])
-def list_suppliers(
+@router.get(
+    "/",
+    response_model=Page[SupplierOut],
+    dependencies=[Depends(etag_guard("suppliers"))]
+)
+async def list_suppliers(
     search: str | None = Query(default=None),
-    db: Session = Depends(get_db),
+    limit: int = Query(default=DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: str | None = Query(default=None),
+    db: AsyncSession = Depends(get_db),
     user_id: int = Depends(require_user)
 ):
-    query = db.query(Supplier)
-    if search:
-        query = query.filter(Supplier.name.ilike(f"%{search}%"))
-    return query.all()
+    items, next_cursor = await db.run_sync(
+        supplier_service.list_suppliers, search, limit, cursor
+    )
+    return {"items": items, "next_cursor": next_cursor}
 
 
 @router.put("/{supplier_id}", response_model=SupplierOut)
-def update_supplier(
+async def update_supplier(
     supplier_id: int,
     payload: SupplierCreate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     user_id: int = Depends(require_user)
 ):
-    supplier = db.get(Supplier, supplier_id)
-    if not supplier:
-        raise HTTPException(status_code=404, detail="Supplier not found")
-
-    supplier.name = payload.name
-    db.commit()
-    db.refresh(supplier)
-    return supplier
+    return await db.run_sync(
+        supplier_service.update_supplier, supplier_id, payload
+    )
 
 
 @router.delete("/{supplier_id}")
-def delete_supplier(
+async def delete_supplier(
     supplier_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     user_id: int = Depends(require_user)
 ):
-    supplier = db.get(Supplier, supplier_id)
-    if not supplier:
-        raise HTTPException(status_code=404, detail="Supplier not found")
-
-    db.delete(supplier)
-    db.commit()
+    await db.run_sync(supplier_service.delete_supplier, supplier_id)
     return {"message": "Supplier deleted"}
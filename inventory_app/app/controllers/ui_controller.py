@@ -1,17 +1,36 @@
-from fastapi import APIRouter, Request, Form
+from fastapi import APIRouter, Depends, HTTPException, Request, Form
 from fastapi.responses import RedirectResponse
 from fastapi.templating import Jinja2Templates
-import requests
+from pydantic import ValidationError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.deps import get_db
+from app.core.read_routing import read_primary
 from app.core.ui_auth import require_ui_user
+from app.schemas.category import CategoryCreate
+from app.schemas.product import ProductCreate
+from app.schemas.sale import SaleCreate
+from app.schemas.supplier import SupplierCreate
+from app.services import (
+    auth_service,
+    category_service,
+    product_service,
+    sale_service,
+    supplier_service,
+)
 
 router = APIRouter(prefix="/ui")
 templates = Jinja2Templates(directory="app/templates")
 
-API_BASE = "http://127.0.0.1:8000"
+# products offered in the Add Sale picker for one search
+SALE_PRODUCT_MATCHES = 20
+
+# UI pages call the service layer in-process with the same session the API
+# routers use, instead of looping back over HTTP to our own API.
 
 
 @router.get("/login")
-def login_page(request: Request):
+async def login_page(request: Request):
     return templates.TemplateResponse(
         "auth/login.html",
         {"request": request}
@@ -19,31 +38,21 @@ def login_page(request: Request):
 
 
 @router.post("/login")
-def login_action(
+async def login_action(
     request: Request,
     username: str = Form(...),
-    password: str = Form(...)
+    password: str = Form(...),
+    db: AsyncSession = Depends(get_db)
 ):
-    resp = requests.post(
-        f"{API_BASE}/auth/login",
-        data={
-            "username": username,
-            "password": password
-        },
-        headers={
-            "Content-Type": "application/x-www-form-urlencoded"
-        },
-        timeout=5
-    )
-
-    if resp.status_code != 200:
+    try:
+        token = await auth_service.authenticate_user(db, username, password)
+    except HTTPException as exc:
+        error = exc.detail if exc.status_code == 503 else "Invalid credentials"
         return templates.TemplateResponse(
             "auth/login.html",
-            {"request": request, "error": "Invalid credentials"}
+            {"request": request, "error": error}
         )
 
-    token = resp.json()["access_token"]
-
     response = RedirectResponse("/ui/categories", status_code=302)
     response.set_cookie(
         "access_token",
@@ -55,7 +64,7 @@ def login_action(
 
 
 @router.get("/register")
-def register_page(request: Request):
+async def register_page(request: Request):
     return templates.TemplateResponse(
         "auth/register.html",
         {"request": request}
@@ -63,28 +72,18 @@ def register_page(request: Request):
 
 
 @router.post("/register")
-@router.post("/register")
-def register_action(
+async def register_action(
     request: Request,
     username: str = Form(...),
-    password: str = Form(...)
+    password: str = Form(...),
+    db: AsyncSession = Depends(get_db)
 ):
-    resp = requests.post(
-        f"{API_BASE}/auth/register",
-        data={
-            "username": username,
-            "password": password
-        },
-        headers={
-            "Content-Type": "application/x-www-form-urlencoded"
-        },
-        timeout=5
-    )
-
-    if resp.status_code != 200:
+    try:
+        await auth_service.register_user(db, username, password)
+    except HTTPException as exc:
         return templates.TemplateResponse(
             "auth/register.html",
-            {"request": request, "error": "User already exists"}
+            {"request": request, "error": exc.detail}
         )
 
     return RedirectResponse("/ui/login", status_code=302)
@@ -93,115 +92,89 @@ def register_action(
 
 
 @router.get("/categories")
-def category_list(
+async def category_list(
     request: Request,
-    search: str | None = None
+    search: str | None = None,
+    cursor: str | None = None,
+    db: AsyncSession = Depends(get_db)
 ):
     auth = require_ui_user(request)
     if auth:
         return auth
 
-    token = request.cookies["access_token"]
-
-    params = {}
-    if search:
-        params["search"] = search
-
-    resp = requests.get(
-        f"{API_BASE}/api/categories",
-        params=params,
-        headers={
-            "Authorization": f"Bearer {token}"
-        },
-        timeout=5
+    categories, next_cursor = await db.run_sync(
+        category_service.list_categories, search, cursor=cursor
     )
 
-    categories = resp.json() if resp.status_code == 200 else []
-
     return templates.TemplateResponse(
         "category/list.html",
         {
             "request": request,
             "categories": categories,
-            "search": search
+            "search": search,
+            "next_cursor": next_cursor
         }
     )
 
 
 
 @router.post("/categories/add")
-def add_category(
+async def add_category(
     request: Request,
-    name: str = Form(...)
+    name: str = Form(...),
+    db: AsyncSession = Depends(get_db)
 ):
     # 🔐 protect page
     auth = require_ui_user(request)
     if auth:
         return auth
 
-    # ❗ STRICT cookie read (do not use .get)
-    token = request.cookies["access_token"]
-
-    resp = requests.post(
-        f"{API_BASE}/api/categories",
-        json={"name": name},
-        headers={
-            "Authorization": f"Bearer {token}",
-            "Content-Type": "application/json"
-        },
-        timeout=5
-    )
-
-    # 🔴 TEMP DEBUG (REMOVE LATER)
-    if resp.status_code != 201:
+    try:
+        await db.run_sync(
+            category_service.create_category, CategoryCreate(name=name)
+        )
+    except (HTTPException, ValidationError) as exc:
         print("ADD CATEGORY FAILED")
-        print("STATUS:", resp.status_code)
-        print("RESPONSE:", resp.text)
+        print(exc)
 
     return RedirectResponse("/ui/categories", status_code=302)
 
 @router.post("/categories/delete/{category_id}")
-def delete_category(
+async def delete_category(
     request: Request,
-    category_id: int
+    category_id: int,
+    db: AsyncSession = Depends(get_db)
 ):
     auth = require_ui_user(request)
     if auth:
         return auth
 
-    token = request.cookies["access_token"]
-
-    requests.delete(
-        f"{API_BASE}/api/categories/{category_id}",
-        headers={
-            "Authorization": f"Bearer {token}"
-        },
-        timeout=5
-    )
+    try:
+        await db.run_sync(category_service.delete_category, category_id)
+    except HTTPException:
+        pass
 
     return RedirectResponse("/ui/categories", status_code=302)
 
 @router.post("/categories/update/{category_id}")
-def update_category(
+async def update_category(
     request: Request,
     category_id: int,
-    name: str = Form(...)
+    name: str = Form(...),
+    db: AsyncSession = Depends(get_db)
 ):
     auth = require_ui_user(request)
     if auth:
         return auth
 
-    token = request.cookies["access_token"]
-
-    requests.put(
-        f"{API_BASE}/api/categories/{category_id}",
-        json={"name": name},
-        headers={
-            "Authorization": f"Bearer {token}",
-            "Content-Type": "application/json"
-        },
-        timeout=5
-    )
+    try:
+        await db.run_sync(
+            category_service.update_category,
+            category_id,
+            CategoryCreate(name=name)
+        )
+    except (HTTPException, ValidationError):
+        pass
 
     return RedirectResponse("/ui/categories", status_code=302)
 
@@ -210,145 +183,115 @@ def update_category(
 # SUPPLIERS UI
 # -------------------------
 @router.get("/suppliers")
-def supplier_list(request: Request, search: str | None = None):
+async def supplier_list(
+    request: Request,
+    search: str | None = None,
+    cursor: str | None = None,
+    db: AsyncSession = Depends(get_db)
+):
     auth = require_ui_user(request)
     if auth:
         return auth
 
-    token = request.cookies["access_token"]
-
-    params = {"search": search} if search else {}
-
-    resp = requests.get(
-        f"{API_BASE}/api/suppliers",
-        params=params,
-        headers={"Authorization": f"Bearer {token}"}
+    suppliers, next_cursor = await db.run_sync(
+        supplier_service.list_suppliers, search, cursor=cursor
     )
 
-    suppliers = resp.json() if resp.status_code == 200 else []
-
     return templates.TemplateResponse(
         "supplier/list.html",
         {
             "request": request,
             "suppliers": suppliers,
-            "search": search
+            "search": search,
+            "next_cursor": next_cursor
         }
     )
 
 
 @router.post("/suppliers/add")
-def add_supplier(request: Request, name: str = Form(...)):
+async def add_supplier(
+    request: Request,
+    name: str = Form(...),
+    db: AsyncSession = Depends(get_db)
+):
     auth = require_ui_user(request)
     if auth:
         return auth
 
-    token = request.cookies["access_token"]
-
-    requests.post(
-        f"{API_BASE}/api/suppliers",
-        json={"name": name},
-        headers={"Authorization": f"Bearer {token}"}
-    )
+    try:
+        await db.run_sync(
+            supplier_service.create_supplier, SupplierCreate(name=name)
+        )
+    except (HTTPException, ValidationError):
+        pass
 
     return RedirectResponse("/ui/suppliers", status_code=302)
 
 
 @router.post("/suppliers/update/{supplier_id}")
-def update_supplier(
+async def update_supplier(
     request: Request,
     supplier_id: int,
-    name: str = Form(...)
+    name: str = Form(...),
+    db: AsyncSession = Depends(get_db)
 ):
     auth = require_ui_user(request)
     if auth:
         return auth
 
-    token = request.cookies["access_token"]
-
-    requests.put(
-        f"{API_BASE}/api/suppliers/{supplier_id}",
-        json={"name": name},
-        headers={"Authorization": f"Bearer {token}"}
-    )
+    try:
+        await db.run_sync(
+            supplier_service.update_supplier,
+            supplier_id,
+            SupplierCreate(name=name)
+        )
+    except (HTTPException, ValidationError):
+        pass
 
     return RedirectResponse("/ui/suppliers", status_code=302)
 
 
 @router.post("/suppliers/delete/{supplier_id}")
-def delete_supplier(request: Request, supplier_id: int):
+async def delete_supplier(
+    request: Request,
+    supplier_id: int,
+    db: AsyncSession = Depends(get_db)
+):
     auth = require_ui_user(request)
     if auth:
         return auth
 
-    token = request.cookies["access_token"]
-
-    requests.delete(
-        f"{API_BASE}/api/suppliers/{supplier_id}",
-        headers={"Authorization": f"Bearer {token}"}
-    )
+    try:
+        await db.run_sync(supplier_service.delete_supplier, supplier_id)
+    except HTTPException:
+        pass
 
     return RedirectResponse("/ui/suppliers", status_code=302)
 
 
-@router.get("/products")
-def product_list(
+# primary: the category and supplier pickers fill the reference cache
+@router.get("/products", dependencies=[Depends(read_primary)])
+async def product_list(
     request: Request,
     search: str | None = None,
     category_id: int | None = None,
     supplier_id: int | None = None,
+    cursor: str | None = None,
+    db: AsyncSession = Depends(get_db)
 ):
     auth = require_ui_user(request)
     if auth:
         return auth
 
-    token = request.cookies.get("access_token")
-
-    params = {}
-    if search:
-        params["search"] = search
-    if category_id:
-        params["category_id"] = category_id
-    if supplier_id:
-        params["supplier_id"] = supplier_id
-
-    products = []
-    categories = []
-    suppliers = []
-
-    try:
-        p_resp = requests.get(
-            f"{API_BASE}/api/products",
-            headers={"Authorization": f"Bearer {token}"},
-            params=params,
-            timeout=5
-        )
-        if p_resp.status_code == 200:
-            products = p_resp.json()
-    except Exception:
-        pass
-
-    try:
-        c_resp = requests.get(
-            f"{API_BASE}/api/categories",
-            headers={"Authorization": f"Bearer {token}"},
-            timeout=5
-        )
-        if c_resp.status_code == 200:
-            categories = c_resp.json()
-    except Exception:
-        pass
-
-    try:
-        s_resp = requests.get(
-            f"{API_BASE}/api/suppliers",
-            headers={"Authorization": f"Bearer {token}"},
-            timeout=5
-        )
-        if s_resp.status_code == 200:
-            suppliers = s_resp.json()
-    except Exception:
-        pass
+    products, next_cursor = await db.run_sync(
+        product_service.list_products,
+        search=search,
+        category_id=category_id,
+        supplier_id=supplier_id,
+        cursor=cursor
+    )
+    categories = await db.run_sync(category_service.all_categories)
+    suppliers = await db.run_sync(supplier_service.all_suppliers)
 
     # ✅ ALWAYS RETURN TEMPLATE
     return templates.TemplateResponse(
@@ -361,53 +304,43 @@ def product_list(
             "search": search,
             "category_id": category_id,
             "supplier_id": supplier_id,
+            "next_cursor": next_cursor,
         }
     )
 
 @router.post("/products/add")
-def add_product(
+async def add_product(
     request: Request,
     name: str = Form(...),
     sku: str = Form(...),
     price: int = Form(...),
     quantity: int = Form(...),
     category_id: int = Form(...),
-    supplier_id: int = Form(...)
+    supplier_id: int = Form(...),
+    db: AsyncSession = Depends(get_db)
 ):
     auth = require_ui_user(request)
     if auth:
         return auth
 
-    token = request.cookies.get("access_token")
-    if not token:
-        return RedirectResponse("/ui/login", status_code=302)
-
-    payload = {
-        "name": name,
-        "sku": sku,
-        "price": price,
-        "quantity": quantity,
-        "category_id": category_id,
-        "supplier_id": supplier_id
-    }
-
-    resp = requests.post(
-        f"{API_BASE}/api/products",
-        json=payload,
-        headers={
-            "Authorization": f"Bearer {token}",
-            "Content-Type": "application/json"
-        }
-    )
-
-    if resp.status_code not in (200, 201):
+    try:
+        payload = ProductCreate(
+            name=name,
+            sku=sku,
+            price=price,
+            quantity=quantity,
+            category_id=category_id,
+            supplier_id=supplier_id
+        )
+        await db.run_sync(product_service.create_product, payload)
+    except (HTTPException, ValidationError) as exc:
         print("PRODUCT ADD FAILED")
-        print(resp.status_code, resp.text)
+        print(exc)
 
     return RedirectResponse("/ui/products", status_code=302)
 
 @router.post("/products/update/{product_id}")
-def update_product(
+async def update_product(
     request: Request,
     product_id: int,
     name: str = Form(...),
@@ -415,51 +348,44 @@ def update_product(
     price: int = Form(...),
     quantity: int = Form(...),
     category_id: int = Form(...),
-    supplier_id: int = Form(...)
+    supplier_id: int = Form(...),
+    db: AsyncSession = Depends(get_db)
 ):
     auth = require_ui_user(request)
     if auth:
         return auth
 
-    token = request.cookies["access_token"]
-
-    payload = {
-        "name": name,
-        "sku": sku,
-        "price": price,
-        "quantity": quantity,
-        "category_id": category_id,
-        "supplier_id": supplier_id
-    }
-
-    resp = requests.put(
-        f"{API_BASE}/api/products/{product_id}",
-        json=payload,
-        headers={
-            "Authorization": f"Bearer {token}",
-            "Content-Type": "application/json"
-        }
-    )
-
-    if resp.status_code != 200:
+    try:
+        payload = ProductCreate(
+            name=name,
+            sku=sku,
+            price=price,
+            quantity=quantity,
+            category_id=category_id,
+            supplier_id=supplier_id
+        )
+        await db.run_sync(product_service.update_product, product_id, payload)
+    except (HTTPException, ValidationError) as exc:
         print("PRODUCT UPDATE FAILED")
-        print(resp.text)
+        print(exc)
 
     return RedirectResponse("/ui/products", status_code=302)
 
 
 @router.post("/products/delete/{product_id}")
-def delete_product(request: Request, product_id: int):
+async def delete_product(
+    request: Request,
+    product_id: int,
+    db: AsyncSession = Depends(get_db)
+):
     auth = require_ui_user(request)
     if auth:
         return auth
 
-    token = request.cookies["access_token"]
-
-    requests.delete(
-        f"{API_BASE}/api/products/{product_id}",
-        headers={"Authorization": f"Bearer {token}"}
-    )
+    try:
+        await db.run_sync(product_service.delete_product, product_id)
+    except HTTPException:
+        pass
 
     return RedirectResponse("/ui/products", status_code=302)
 
@@ -468,48 +394,41 @@ def delete_product(request: Request, product_id: int):
 # SALES LIST PAGE
 # =========================
 @router.get("/sales")
-def sales_list(request: Request):
+async def sales_list(
+    request: Request,
+    cursor: str | None = None,
+    product_search: str | None = None,
+    db: AsyncSession = Depends(get_db)
+):
     auth = require_ui_user(request)
     if auth:
         return auth
 
-    token = request.cookies.get("access_token")
-
-    # ---- Fetch products ----
-    products_resp = requests.get(
-        f"{API_BASE}/api/products",
-        headers={"Authorization": f"Bearer {token}"},
-        timeout=5
-    )
-    products = products_resp.json() if products_resp.status_code == 200 else []
+    # the Add Sale picker lists search matches, not the whole catalogue;
+    # without a search the product is entered by id
+    products, more_products = [], False
+    if product_search:
+        products, next_match = await db.run_sync(
+            product_service.list_products,
+            search=product_search,
+            limit=SALE_PRODUCT_MATCHES
+        )
+        more_products = next_match is not None
 
-    # ---- Fetch sales ----
-    sales_resp = requests.get(
-        f"{API_BASE}/api/sales",
-        headers={"Authorization": f"Bearer {token}"},
-        timeout=5
+    # list_sales already joins Product, so rows carry name and price
+    sales, next_cursor = await db.run_sync(
+        sale_service.list_sales, cursor=cursor
     )
-    sales = sales_resp.json() if sales_resp.status_code == 200 else []
-
-    # ---- Build product map ----
-    product_map = {p["id"]: p for p in products}
-
-    # ---- Enrich sales (SAFE) ----
-    enriched_sales = []
-    for s in sales:
-        product = product_map.get(s["product_id"])
-
-        s["product_name"] = product["name"] if product else "—"
-        s["product_price"] = product["price"] if product else 0
-
-        enriched_sales.append(s)
 
     return templates.TemplateResponse(
         "sale/list.html",
         {
             "request": request,
-            "sales": enriched_sales,
-            "products": products
+            "sales": sales,
+            "products": products,
+            "product_search": product_search,
+            "more_products": more_products,
+            "next_cursor": next_cursor
         }
     )
 
@@ -518,26 +437,23 @@ def sales_list(request: Request):
 # ADD SALE
 # =========================
 @router.post("/sales/add")
-def sales_add(
+async def sales_add(
     request: Request,
     product_id: int = Form(...),
-    quantity_sold: int = Form(...)
+    quantity_sold: int = Form(...),
+    db: AsyncSession = Depends(get_db)
 ):
     auth = require_ui_user(request)
     if auth:
         return auth
 
-    token = request.cookies.get("access_token")
-
-    requests.post(
-        f"{API_BASE}/api/sales",
-        headers={"Authorization": f"Bearer {token}"},
-        json={
-            "product_id": product_id,
-            "quantity_sold": quantity_sold
-        },
-        timeout=5
-    )
+    try:
+        await db.run_sync(
+            sale_service.create_sale,
+            SaleCreate(product_id=product_id, quantity_sold=quantity_sold)
+        )
+    except (HTTPException, ValidationError):
+        pass
 
     return RedirectResponse("/ui/sales", status_code=302)
 
@@ -546,29 +462,24 @@ def sales_add(
 # UPDATE SALE
 # =========================
 @router.post("/sales/update/{sale_id}")
-def sales_update(
+async def sales_update(
     request: Request,
     sale_id: int,
     product_id: int = Form(...),
-    quantity_sold: int = Form(...)
+    quantity_sold: int = Form(...),
+    db: AsyncSession = Depends(get_db)
 ):
     auth = require_ui_user(request)
     if auth:
         return auth
 
-    token = request.cookies.get("access_token")
-
-    resp = requests.put(
-        f"{API_BASE}/api/sales/{sale_id}",
-        headers={"Authorization": f"Bearer {token}"},
-        json={
-            "product_id": product_id,
-            "quantity_sold": quantity_sold
-        },
-        timeout=5
-    )
-
-    if resp.status_code != 200:
+    try:
+        await db.run_sync(
+            sale_service.update_sale,
+            sale_id,
+            SaleCreate(product_id=product_id, quantity_sold=quantity_sold)
+        )
+    except (HTTPException, ValidationError):
         return RedirectResponse("/ui/sales?error=update_failed", status_code=302)
 
     return RedirectResponse("/ui/sales", status_code=302)
@@ -578,24 +489,18 @@ def sales_update(
 # DELETE SALE
 # =========================
 @router.post("/sales/delete/{sale_id}")
-def sales_delete(request: Request, sale_id: int):
+async def sales_delete(
+    request: Request,
+    sale_id: int,
+    db: AsyncSession = Depends(get_db)
+):
     auth = require_ui_user(request)
     if auth:
         return auth
 
-    token = request.cookies.get("access_token")
-
-    requests.delete(
-        f"{API_BASE}/api/sales/{sale_id}",
-        headers={"Authorization": f"Bearer {token}"},
-        timeout=5
-    )
+    try:
+        await db.run_sync(sale_service.delete_sale, sale_id)
+    except HTTPException:
+        pass
 
     return RedirectResponse("/ui/sales", status_code=302)
-
-
-
-
-
-
-  
\ No newline at end of file
@@ -0,0 +1,165 @@
+"""
+In-process read-through cache for small reference tables (categories,
+suppliers) and small derived results (the inventory valuation) with write
+invalidation.
+
+Writes call `invalidate(namespace)`, which clears the local entries and
+publishes the namespace on the invalidation backend so other workers clear
+theirs too. The backend is picked by CACHE_INVALIDATION_URL: unset for a
+single process, or redis://host:port/db for anything that speaks the Redis
+protocol (PUBLISH/SUBSCRIBE).
+"""
+import logging
+import os
+import threading
+import time
+
+from cachetools import TTLCache
+
+from app.core.deferred import defer_io
+from app.core.metrics import CACHE_LOOKUPS
+from app.core.resp import RespConnection
+
+logger = logging.getLogger(__name__)
+
+REF_CACHE_MAXSIZE = int(os.getenv("REF_CACHE_MAXSIZE", "1024"))
+REF_CACHE_TTL = float(os.getenv("REF_CACHE_TTL", "300"))
+CACHE_INVALIDATION_URL = os.getenv("CACHE_INVALIDATION_URL")
+
+INVALIDATION_CHANNEL = "inventory:cache-invalidate"
+ALL_NAMESPACES = "*"
+
+
+# -------------------------
+# INVALIDATION BACKENDS
+# -------------------------
+class MemoryInvalidation:
+    """Single-process backend: nothing to tell other workers."""
+
+    def start(self, callback) -> None:
+        pass
+
+    def publish(self, namespace: str) -> None:
+        pass
+
+
+class RedisInvalidation:
+    """Cross-worker invalidation over Redis pub/sub."""
+
+    def __init__(self, url: str, channel: str = INVALIDATION_CHANNEL):
+        self.url = url
+        self.channel = channel
+        self._publisher = RespConnection(url)
+        self._lock = threading.Lock()
+
+    def publish(self, namespace: str) -> None:
+        defer_io(self._publish, namespace)
+
+    def _publish(self, namespace: str) -> None:
+        with self._lock:
+            for attempt in range(2):
+                try:
+                    self._publisher.command("PUBLISH", self.channel, namespace)
+                    return
+                except OSError:
+                    self._publisher.close()
+                    if attempt:
+                        logger.warning("cache invalidation publish failed")
+
+    def start(self, callback) -> None:
+        threading.Thread(
+            target=self._listen, args=(callback,), daemon=True
+        ).start()
+
+    def _listen(self, callback) -> None:
+        while True:
+            subscriber = RespConnection(self.url, timeout=None)
+            try:
+                subscriber.command("SUBSCRIBE", self.channel)
+                # anything published while we were disconnected is lost
+                callback(ALL_NAMESPACES)
+                while True:
+                    message = subscriber.read()
+                    if isinstance(message, list) and message[0] == "message":
+                        callback(message[2])
+            except OSError:
+                subscriber.close()
+                logger.warning("cache invalidation listener reconnecting")
+                time.sleep(1)
+
+
+# -------------------------
+# CACHE
+# -------------------------
+class ReferenceCache:
+
+    def __init__(self, maxsize: int, ttl: float, backend):
+        self._entries = TTLCache(maxsize=maxsize, ttl=ttl)
+        self._lock = threading.Lock()
+        # bumped on every clear so a load that raced an invalidation
+        # does not store what it read before the write
+        self._generations = {}
+        self._backend = backend
+        self.hits = 0
+        self.misses = 0
+        backend.start(self._clear)
+
+    def get_or_load(self, namespace: str, key, loader):
+        """
+        Return the cached value for (namespace, key), calling `loader()`
+        on a miss. Loaders must return plain data, not ORM instances.
+        """
+        with self._lock:
+            try:
+                value = self._entries[(namespace, key)]
+                self.hits += 1
+                CACHE_LOOKUPS.labels("reference", "hit").inc()
+                return value
+            except KeyError:
+                self.misses += 1
+                CACHE_LOOKUPS.labels("reference", "miss").inc()
+                generation = self._generation(namespace)
+
+        value = loader()
+        with self._lock:
+            if self._generation(namespace) == generation:
+                self._entries[(namespace, key)] = value
+        return value
+
+    def _generation(self, namespace: str) -> tuple[int, int]:
+        return (
+            self._generations.get(ALL_NAMESPACES, 0),
+            self._generations.get(namespace, 0),
+        )
+
+    def _clear(self, namespace: str) -> None:
+        with self._lock:
+            self._generations[namespace] = self._generations.get(namespace, 0) + 1
+            for entry in list(self._entries.keys()):
+                if namespace == ALL_NAMESPACES or entry[0] == namespace:
+                    self._entries.pop(entry, None)
+
+    def invalidate(self, namespace: str) -> None:
+        self._clear(namespace)
+        self._backend.publish(namespace)
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "size": len(self._entries),
+                "maxsize": self._entries.maxsize,
+                "ttl": self._entries.ttl,
+            }
+
+
+def _backend():
+    if CACHE_INVALIDATION_URL:
+        return RedisInvalidation(CACHE_INVALIDATION_URL)
+    return MemoryInvalidation()
+
+
+reference_cache = ReferenceCache(REF_CACHE_MAXSIZE, REF_CACHE_TTL, _backend())
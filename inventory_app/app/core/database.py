@@ -1,28 +1,129 @@
 import os
 from dotenv import load_dotenv
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import URL, make_url
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker, declarative_base
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 
 # Load .env variables
 load_dotenv()
 
 DATABASE_URL = os.getenv("DATABASE_URL")
+# optional read-only replica for GET and report traffic
+DATABASE_READ_URL = os.getenv("DATABASE_READ_URL")
 
 if not DATABASE_URL:
     raise RuntimeError("DATABASE_URL is not set in .env")
 
-# Create SQLAlchemy engine
-engine = create_engine(
-    DATABASE_URL,
-    pool_pre_ping=True
+# Pool settings, applied to both engines
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "5"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+DB_POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", "30"))
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "1800"))  # seconds, -1 off
+DB_POOL_PRE_PING = os.getenv("DB_POOL_PRE_PING", "true").lower() == "true"
+
+# SQLite lock wait before "database is locked", in milliseconds
+SQLITE_BUSY_TIMEOUT = int(os.getenv("SQLITE_BUSY_TIMEOUT", "30000"))
+
+# the request path runs on these drivers; tools and migrations stay sync
+ASYNC_DRIVERS = {
+    "postgresql": "asyncpg",
+    "sqlite": "aiosqlite",
+}
+
+
+def _async_url(url: str) -> URL:
+    parsed = make_url(url)
+    backend = parsed.get_backend_name()
+    if backend in ASYNC_DRIVERS:
+        parsed = parsed.set(drivername=f"{backend}+{ASYNC_DRIVERS[backend]}")
+    return parsed
+
+
+def _pool_options(url: str) -> dict:
+    options = {
+        "pool_pre_ping": DB_POOL_PRE_PING,
+        "pool_recycle": DB_POOL_RECYCLE,
+    }
+    parsed = make_url(url)
+    # in-memory SQLite uses a single-connection pool without these knobs
+    if not (
+        parsed.get_backend_name() == "sqlite"
+        and parsed.database in (None, "", ":memory:")
+    ):
+        options.update(
+            pool_size=DB_POOL_SIZE,
+            max_overflow=DB_MAX_OVERFLOW,
+            pool_timeout=DB_POOL_TIMEOUT,
+        )
+    return options
+
+
+def _sqlite_pragmas(dbapi_connection, connection_record) -> None:
+    # WAL lets readers run alongside the single writer instead of blocking
+    # its commit; it is a property of the file, so setting it once sticks
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode = WAL")
+    cursor.execute(f"PRAGMA busy_timeout = {SQLITE_BUSY_TIMEOUT}")
+    cursor.close()
+
+
+def _configure(sync_engine):
+    url = sync_engine.url
+    if url.get_backend_name() == "sqlite" and url.database not in (
+        None, "", ":memory:"
+    ):
+        event.listen(sync_engine, "connect", _sqlite_pragmas)
+    return sync_engine
+
+
+def _create_async_engine(url: str):
+    options = _pool_options(url)
+    if make_url(url).get_backend_name() == "sqlite" and "pool_size" in options:
+        # aiosqlite file databases default to NullPool; pool them like the
+        # sync engine so the settings above apply
+        options["poolclass"] = AsyncAdaptedQueuePool
+    async_engine = create_async_engine(_async_url(url), **options)
+    _configure(async_engine.sync_engine)
+    return async_engine
+
+
+# Sync engine for migrations and the command-line tools
+engine = _configure(create_engine(DATABASE_URL, **_pool_options(DATABASE_URL)))
+
+# Async engines for request handling; without a replica both are the primary
+async_engine = _create_async_engine(DATABASE_URL)
+async_read_engine = (
+    _create_async_engine(DATABASE_READ_URL) if DATABASE_READ_URL
+    else async_engine
 )
 
-# Session factory
+# every distinct request engine by role, for instrumentation
+ENGINES = {"primary": async_engine.sync_engine}
+if async_read_engine is not async_engine:
+    ENGINES["replica"] = async_read_engine.sync_engine
+
+# Session factories
 SessionLocal = sessionmaker(
     autocommit=False,
     autoflush=False,
     bind=engine
 )
 
+# expire_on_commit off: an expired attribute cannot lazy-load outside
+# run_sync, and services already refresh what they return
+AsyncSessionLocal = async_sessionmaker(
+    async_engine,
+    autoflush=False,
+    expire_on_commit=False
+)
+
+AsyncReadSessionLocal = async_sessionmaker(
+    async_read_engine,
+    autoflush=False,
+    expire_on_commit=False
+)
+
 # Base class for models (later)
 Base = declarative_base()
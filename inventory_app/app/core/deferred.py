@@ -0,0 +1,49 @@
+"""
+Blocking Redis round trips (version bumps, invalidation publishes) kept off
+the event loop.
+
+Service functions run on the loop thread via `db.run_sync`, so a Redis call
+made there would stall every request while Redis is slow or down. Inside
+`deferred_io()` (opened by get_db for each request) those calls are queued
+instead and run in a worker thread once the handler is done, before the
+response is sent, so the writer still sees its own write. Outside a request
+(tools, tests) they run immediately.
+"""
+import logging
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+
+import anyio
+
+logger = logging.getLogger(__name__)
+
+_pending: ContextVar[list | None] = ContextVar("deferred_io", default=None)
+
+
+def defer_io(fn, *args) -> None:
+    """Call `fn(*args)` now, or after the request inside `deferred_io()`."""
+    pending = _pending.get()
+    if pending is None:
+        fn(*args)
+    else:
+        pending.append((fn, args))
+
+
+def _run(pending: list) -> None:
+    for fn, args in pending:
+        try:
+            fn(*args)
+        except Exception:
+            logger.exception("deferred %s failed", getattr(fn, "__qualname__", fn))
+
+
+@asynccontextmanager
+async def deferred_io():
+    pending = []
+    token = _pending.set(pending)
+    try:
+        yield
+    finally:
+        _pending.reset(token)
+        if pending:
+            await anyio.to_thread.run_sync(_run, pending)
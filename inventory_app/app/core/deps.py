@@ -1,14 +1,27 @@
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from jose import JWTError
 
-from app.core.security import decode_access_token
+from app.core.deferred import deferred_io
+from app.core.read_routing import session_for
+from app.core.security import verify_access_token
 
 # This tells FastAPI / Swagger that we use Bearer tokens
 security = HTTPBearer()
 
 
-def require_user(
+async def get_db(request: Request):
+    """
+    The request's AsyncSession, on the primary or the replica (see
+    read_routing). Sync service functions run on it via `db.run_sync`;
+    the Redis calls they make are deferred until it closes (see deferred).
+    """
+    async with deferred_io(), session_for(request) as db:
+        yield db
+
+
+# async: token checks are CPU-only, so no threadpool hop per request
+async def require_user(
     credentials: HTTPAuthorizationCredentials = Depends(security)
 ) -> int:
     """
@@ -17,7 +30,7 @@ def require_user(
     """
     try:
         token = credentials.credentials
-        user_id = decode_access_token(token)
+        user_id = verify_access_token(token)
         return user_id
     except JWTError:
         raise HTTPException(
@@ -0,0 +1,67 @@
+"""
+Conditional GET support: a strong ETag derived from the versions of the
+tables a response reads plus the request's path and query string.
+
+A matching If-None-Match short-circuits with 304 before the handler runs,
+so no rows are queried or serialised. Tagged responses are read from the
+primary, whose commits the versions track.
+"""
+import hashlib
+
+from fastapi import Depends, HTTPException, Request, Response, status
+
+from app.core.deps import require_user
+from app.core.read_routing import read_primary
+from app.core.versions import table_versions
+
+
+def compute_etag(request: Request, tables) -> str | None:
+    versions = table_versions.get(tables)
+    if versions is None:
+        return None
+    query = "&".join(sorted(
+        f"{key}={value}" for key, value in request.query_params.multi_items()
+    ))
+    digest = hashlib.sha256(
+        f"{versions}|{request.url.path}|{query}".encode()
+    ).hexdigest()
+    return f'"{digest[:32]}"'
+
+
+def _matches(header: str, etag: str) -> bool:
+    candidates = [part.strip() for part in header.split(",")]
+    # weak comparison is what If-None-Match specifies
+    return "*" in candidates or any(
+        candidate.removeprefix("W/") == etag for candidate in candidates
+    )
+
+
+def etag_guard(*tables: str, only_if=None):
+    """
+    Dependency for GET endpoints whose body depends only on `tables` and
+    the query string. Authenticates first, so a 304 is never served to an
+    anonymous caller.
+
+    `only_if(request)` returning False skips the guard for responses that
+    will not carry the tag (streamed exports), leaving their reads to the
+    normal replica routing.
+    """
+    def guard(
+        request: Request,
+        response: Response,
+        user_id: int = Depends(require_user)
+    ) -> None:
+        if only_if is not None and not only_if(request):
+            return
+        etag = compute_etag(request, tables)
+        if etag is None:
+            return
+        read_primary(request)
+        if _matches(request.headers.get("if-none-match", ""), etag):
+            raise HTTPException(
+                status_code=status.HTTP_304_NOT_MODIFIED,
+                headers={"ETag": etag}
+            )
+        response.headers["ETag"] = etag
+
+    return guard
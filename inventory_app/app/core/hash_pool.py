@@ -0,0 +1,67 @@
+import asyncio
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor, wait
+
+# Forking the server copies whatever locks its threads (anyio workers, the
+# invalidation listener, trace export) hold at that moment into the child,
+# which can then deadlock; workers start from a clean process instead.
+START_METHOD = (
+    "forkserver"
+    if "forkserver" in multiprocessing.get_all_start_methods()
+    else "spawn"
+)
+
+
+class PoolBusy(Exception):
+    """Raised when every worker is busy and the wait queue is full."""
+
+
+class BoundedProcessPool:
+    """
+    A process pool that admits at most `workers + queue_limit` jobs at once
+    and rejects the rest immediately instead of letting callers pile up.
+    """
+
+    def __init__(self, workers: int, queue_limit: int):
+        self.workers = workers
+        self.queue_limit = queue_limit
+        self._slots = threading.BoundedSemaphore(workers + queue_limit)
+        self._executor = None
+        self._lock = threading.Lock()
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        # created lazily so importing the module never starts processes
+        with self._lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    mp_context=multiprocessing.get_context(START_METHOD)
+                )
+            return self._executor
+
+    def warm(self) -> None:
+        """Start every worker now rather than on the first requests."""
+        executor = self._get_executor()
+        wait([executor.submit(os.getpid) for _ in range(self.workers)])
+
+    async def run_async(self, fn, *args):
+        """Run `fn(*args)` in a worker, awaiting it without blocking the loop."""
+        if not self._slots.acquire(blocking=False):
+            raise PoolBusy()
+        try:
+            future = self._get_executor().submit(fn, *args)
+            return await asyncio.wrap_future(future)
+        finally:
+            self._slots.release()
+
+    def shutdown(self) -> None:
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(cancel_futures=True)
+                self._executor = None
+
+
+def default_workers() -> int:
+    return min(4, os.cpu_count() or 1)
@@ -0,0 +1,215 @@
+"""
+Prometheus metrics served on /metrics.
+
+With several uvicorn workers, set PROMETHEUS_MULTIPROC_DIR to an empty,
+writable directory before the workers start (clear it on every deploy).
+Each process then writes its samples to mmap files there, and /metrics
+merges all of them, whichever worker answers the scrape. Gauges use
+"livesum" so a worker's samples are dropped when it exits.
+"""
+import os
+import threading
+import time
+
+import anyio.to_thread
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+    multiprocess,
+)
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from starlette.routing import Match
+
+from app.core import query_stats
+
+MULTIPROC_DIR = os.getenv("PROMETHEUS_MULTIPROC_DIR")
+
+UNMATCHED_ROUTE = "<unmatched>"
+
+# -------------------------
+# METRICS
+# -------------------------
+HTTP_REQUESTS = Counter(
+    "http_requests_total",
+    "HTTP requests by route template, method and status",
+    ["method", "route", "status"],
+)
+HTTP_LATENCY = Histogram(
+    "http_request_duration_seconds",
+    "Time to the last byte of the response, streaming included",
+    ["method", "route"],
+    buckets=(.005, .01, .025, .05, .1, .25, .5, 1, 2.5, 5, 10, 30),
+)
+DB_QUERIES = Histogram(
+    "http_request_db_queries",
+    "SQL statements executed while handling one request",
+    ["method", "route"],
+    buckets=(0, 1, 2, 3, 5, 8, 13, 21, 50, 100),
+)
+
+DB_POOL_SIZE = Gauge(
+    "db_pool_size",
+    "Configured pool size",
+    ["engine"],
+    multiprocess_mode="livesum",
+)
+DB_POOL_CHECKED_OUT = Gauge(
+    "db_pool_checked_out",
+    "Connections in use",
+    ["engine"],
+    multiprocess_mode="livesum",
+)
+DB_POOL_OVERFLOW = Gauge(
+    "db_pool_overflow",
+    "Connections open beyond pool_size",
+    ["engine"],
+    multiprocess_mode="livesum",
+)
+DB_POOL_WAIT = Histogram(
+    "db_pool_wait_seconds",
+    "Time spent waiting for a pooled connection",
+    ["engine"],
+    buckets=(.0005, .001, .005, .01, .05, .1, .5, 1, 5, 30),
+)
+
+CACHE_LOOKUPS = Counter(
+    "cache_lookups_total",
+    "In-process cache lookups; hit rate is hit / (hit + miss)",
+    ["cache", "result"],
+)
+
+THREADPOOL_LIMIT = Gauge(
+    "threadpool_threads_limit",
+    "Worker threads available to sync handlers",
+    multiprocess_mode="livesum",
+)
+THREADPOOL_BUSY = Gauge(
+    "threadpool_threads_busy",
+    "Worker threads running sync handlers or dependencies",
+    multiprocess_mode="livesum",
+)
+THREADPOOL_WAITING = Gauge(
+    "threadpool_tasks_waiting",
+    "Sync calls queued for a free worker thread",
+    multiprocess_mode="livesum",
+)
+
+# -------------------------
+# ENGINE
+# -------------------------
+def instrument_engine(engine: Engine, name: str = "primary") -> None:
+    # checkin fires before the pool updates its own counters, so keep ours
+    pool = engine.pool
+    size = pool.size() if hasattr(pool, "overflow") else 0
+    checked_out = [0]
+    lock = threading.Lock()
+
+    def track(delta):
+        with lock:
+            checked_out[0] += delta
+            # set on use, so processes that never query (the uvicorn
+            # supervisor) do not add to the livesum
+            DB_POOL_SIZE.labels(name).set(size)
+            DB_POOL_CHECKED_OUT.labels(name).set(checked_out[0])
+            DB_POOL_OVERFLOW.labels(name).set(
+                max(checked_out[0] - size, 0) if size else 0
+            )
+
+    event.listen(pool, "checkout", lambda *args: track(1))
+    event.listen(pool, "checkin", lambda *args: track(-1))
+
+    # the pool has no "waiting" event, so time the checkout call itself
+    connect = pool.connect
+
+    def timed_connect():
+        started = time.perf_counter()
+        try:
+            return connect()
+        finally:
+            DB_POOL_WAIT.labels(name).observe(time.perf_counter() - started)
+
+    pool.connect = timed_connect
+
+
+# -------------------------
+# MIDDLEWARE
+# -------------------------
+def _route_template(app, scope) -> str:
+    partial = UNMATCHED_ROUTE
+    for route in app.router.routes:
+        match, _ = route.matches(scope)
+        if match == Match.FULL:
+            return route.path
+        if match == Match.PARTIAL and partial == UNMATCHED_ROUTE:
+            # right path, wrong method (405)
+            partial = route.path
+    return partial
+
+
+def _threadpool_gauges() -> None:
+    stats = anyio.to_thread.current_default_thread_limiter().statistics()
+    THREADPOOL_LIMIT.set(stats.total_tokens)
+    THREADPOOL_BUSY.set(stats.borrowed_tokens)
+    THREADPOOL_WAITING.set(stats.tasks_waiting)
+
+
+class MetricsMiddleware:
+    """
+    Times each HTTP request until its last body chunk is sent and records
+    it against the route template, so /products/{product_id} is one series.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        _threadpool_gauges()
+        status = 500
+        # opened by ServerTimingMiddleware, which wraps this one
+        stats = query_stats.current()
+        started = time.perf_counter()
+
+        async def send_wrapper(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            elapsed = time.perf_counter() - started
+
+            route = _route_template(scope["app"], scope)
+            method = scope["method"]
+            HTTP_REQUESTS.labels(method, route, status).inc()
+            HTTP_LATENCY.labels(method, route).observe(elapsed)
+            if stats is not None:
+                DB_QUERIES.labels(method, route).observe(stats.count)
+
+
+# -------------------------
+# EXPOSITION
+# -------------------------
+def render() -> tuple[bytes, str]:
+    registry = REGISTRY
+    if MULTIPROC_DIR:
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    return generate_latest(registry), CONTENT_TYPE_LATEST
+
+
+def mark_process_dead() -> None:
+    """Drop this worker's live gauges from the shared directory on exit."""
+    if MULTIPROC_DIR:
+        multiprocess.mark_process_dead(os.getpid())
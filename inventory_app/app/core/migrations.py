@@ -0,0 +1,85 @@
+"""
+Minimal versioned schema migrations.
+
+Each module in app/migrations named mNNNN_<description>.py defines
+`upgrade(conn)`. Pending migrations run in name order, each in its own
+transaction, and are recorded in the schema_migrations table.
+
+Migrations are applied once per deploy with `python -m app.tools.migrate`,
+not by each server worker; the app only checks at startup that none are
+pending.
+"""
+import importlib
+import pkgutil
+from datetime import datetime
+
+from sqlalchemy import (
+    Column,
+    DateTime,
+    MetaData,
+    String,
+    Table,
+    insert,
+    inspect,
+    select,
+)
+from sqlalchemy.engine import Engine
+
+import app.migrations
+
+_metadata = MetaData()
+
+schema_migrations = Table(
+    "schema_migrations",
+    _metadata,
+    Column("version", String(100), primary_key=True),
+    Column("applied_at", DateTime, nullable=False),
+)
+
+
+def available_migrations() -> list[str]:
+    return sorted(
+        module.name
+        for module in pkgutil.iter_modules(app.migrations.__path__)
+        if module.name.startswith("m")
+    )
+
+
+def applied_migrations(engine: Engine) -> set[str]:
+    schema_migrations.create(bind=engine, checkfirst=True)
+    with engine.connect() as conn:
+        return set(conn.scalars(select(schema_migrations.c.version)))
+
+
+def pending_migrations(engine: Engine) -> list[str]:
+    """Versions not applied yet, read without changing the schema."""
+    if not inspect(engine).has_table(schema_migrations.name):
+        return available_migrations()
+    with engine.connect() as conn:
+        done = set(conn.scalars(select(schema_migrations.c.version)))
+    return [version for version in available_migrations() if version not in done]
+
+
+def run_migrations(engine: Engine) -> list[str]:
+    """
+    Apply every pending migration and return the versions applied.
+    """
+    done = applied_migrations(engine)
+    applied = []
+
+    for version in available_migrations():
+        if version in done:
+            continue
+
+        module = importlib.import_module(f"app.migrations.{version}")
+        with engine.begin() as conn:
+            module.upgrade(conn)
+            conn.execute(
+                insert(schema_migrations).values(
+                    version=version,
+                    applied_at=datetime.utcnow()
+                )
+            )
+        applied.append(version)
+
+    return applied
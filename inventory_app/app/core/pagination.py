@@ -0,0 +1,63 @@
+import base64
+import json
+
+from fastapi import HTTPException
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+
+
+def encode_cursor(*values) -> str:
+    """
+    Pack the sort key of the last row into an opaque url-safe token.
+    """
+    raw = json.dumps(values, default=str, separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def cursor_values(cursor: str) -> list:
+    """
+    The raw values in a token from `encode_cursor`, for endpoints whose
+    cursor shape varies.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded))
+    except (TypeError, ValueError):
+        raise HTTPException(400, "Invalid cursor")
+
+    if not isinstance(values, list):
+        raise HTTPException(400, "Invalid cursor")
+    return values
+
+
+def decode_cursor(cursor: str, *parsers) -> list:
+    """
+    Unpack a token from `encode_cursor`, converting each value with the
+    matching parser (e.g. `int`, `datetime.fromisoformat`).
+    """
+    values = cursor_values(cursor)
+    try:
+        if len(values) != len(parsers):
+            raise ValueError(cursor)
+
+        return [parse(value) for parse, value in zip(parsers, values)]
+    except (TypeError, ValueError):
+        raise HTTPException(400, "Invalid cursor")
+
+
+def fetch_page(query, limit: int, cursor_key) -> tuple[list, str | None]:
+    """
+    Run a keyset-ordered query and split off the next-page cursor.
+
+    `query` must already be filtered past the incoming cursor and ordered
+    by the keyset columns. One extra row is fetched to tell whether another
+    page exists; `cursor_key(row)` returns the sort key of the last row.
+    """
+    rows = query.limit(limit + 1).all()
+
+    if len(rows) <= limit:
+        return rows, None
+
+    rows = rows[:limit]
+    return rows, encode_cursor(*cursor_key(rows[-1]))
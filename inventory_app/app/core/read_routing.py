@@ -0,0 +1,118 @@
+"""
+Route request sessions between the primary and the read replica.
+
+GET and HEAD requests (list endpoints, reports, UI pages) read from the
+replica; everything else uses the primary. A request whose session commits
+gets a short-lived cookie, and while it is valid that client's reads go to
+the primary too, so it sees its own writes despite replication lag.
+READ_YOUR_WRITES_SECONDS=0 turns that off.
+
+Reads whose result outlives the request stay on the primary: table
+versions (ETags) and the reference cache are bumped when the primary
+commits, so a lagging replica would tag or cache old rows under the new
+version. etag_guard pins its routes; cache-filling routes list
+`read_primary` in their dependencies.
+"""
+import os
+import time
+
+from fastapi import Request
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy.orm import Session
+
+from app.core.database import (
+    AsyncReadSessionLocal,
+    AsyncSessionLocal,
+    async_engine,
+    async_read_engine,
+)
+
+READ_YOUR_WRITES_SECONDS = int(os.getenv("READ_YOUR_WRITES_SECONDS", "5"))
+READ_YOUR_WRITES_COOKIE = "db_primary_until"
+
+READ_METHODS = {"GET", "HEAD"}
+
+# request.state's backing dict, stored on the session so a commit can be
+# reported back to the middleware
+_STATE_KEY = "request_state"
+_COMMITTED = "db_committed"
+_PRIMARY = "db_primary"
+
+HAS_REPLICA = async_read_engine is not async_engine
+
+
+def _reads_primary(request: Request) -> bool:
+    try:
+        until = float(request.cookies.get(READ_YOUR_WRITES_COOKIE, 0))
+    except ValueError:
+        return False
+    return until > time.time()
+
+
+def read_primary(request: Request) -> None:
+    """
+    Route dependency that sends the request's reads to the primary. Route
+    dependencies resolve before the endpoint's, so it is in effect by the
+    time get_db opens the session.
+    """
+    request.scope.setdefault("state", {})[_PRIMARY] = True
+
+
+def sessionmaker_for(request: Request) -> async_sessionmaker:
+    if (
+        HAS_REPLICA
+        and request.method in READ_METHODS
+        and not request.scope.get("state", {}).get(_PRIMARY)
+        and not _reads_primary(request)
+    ):
+        return AsyncReadSessionLocal
+    return AsyncSessionLocal
+
+
+def session_for(request: Request) -> AsyncSession:
+    db = sessionmaker_for(request)()
+    db.info[_STATE_KEY] = request.scope.setdefault("state", {})
+    return db
+
+
+# AsyncSession commits through its sync Session, which is where events fire
+@event.listens_for(Session, "after_commit")
+def _record_commit(session) -> None:
+    state = session.info.get(_STATE_KEY)
+    if state is not None:
+        state[_COMMITTED] = True
+
+
+class ReadYourWritesMiddleware:
+    """Sets the primary-read cookie on responses to requests that committed."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if (
+            scope["type"] != "http"
+            or not HAS_REPLICA
+            or READ_YOUR_WRITES_SECONDS <= 0
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        async def send_wrapper(message):
+            if (
+                message["type"] == "http.response.start"
+                and scope.get("state", {}).get(_COMMITTED)
+            ):
+                until = time.time() + READ_YOUR_WRITES_SECONDS
+                cookie = (
+                    f"{READ_YOUR_WRITES_COOKIE}={until:.3f}; "
+                    f"Max-Age={READ_YOUR_WRITES_SECONDS}; Path=/; "
+                    f"HttpOnly; SameSite=lax"
+                )
+                headers = list(message.get("headers", []))
+                headers.append((b"set-cookie", cookie.encode()))
+                message = {**message, "headers": headers}
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
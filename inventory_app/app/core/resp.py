@@ -0,0 +1,97 @@
+"""
+Just enough of the Redis protocol (RESP2) to run commands and subscribe,
+so Redis-compatible servers can be used without an extra dependency.
+"""
+import socket
+from urllib.parse import urlparse
+
+from opentelemetry import trace
+from opentelemetry.trace import SpanKind
+
+tracer = trace.get_tracer(__name__)
+
+
+def encode(*args) -> bytes:
+    out = [f"*{len(args)}\r\n".encode()]
+    for arg in args:
+        data = str(arg).encode()
+        out.append(f"${len(data)}\r\n".encode() + data + b"\r\n")
+    return b"".join(out)
+
+
+def read_reply(stream):
+    line = stream.readline()
+    if not line:
+        raise ConnectionError("connection closed")
+    kind, rest = line[:1], line[1:-2]
+    if kind == b"+":
+        return rest.decode()
+    if kind == b"-":
+        raise ConnectionError(rest.decode())
+    if kind == b":":
+        return int(rest)
+    if kind == b"$":
+        size = int(rest)
+        if size < 0:
+            return None
+        return stream.read(size + 2)[:-2].decode()
+    if kind == b"*":
+        size = int(rest)
+        if size < 0:
+            return None
+        return [read_reply(stream) for _ in range(size)]
+    raise ConnectionError(f"bad reply {line!r}")
+
+
+class RespConnection:
+
+    def __init__(self, url: str, timeout: float | None = 5):
+        parsed = urlparse(url)
+        self.host = parsed.hostname or "127.0.0.1"
+        self.port = parsed.port or 6379
+        self.password = parsed.password
+        self.db = int(parsed.path.lstrip("/") or 0)
+        self.timeout = timeout
+        self._sock = None
+        self._stream = None
+
+    def connect(self) -> None:
+        self._sock = socket.create_connection((self.host, self.port), timeout=5)
+        self._sock.settimeout(self.timeout)
+        self._stream = self._sock.makefile("rb")
+        if self.password:
+            self.command("AUTH", self.password)
+        if self.db:
+            self.command("SELECT", self.db)
+
+    def close(self) -> None:
+        if self._sock is not None:
+            try:
+                self._sock.close()
+            finally:
+                self._sock = None
+                self._stream = None
+
+    def send(self, *args) -> None:
+        if self._sock is None:
+            self.connect()
+        self._sock.sendall(encode(*args))
+
+    def read(self):
+        return read_reply(self._stream)
+
+    def command(self, *args):
+        name = str(args[0]).upper()
+        # the command name only: arguments can carry keys and passwords
+        with tracer.start_as_current_span(
+            f"redis {name}",
+            kind=SpanKind.CLIENT,
+            attributes={
+                "db.system": "redis",
+                "db.operation": name,
+                "net.peer.name": self.host,
+                "net.peer.port": self.port,
+            },
+        ):
+            self.send(*args)
+            return self.read()
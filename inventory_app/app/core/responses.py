@@ -0,0 +1,36 @@
+"""
+Fast JSON path for large collections.
+
+ORJSONResponse is the app-wide default, but a handler that returns plain
+data still has every item validated and re-encoded against its
+response_model. Handlers serving many rows can opt out: select exactly the
+schema's columns (`schema_columns`), zip the `Row` tuples into dicts
+(`row_dicts`) and return `fast_json(...)`. FastAPI skips response_model
+processing for returned Response objects, so the schema is still published
+in OpenAPI while nothing is validated per item.
+"""
+from fastapi import Response
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel
+
+
+def schema_columns(model, schema: type[BaseModel]) -> tuple:
+    """ORM columns for each field of `schema`, in field order."""
+    return tuple(getattr(model, name) for name in schema.model_fields)
+
+
+def row_dicts(rows, keys) -> list[dict]:
+    keys = tuple(keys)
+    return [dict(zip(keys, row)) for row in rows]
+
+
+def fast_json(content, response: Response | None = None) -> ORJSONResponse:
+    """
+    Encode `content` with orjson as-is. Headers set by dependencies on the
+    injected `response` (ETag, cookies) are carried over, since FastAPI
+    only merges them into responses it builds itself.
+    """
+    fast = ORJSONResponse(content)
+    if response is not None:
+        fast.headers.update(response.headers)
+    return fast
@@ -4,24 +4,72 @@ from jose import jwt
 import os
 from dotenv import load_dotenv
 
+from app.core.hash_pool import BoundedProcessPool, default_workers
+from app.core.token_cache import TokenCache
+
 load_dotenv()
 
+# Argon2 cost; hashes made with other parameters are upgraded on next login
+ARGON2_TIME_COST = int(os.getenv("ARGON2_TIME_COST", "2"))
+ARGON2_MEMORY_COST = int(os.getenv("ARGON2_MEMORY_COST", "102400"))  # KiB
+ARGON2_PARALLELISM = int(os.getenv("ARGON2_PARALLELISM", "8"))
+
 pwd_context = CryptContext(
     schemes=["argon2"],   # ✅ NO BCRYPT
-    deprecated="auto"
+    deprecated="auto",
+    argon2__time_cost=ARGON2_TIME_COST,
+    argon2__memory_cost=ARGON2_MEMORY_COST,
+    argon2__parallelism=ARGON2_PARALLELISM
 )
 
+# Hashing is memory-hard, so it runs on its own small process pool instead
+# of the request threadpool; bursts beyond the queue limit are rejected.
+HASH_WORKERS = int(os.getenv("HASH_WORKERS", str(default_workers())))
+HASH_QUEUE_LIMIT = int(os.getenv("HASH_QUEUE_LIMIT", "16"))
+
+hash_pool = BoundedProcessPool(HASH_WORKERS, HASH_QUEUE_LIMIT)
+
 SECRET_KEY = os.getenv("JWT_SECRET_KEY")
 ALGORITHM = os.getenv("JWT_ALGORITHM", "HS256")
 ACCESS_TOKEN_EXPIRE_MINUTES = 60
+TOKEN_CACHE_SIZE = int(os.getenv("TOKEN_CACHE_SIZE", "10000"))
+
+token_cache = TokenCache(maxsize=TOKEN_CACHE_SIZE)
 
 
-def hash_password(password: str) -> str:
+def _hash(password: str) -> str:
     return pwd_context.hash(password)
 
 
-def verify_password(plain_password: str, hashed_password: str) -> bool:
-    return pwd_context.verify(plain_password, hashed_password)
+def _verify_and_update(
+    plain_password: str,
+    hashed_password: str
+) -> tuple[bool, str | None]:
+    return pwd_context.verify_and_update(plain_password, hashed_password)
+
+
+async def hash_password(password: str) -> str:
+    """
+    Raises PoolBusy when the hashing pool is saturated.
+    """
+    return await hash_pool.run_async(_hash, password)
+
+
+async def verify_password(plain_password: str, hashed_password: str) -> bool:
+    return (await verify_and_update_password(plain_password, hashed_password))[0]
+
+
+async def verify_and_update_password(
+    plain_password: str,
+    hashed_password: str
+) -> tuple[bool, str | None]:
+    """
+    Returns (valid, new_hash); new_hash is set when the stored hash used
+    outdated Argon2 parameters. Raises PoolBusy when saturated.
+    """
+    return await hash_pool.run_async(
+        _verify_and_update, plain_password, hashed_password
+    )
 
 
 def create_access_token(user_id: int) -> str:
@@ -33,3 +81,20 @@ def create_access_token(user_id: int) -> str:
 def decode_access_token(token: str) -> int:
     payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
     return int(payload["sub"])
+
+
+def verify_access_token(token: str) -> int:
+    """
+    decode_access_token, memoised per token until the token expires.
+    """
+    user_id = token_cache.get(token)
+    if user_id is not None:
+        return user_id
+
+    payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+    user_id = int(payload["sub"])
+
+    if "exp" in payload:
+        token_cache.put(token, user_id, float(payload["exp"]))
+
+    return user_id
@@ -0,0 +1,62 @@
+import hashlib
+import threading
+import time
+
+from cachetools import TLRUCache
+
+from app.core.metrics import CACHE_LOOKUPS
+
+
+class TokenCache:
+    """
+    Bounded LRU of already-verified JWTs: sha256(token) -> (user_id, exp).
+
+    Each entry expires at the token's own `exp`, so a cached token stops
+    being accepted at exactly the moment a full decode would reject it.
+    """
+
+    def __init__(self, maxsize: int):
+        self._cache = TLRUCache(
+            maxsize=maxsize,
+            ttu=lambda _key, value, _now: value[1],
+            timer=time.time
+        )
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _key(token: str) -> bytes:
+        return hashlib.sha256(token.encode()).digest()
+
+    def get(self, token: str) -> int | None:
+        with self._lock:
+            entry = self._cache.get(self._key(token))
+            if entry is None:
+                self.misses += 1
+                CACHE_LOOKUPS.labels("tokens", "miss").inc()
+                return None
+            self.hits += 1
+            CACHE_LOOKUPS.labels("tokens", "hit").inc()
+            return entry[0]
+
+    def put(self, token: str, user_id: int, exp: float) -> None:
+        with self._lock:
+            self._cache[self._key(token)] = (user_id, exp)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._cache.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "size": len(self._cache),
+                "maxsize": self._cache.maxsize,
+            }
@@ -0,0 +1,135 @@
+"""
+OpenTelemetry tracing: a server span per route (FastAPI instrumentation),
+a client span per SQL statement with its text and row count, and client
+spans for outbound Redis commands.
+
+Configured with the standard OTEL_* variables:
+
+    OTEL_TRACES_EXPORTER   none (default) | console | otlp | memory
+    OTEL_SERVICE_NAME      defaults to inventory-api
+    OTEL_EXPORTER_OTLP_ENDPOINT, OTEL_TRACES_SAMPLER, ...  read by the SDK
+
+`memory` keeps finished spans in `memory_exporter` for tests.
+"""
+import os
+
+from fastapi import FastAPI
+from opentelemetry import trace
+from opentelemetry.instrumentation.fastapi import FastAPIInstrumentor
+from opentelemetry.sdk.resources import SERVICE_NAME, Resource
+from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.sdk.trace.export import (
+    BatchSpanProcessor,
+    ConsoleSpanExporter,
+    SimpleSpanProcessor,
+)
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import (
+    InMemorySpanExporter,
+)
+from opentelemetry.trace import SpanKind, Status, StatusCode
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+TRACES_EXPORTER = os.getenv("OTEL_TRACES_EXPORTER", "none").lower()
+SERVICE = os.getenv("OTEL_SERVICE_NAME", "inventory-api")
+
+# long statements (bulk VALUES lists) are cut to keep spans exportable
+MAX_STATEMENT_LENGTH = 4096
+
+tracer = trace.get_tracer("app")
+memory_exporter: InMemorySpanExporter | None = None
+_provider: TracerProvider | None = None
+
+
+def _processor(kind: str):
+    global memory_exporter
+
+    if kind == "console":
+        return SimpleSpanProcessor(ConsoleSpanExporter())
+    if kind == "memory":
+        memory_exporter = InMemorySpanExporter()
+        return SimpleSpanProcessor(memory_exporter)
+    if kind == "otlp":
+        # grpc is heavy to import; only pay for it when selected
+        from opentelemetry.exporter.otlp.proto.grpc.trace_exporter import (
+            OTLPSpanExporter,
+        )
+        return BatchSpanProcessor(OTLPSpanExporter())
+    raise RuntimeError(f"Unknown OTEL_TRACES_EXPORTER: {kind}")
+
+
+# -------------------------
+# SQL STATEMENT SPANS
+# -------------------------
+def _before_execute(conn, cursor, statement, parameters, context, executemany):
+    verb = statement.lstrip().split(None, 1)[0].upper() if statement.strip() else "SQL"
+    span = tracer.start_span(
+        verb,
+        kind=SpanKind.CLIENT,
+        attributes={
+            "db.system": conn.dialect.name,
+            "db.statement": statement[:MAX_STATEMENT_LENGTH],
+            "db.operation": verb,
+            "db.executemany": executemany,
+        },
+    )
+    context._otel_span = span
+
+
+def _after_execute(conn, cursor, statement, parameters, context, executemany):
+    span = getattr(context, "_otel_span", None)
+    if span is None:
+        return
+    # DML always reports; SELECT only on drivers that buffer (psycopg2),
+    # SQLite leaves it at -1
+    if cursor.rowcount is not None and cursor.rowcount >= 0:
+        span.set_attribute("db.rowcount", cursor.rowcount)
+    span.end()
+    context._otel_span = None
+
+
+def _handle_error(exception_context):
+    context = exception_context.execution_context
+    span = getattr(context, "_otel_span", None)
+    if span is None:
+        return
+    span.record_exception(exception_context.original_exception)
+    span.set_status(Status(StatusCode.ERROR))
+    span.end()
+    context._otel_span = None
+
+
+def instrument_engine(engine: Engine) -> None:
+    event.listen(engine, "before_cursor_execute", _before_execute)
+    event.listen(engine, "after_cursor_execute", _after_execute)
+    event.listen(engine, "handle_error", _handle_error)
+
+
+# -------------------------
+# SETUP
+# -------------------------
+def setup_tracing(app: FastAPI, *engines: Engine) -> TracerProvider | None:
+    """
+    Install the tracer provider and instrument the app and engines, unless
+    OTEL_TRACES_EXPORTER is `none`.
+    """
+    global _provider
+
+    if TRACES_EXPORTER == "none":
+        return None
+
+    _provider = TracerProvider(resource=Resource.create({SERVICE_NAME: SERVICE}))
+    _provider.add_span_processor(_processor(TRACES_EXPORTER))
+    trace.set_tracer_provider(_provider)
+
+    FastAPIInstrumentor.instrument_app(
+        app, tracer_provider=_provider, excluded_urls="/static/.*"
+    )
+    for engine in engines:
+        instrument_engine(engine)
+    return _provider
+
+
+def shutdown_tracing() -> None:
+    if _provider is not None:
+        _provider.shutdown()
@@ -0,0 +1,114 @@
+"""
+Per-table version counters used to build ETags for list and report
+endpoints.
+
+Services call `table_versions.bump(table)` after committing a write, so
+any response built from that table gets a new ETag. Versions are only
+compared for equality, so every store also carries an epoch that changes
+whenever the counters could have been reset (process start, Redis flush).
+
+With CACHE_INVALIDATION_URL set the counters live in Redis and are shared
+by all workers. Without it they are per process, which is only correct for
+a single worker, so when WEB_CONCURRENCY says there are more ETags are
+turned off instead of risking a stale 304 from a worker that missed a
+write.
+"""
+import logging
+import os
+import secrets
+import threading
+
+from app.core.cache import CACHE_INVALIDATION_URL
+from app.core.deferred import defer_io
+from app.core.resp import RespConnection
+
+logger = logging.getLogger(__name__)
+
+VERSION_KEY_PREFIX = "inventory:version:"
+EPOCH_KEY = VERSION_KEY_PREFIX + "epoch"
+
+# the worker count uvicorn and gunicorn read by default
+WEB_CONCURRENCY = int(os.getenv("WEB_CONCURRENCY", "1"))
+
+
+class MemoryVersions:
+
+    def __init__(self):
+        self._versions = {}
+        self._lock = threading.Lock()
+        self.epoch = secrets.token_hex(8)
+
+    def bump(self, *tables: str) -> None:
+        with self._lock:
+            for table in tables:
+                self._versions[table] = self._versions.get(table, 0) + 1
+
+    def get(self, tables) -> str | None:
+        with self._lock:
+            versions = [str(self._versions.get(table, 0)) for table in tables]
+        return ":".join([self.epoch, *versions])
+
+
+class NoVersions:
+    """No shared store across workers: never hand out a version."""
+
+    def bump(self, *tables: str) -> None:
+        pass
+
+    def get(self, tables) -> str | None:
+        return None
+
+
+class RedisVersions:
+    """
+    Counters in Redis (INCR / MGET). If Redis is unreachable `get` returns
+    None and callers skip conditional handling rather than risk a stale 304.
+    """
+
+    def __init__(self, url: str):
+        self._conn = RespConnection(url)
+        self._lock = threading.Lock()
+
+    def _command(self, *args):
+        with self._lock:
+            try:
+                return self._conn.command(*args)
+            except OSError:
+                self._conn.close()
+                raise
+
+    def bump(self, *tables: str) -> None:
+        defer_io(self._incr, tables)
+
+    def _incr(self, tables) -> None:
+        for table in tables:
+            try:
+                self._command("INCR", VERSION_KEY_PREFIX + table)
+            except OSError:
+                logger.warning("could not bump version for %s", table)
+
+    def get(self, tables) -> str | None:
+        try:
+            # SETNX keeps the first epoch; a flushed Redis gets a new one
+            self._command("SETNX", EPOCH_KEY, secrets.token_hex(8))
+            values = self._command(
+                "MGET", EPOCH_KEY, *(VERSION_KEY_PREFIX + t for t in tables)
+            )
+        except OSError:
+            return None
+        return ":".join(value or "0" for value in values)
+
+
+def _store():
+    if CACHE_INVALIDATION_URL:
+        return RedisVersions(CACHE_INVALIDATION_URL)
+    if WEB_CONCURRENCY > 1:
+        logger.warning(
+            "ETags disabled: %d workers and no CACHE_INVALIDATION_URL "
+            "to share table versions", WEB_CONCURRENCY
+        )
+        return NoVersions()
+    return MemoryVersions()
+
+
+table_versions = _store()
@@ -1,11 +1,14 @@
 from fastapi import FastAPI
-
-from app.core.database import engine, Base
-from app.models.category import Category
-from app.models.user import User
-from app.models.supplier import Supplier
-from app.models.product import Product
-from app.models.sale import Sale
+from fastapi.responses import ORJSONResponse
+
+from app.core import metrics, query_stats
+from app.core.database import (
+    ENGINES, async_engine, async_read_engine, engine
+)
+from app.core.read_routing import ReadYourWritesMiddleware
+from app.core.migrations import pending_migrations
+from app.core.security import hash_pool
+from app.core.tracing import setup_tracing, shutdown_tracing
 from fastapi.templating import Jinja2Templates
 from fastapi.staticfiles import StaticFiles
 
@@ -18,11 +21,21 @@ from app.controllers.product_controller import router as product_router
 from app.controllers.sale_controller import router as sale_router
 from app.controllers.report_controller import router as report_router
 from app.controllers.ui_controller import router as ui_router
+from app.controllers.cache_controller import router as cache_router
+from app.controllers.metrics_controller import router as metrics_router
 
 
 
 
-app = FastAPI()
+app = FastAPI(default_response_class=ORJSONResponse)
+setup_tracing(app, *ENGINES.values())
+for name, db_engine in ENGINES.items():
+    metrics.instrument_engine(db_engine, name)
+    query_stats.instrument_engine(db_engine)
+# added last runs first: query stats wrap the metrics middleware
+app.add_middleware(metrics.MetricsMiddleware)
+app.add_middleware(query_stats.ServerTimingMiddleware)
+app.add_middleware(ReadYourWritesMiddleware)
 
 templates = Jinja2Templates(directory="app/templates")
 
@@ -31,7 +44,23 @@ app.mount("/static", StaticFiles(directory="app/static"), name="static")
 
 @app.on_event("startup")
 def startup():
-    Base.metadata.create_all(bind=engine)
+    # migrations run once per deploy, not in every worker
+    pending = pending_migrations(engine)
+    if pending:
+        raise RuntimeError(
+            f"pending migrations: {', '.join(pending)}; "
+            f"run python -m app.tools.migrate first"
+        )
+    hash_pool.warm()
+
+
+@app.on_event("shutdown")
+async def shutdown():
+    hash_pool.shutdown()
+    shutdown_tracing()
+    metrics.mark_process_dead()
+    await async_engine.dispose()
+    await async_read_engine.dispose()
 
 app.include_router(auth_router)
 app.include_router(category_router)
@@ -40,6 +69,8 @@ app.include_router(product_router)
 app.include_router(sale_router)
 app.include_router(report_router)
 app.include_router(ui_router)
+app.include_router(cache_router)
+app.include_router(metrics_router)
 
 
 
@@ -47,5 +78,5 @@ app.include_router(ui_router)
 
 
 @app.get("/")
-def health_check():
+async def health_check():
     return {"status": "ok"}
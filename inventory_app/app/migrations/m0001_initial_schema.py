@@ -0,0 +1,77 @@
+"""
+Initial schema: the tables the app created with Base.metadata.create_all
+before migrations existed.
+
+Written out here rather than built from the models, so a later model
+change only reaches a database through its own migration and fresh and
+upgraded databases stay identical. Existing tables are left alone, so
+databases that predate migrations pick up only what they are missing.
+"""
+from sqlalchemy import (
+    Column,
+    Date,
+    DateTime,
+    ForeignKey,
+    Integer,
+    MetaData,
+    String,
+    Table,
+)
+
+metadata = MetaData()
+
+Table(
+    "categories",
+    metadata,
+    Column("id", Integer, primary_key=True, index=True),
+    Column("name", String(100), nullable=False, unique=True),
+)
+
+Table(
+    "suppliers",
+    metadata,
+    Column("id", Integer, primary_key=True, index=True),
+    Column("name", String(100), nullable=False, unique=True),
+)
+
+Table(
+    "users",
+    metadata,
+    Column("id", Integer, primary_key=True, index=True),
+    Column("username", String(50), unique=True, nullable=False),
+    Column("password", String(255), nullable=False),
+)
+
+Table(
+    "products",
+    metadata,
+    Column("id", Integer, primary_key=True, index=True),
+    Column("name", String(150), nullable=False),
+    Column("sku", String(50), nullable=False, unique=True),
+    Column("price", Integer, nullable=False),
+    Column("quantity", Integer, nullable=False),
+    Column("category_id", Integer, ForeignKey("categories.id"), nullable=False),
+    Column("supplier_id", Integer, ForeignKey("suppliers.id"), nullable=False),
+)
+
+Table(
+    "sales",
+    metadata,
+    Column("id", Integer, primary_key=True, index=True),
+    Column("product_id", Integer, ForeignKey("products.id"), nullable=False),
+    Column("quantity_sold", Integer, nullable=False),
+    Column("created_at", DateTime),
+)
+
+Table(
+    "sales_daily_rollup",
+    metadata,
+    Column("sale_date", Date, primary_key=True),
+    Column("product_id", Integer, ForeignKey("products.id"), primary_key=True),
+    Column("quantity_sold", Integer, nullable=False),
+    Column("revenue", Integer, nullable=False),
+)
+
+
+def upgrade(conn) -> None:
+    metadata.create_all(bind=conn, checkfirst=True)
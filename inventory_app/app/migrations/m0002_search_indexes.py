@@ -0,0 +1,84 @@
+"""
+pg_trgm GIN indexes on PostgreSQL / FTS5 shadow tables on SQLite.
+
+The DDL is written out rather than taken from search_service, so this
+migration replays the same statements however that module changes.
+"""
+from sqlalchemy import text
+
+POSTGRESQL = [
+    "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+    "CREATE INDEX IF NOT EXISTS ix_products_name_trgm "
+    "ON products USING gin (name gin_trgm_ops)",
+    "CREATE INDEX IF NOT EXISTS ix_products_sku_trgm "
+    "ON products USING gin (sku gin_trgm_ops)",
+    "CREATE INDEX IF NOT EXISTS ix_categories_name_trgm "
+    "ON categories USING gin (name gin_trgm_ops)",
+    "CREATE INDEX IF NOT EXISTS ix_suppliers_name_trgm "
+    "ON suppliers USING gin (name gin_trgm_ops)",
+]
+
+# shadow table -> statements creating it and the triggers that sync it
+SQLITE = {
+    "products_fts": [
+        "CREATE VIRTUAL TABLE IF NOT EXISTS products_fts USING fts5("
+        "name, sku, content='products', content_rowid='id', "
+        "tokenize='trigram')",
+        "CREATE TRIGGER IF NOT EXISTS products_fts_ai AFTER INSERT ON products "
+        "BEGIN INSERT INTO products_fts(rowid, name, sku) "
+        "VALUES (new.id, new.name, new.sku); END",
+        "CREATE TRIGGER IF NOT EXISTS products_fts_ad AFTER DELETE ON products "
+        "BEGIN INSERT INTO products_fts(products_fts, rowid, name, sku) "
+        "VALUES ('delete', old.id, old.name, old.sku); END",
+        "CREATE TRIGGER IF NOT EXISTS products_fts_au AFTER UPDATE ON products "
+        "BEGIN INSERT INTO products_fts(products_fts, rowid, name, sku) "
+        "VALUES ('delete', old.id, old.name, old.sku); "
+        "INSERT INTO products_fts(rowid, name, sku) "
+        "VALUES (new.id, new.name, new.sku); END",
+    ],
+    "categories_fts": [
+        "CREATE VIRTUAL TABLE IF NOT EXISTS categories_fts USING fts5("
+        "name, content='categories', content_rowid='id', tokenize='trigram')",
+        "CREATE TRIGGER IF NOT EXISTS categories_fts_ai AFTER INSERT ON categories "
+        "BEGIN INSERT INTO categories_fts(rowid, name) "
+        "VALUES (new.id, new.name); END",
+        "CREATE TRIGGER IF NOT EXISTS categories_fts_ad AFTER DELETE ON categories "
+        "BEGIN INSERT INTO categories_fts(categories_fts, rowid, name) "
+        "VALUES ('delete', old.id, old.name); END",
+        "CREATE TRIGGER IF NOT EXISTS categories_fts_au AFTER UPDATE ON categories "
+        "BEGIN INSERT INTO categories_fts(categories_fts, rowid, name) "
+        "VALUES ('delete', old.id, old.name); "
+        "INSERT INTO categories_fts(rowid, name) VALUES (new.id, new.name); END",
+    ],
+    "suppliers_fts": [
+        "CREATE VIRTUAL TABLE IF NOT EXISTS suppliers_fts USING fts5("
+        "name, content='suppliers', content_rowid='id', tokenize='trigram')",
+        "CREATE TRIGGER IF NOT EXISTS suppliers_fts_ai AFTER INSERT ON suppliers "
+        "BEGIN INSERT INTO suppliers_fts(rowid, name) "
+        "VALUES (new.id, new.name); END",
+        "CREATE TRIGGER IF NOT EXISTS suppliers_fts_ad AFTER DELETE ON suppliers "
+        "BEGIN INSERT INTO suppliers_fts(suppliers_fts, rowid, name) "
+        "VALUES ('delete', old.id, old.name); END",
+        "CREATE TRIGGER IF NOT EXISTS suppliers_fts_au AFTER UPDATE ON suppliers "
+        "BEGIN INSERT INTO suppliers_fts(suppliers_fts, rowid, name) "
+        "VALUES ('delete', old.id, old.name); "
+        "INSERT INTO suppliers_fts(rowid, name) VALUES (new.id, new.name); END",
+    ],
+}
+
+
+def upgrade(conn) -> None:
+    if conn.dialect.name == "postgresql":
+        for statement in POSTGRESQL:
+            conn.execute(text(statement))
+    elif conn.dialect.name == "sqlite":
+        for fts, statements in SQLITE.items():
+            exists = conn.execute(
+                text("SELECT 1 FROM sqlite_master WHERE name = :name"),
+                {"name": fts}
+            ).first()
+            for statement in statements:
+                conn.execute(text(statement))
+            if not exists:
+                # index rows that were there before the shadow table
+                conn.execute(text(f"INSERT INTO {fts}({fts}) VALUES ('rebuild')"))
@@ -0,0 +1,24 @@
+"""
+Secondary indexes for the hot query predicates: the list_sales keyset,
+the sales -> products join, and the product category/supplier filters.
+
+Written out rather than taken from the models' __table__.indexes, so the
+migration replays the same DDL whatever the models later declare.
+"""
+from sqlalchemy import text
+
+INDEXES = [
+    "CREATE INDEX IF NOT EXISTS ix_products_category_id_id "
+    "ON products (category_id, id)",
+    "CREATE INDEX IF NOT EXISTS ix_products_supplier_id_id "
+    "ON products (supplier_id, id)",
+    "CREATE INDEX IF NOT EXISTS ix_sales_created_at_id "
+    "ON sales (created_at, id)",
+    "CREATE INDEX IF NOT EXISTS ix_sales_product_id_created_at "
+    "ON sales (product_id, created_at)",
+]
+
+
+def upgrade(conn) -> None:
+    for statement in INDEXES:
+        conn.execute(text(statement))
@@ -0,0 +1,33 @@
+"""
+sales.unit_price: the price each sale was made at, so rollup revenue,
+raw-sales revenue and the reversal on edit or delete all use one number.
+
+Existing sales are backfilled from the current product price, the best
+record there is, and the rollup is rebuilt from the backfilled prices.
+"""
+from sqlalchemy import inspect, text
+
+
+def upgrade(conn) -> None:
+    columns = {column["name"] for column in inspect(conn).get_columns("sales")}
+    if "unit_price" not in columns:
+        conn.execute(text("ALTER TABLE sales ADD COLUMN unit_price INTEGER"))
+
+    conn.execute(text(
+        "UPDATE sales SET unit_price = "
+        "(SELECT price FROM products WHERE products.id = sales.product_id) "
+        "WHERE unit_price IS NULL"
+    ))
+    if conn.dialect.name == "postgresql":
+        conn.execute(text(
+            "ALTER TABLE sales ALTER COLUMN unit_price SET NOT NULL"
+        ))
+
+    conn.execute(text("DELETE FROM sales_daily_rollup"))
+    conn.execute(text(
+        "INSERT INTO sales_daily_rollup "
+        "(sale_date, product_id, quantity_sold, revenue) "
+        "SELECT date(created_at), product_id, "
+        "SUM(quantity_sold), SUM(quantity_sold * unit_price) "
+        "FROM sales GROUP BY date(created_at), product_id"
+    ))
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, ForeignKey
+from sqlalchemy import Column, Integer, String, ForeignKey, Index
 from app.core.database import Base
 
 
@@ -13,3 +13,9 @@ class Product(Base):
 
     category_id = Column(Integer, ForeignKey("categories.id"), nullable=False)
     supplier_id = Column(Integer, ForeignKey("suppliers.id"), nullable=False)
+
+    # list filters: equality on the FK plus the id DESC keyset in one index
+    __table_args__ = (
+        Index("ix_products_category_id_id", "category_id", "id"),
+        Index("ix_products_supplier_id_id", "supplier_id", "id"),
+    )
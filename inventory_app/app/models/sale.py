@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, ForeignKey, DateTime
+from sqlalchemy import Column, Integer, ForeignKey, DateTime, Index
 from datetime import datetime
 
 from app.core.database import Base
@@ -10,4 +10,13 @@ class Sale(Base):
     id = Column(Integer, primary_key=True, index=True)
     product_id = Column(Integer, ForeignKey("products.id"), nullable=False)
     quantity_sold = Column(Integer, nullable=False)
+    # product price when sold; revenue is always quantity_sold * unit_price
+    unit_price = Column(Integer, nullable=False)
     created_at = Column(DateTime, default=datetime.utcnow)
+
+    __table_args__ = (
+        # backs the (created_at, id) keyset used by list_sales
+        Index("ix_sales_created_at_id", "created_at", "id"),
+        # join key to products, and per-product sales over a time range
+        Index("ix_sales_product_id_created_at", "product_id", "created_at"),
+    )
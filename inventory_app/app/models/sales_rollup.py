@@ -0,0 +1,12 @@
+from sqlalchemy import Column, Integer, ForeignKey, Date
+
+from app.core.database import Base
+
+
+class SalesDailyRollup(Base):
+    __tablename__ = "sales_daily_rollup"
+
+    sale_date = Column(Date, primary_key=True)
+    product_id = Column(Integer, ForeignKey("products.id"), primary_key=True)
+    quantity_sold = Column(Integer, nullable=False, default=0)
+    revenue = Column(Integer, nullable=False, default=0)
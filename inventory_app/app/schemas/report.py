@@ -0,0 +1,29 @@
+from datetime import datetime
+from typing import Generic, TypeVar
+
+from pydantic import BaseModel
+
+T = TypeVar("T")
+
+
+class Report(BaseModel, Generic[T]):
+    count: int
+    data: list[T]
+
+
+class InventoryRow(BaseModel):
+    id: int
+    name: str
+    sku: str
+    price: int
+    quantity: int
+    category: str
+    supplier: str
+
+
+class SaleRow(BaseModel):
+    id: int
+    product_id: int
+    quantity_sold: int
+    unit_price: int
+    created_at: datetime
@@ -12,6 +12,7 @@ class SaleOut(BaseModel):
     id: int
     product_id: int
     quantity_sold: int
+    unit_price: int  # product price when the sale was booked
     created_at: datetime
 
     model_config = {
@@ -0,0 +1,76 @@
+from fastapi import HTTPException, status
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.hash_pool import PoolBusy
+from app.core.security import (
+    create_access_token,
+    hash_password,
+    verify_and_update_password,
+)
+from app.models.user import User
+
+
+def _busy() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        detail="Too many login attempts, retry shortly",
+        headers={"Retry-After": "1"}
+    )
+
+
+# Async so the Argon2 work is awaited off the event loop rather than
+# blocking it inside run_sync.
+async def authenticate_user(
+    db: AsyncSession,
+    username: str,
+    password: str
+) -> str:
+    """
+    Check credentials and return a fresh access token. Passwords hashed
+    with outdated Argon2 parameters are rehashed transparently.
+    """
+    user = await db.scalar(select(User).where(User.username == username))
+
+    valid = False
+    if user:
+        try:
+            valid, new_hash = await verify_and_update_password(
+                password, user.password
+            )
+        except PoolBusy:
+            raise _busy()
+
+    if not valid:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid username or password"
+        )
+
+    if new_hash:
+        user.password = new_hash
+        await db.commit()
+
+    return create_access_token(user.id)
+
+
+async def register_user(
+    db: AsyncSession,
+    username: str,
+    password: str
+) -> User:
+    if await db.scalar(select(User.id).where(User.username == username)):
+        raise HTTPException(status_code=400, detail="User already exists")
+
+    try:
+        hashed = await hash_password(password)
+    except PoolBusy:
+        raise _busy()
+
+    user = User(
+        username=username,
+        password=hashed
+    )
+    db.add(user)
+    await db.commit()
+    return user
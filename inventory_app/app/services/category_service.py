@@ -0,0 +1,120 @@
+from fastapi import HTTPException, status
+from sqlalchemy import select
+from sqlalchemy.engine import Row
+from sqlalchemy.orm import Session
+
+from app.core.cache import reference_cache
+from app.core.pagination import DEFAULT_PAGE_SIZE, decode_cursor, fetch_page
+from app.core.responses import schema_columns
+from app.core.versions import table_versions
+from app.models.category import Category
+from app.schemas.category import CategoryCreate, CategoryOut
+from app.services.search_service import search_page
+
+
+# list endpoints select exactly the response fields, no ORM entities
+LIST_COLUMNS = schema_columns(Category, CategoryOut)
+
+
+def create_category(db: Session, payload: CategoryCreate) -> Category:
+    existing = db.query(Category).filter(
+        Category.name.ilike(payload.name)
+    ).first()
+
+    if existing:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Category already exists"
+        )
+
+    category = Category(name=payload.name)
+    db.add(category)
+    db.commit()
+    table_versions.bump("categories")
+    reference_cache.invalidate("categories")
+    db.refresh(category)
+    return category
+
+
+def all_categories(db: Session) -> list[dict]:
+    """
+    Every category as plain dicts, newest first, served from the
+    reference cache.
+    """
+    return reference_cache.get_or_load(
+        "categories",
+        "all",
+        lambda: [
+            {"id": c.id, "name": c.name}
+            for c in db.query(Category).order_by(Category.id.desc())
+        ]
+    )
+
+
+def category_exists(db: Session, category_id: int) -> bool:
+    ids = reference_cache.get_or_load(
+        "categories",
+        "ids",
+        lambda: frozenset(db.scalars(select(Category.id)))
+    )
+    # a miss may just be a category created in another worker moments ago
+    return category_id in ids or db.get(Category, category_id) is not None
+
+
+def list_categories(
+    db: Session,
+    search: str | None = None,
+    limit: int = DEFAULT_PAGE_SIZE,
+    cursor: str | None = None
+) -> tuple[list[Row], str | None]:
+    query = db.query(*LIST_COLUMNS)
+
+    if search:
+        dialect = db.get_bind().dialect.name
+        return search_page(query, dialect, "categories", search, limit, cursor)
+
+    if cursor:
+        last_id, = decode_cursor(cursor, int)
+        query = query.filter(Category.id < last_id)
+
+    return fetch_page(
+        query.order_by(Category.id.desc()),
+        limit,
+        lambda c: (c.id,)
+    )
+
+
+def update_category(
+    db: Session,
+    category_id: int,
+    payload: CategoryCreate
+) -> Category:
+    category = db.get(Category, category_id)
+
+    if not category:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Category not found"
+        )
+
+    category.name = payload.name
+    db.commit()
+    table_versions.bump("categories")
+    reference_cache.invalidate("categories")
+    db.refresh(category)
+    return category
+
+
+def delete_category(db: Session, category_id: int) -> None:
+    category = db.get(Category, category_id)
+
+    if not category:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Category not found"
+        )
+
+    db.delete(category)
+    db.commit()
+    table_versions.bump("categories")
+    reference_cache.invalidate("categories")
@@ -0,0 +1,193 @@
+from fastapi import HTTPException
+from pydantic import ValidationError
+from sqlalchemy import insert, select
+from sqlalchemy.engine import Row
+from sqlalchemy.orm import Session
+
+from app.core.cache import reference_cache
+from app.core.pagination import DEFAULT_PAGE_SIZE, decode_cursor, fetch_page
+from app.core.responses import schema_columns
+from app.core.versions import table_versions
+from app.models.product import Product
+from app.models.category import Category
+from app.models.supplier import Supplier
+from app.schemas.product import ProductCreate, ProductOut
+from app.services.category_service import category_exists
+from app.services.search_service import search_page
+from app.services.supplier_service import supplier_exists
+
+
+# list endpoints select exactly the response fields, no ORM entities
+LIST_COLUMNS = schema_columns(Product, ProductOut)
+
+# fields the cached inventory valuation is computed from
+VALUATION_FIELDS = ("price", "quantity", "category_id", "supplier_id")
+
+
+def create_product(db: Session, payload: ProductCreate) -> Product:
+    # Validate FK
+    if not category_exists(db, payload.category_id):
+        raise HTTPException(400, "Invalid category")
+
+    if not supplier_exists(db, payload.supplier_id):
+        raise HTTPException(400, "Invalid supplier")
+
+    if db.query(Product).filter(Product.sku == payload.sku).first():
+        raise HTTPException(400, "SKU already exists")
+
+    product = Product(**payload.dict())
+    db.add(product)
+    db.commit()
+    table_versions.bump("products")
+    reference_cache.invalidate("valuation")
+    db.refresh(product)
+    return product
+
+
+def list_products(
+    db: Session,
+    search: str | None = None,
+    category_id: int | None = None,
+    supplier_id: int | None = None,
+    limit: int = DEFAULT_PAGE_SIZE,
+    cursor: str | None = None
+) -> tuple[list[Row], str | None]:
+    query = db.query(*LIST_COLUMNS)
+
+    if category_id:
+        query = query.filter(Product.category_id == category_id)
+
+    if supplier_id:
+        query = query.filter(Product.supplier_id == supplier_id)
+
+    if search:
+        dialect = db.get_bind().dialect.name
+        return search_page(query, dialect, "products", search, limit, cursor)
+
+    if cursor:
+        last_id, = decode_cursor(cursor, int)
+        query = query.filter(Product.id < last_id)
+
+    return fetch_page(
+        query.order_by(Product.id.desc()),
+        limit,
+        lambda p: (p.id,)
+    )
+
+
+def update_product(
+    db: Session,
+    product_id: int,
+    payload: ProductCreate
+) -> Product:
+    product = db.get(Product, product_id)
+    if not product:
+        raise HTTPException(404, "Product not found")
+
+    values = payload.dict()
+    revalued = any(
+        getattr(product, key) != values[key] for key in VALUATION_FIELDS
+    )
+    for key, value in values.items():
+        setattr(product, key, value)
+
+    db.commit()
+    table_versions.bump("products")
+    if revalued:
+        reference_cache.invalidate("valuation")
+    db.refresh(product)
+    return product
+
+
+def delete_product(db: Session, product_id: int) -> None:
+    product = db.get(Product, product_id)
+    if not product:
+        raise HTTPException(404, "Product not found")
+
+    db.delete(product)
+    db.commit()
+    table_versions.bump("products")
+    reference_cache.invalidate("valuation")
+
+
+# -------------------------
+# BULK IMPORT
+# -------------------------
+MAX_BULK_ROWS = 100_000
+BULK_BATCH_SIZE = 1000
+
+
+def _chunks(values: list, size: int):
+    for start in range(0, len(values), size):
+        yield values[start:start + size]
+
+
+def _existing(db: Session, column, values: set) -> set:
+    found = set()
+    for chunk in _chunks(list(values), BULK_BATCH_SIZE):
+        found.update(db.scalars(select(column).where(column.in_(chunk))))
+    return found
+
+
+def bulk_create_products(
+    db: Session,
+    rows: list[dict],
+    atomic: bool = False
+) -> dict:
+    """
+    Validate and insert many products with a handful of set-based lookups.
+
+    Invalid rows are reported by their index in `rows`. With `atomic`, any
+    error rejects the whole import; otherwise the valid rows are inserted.
+    """
+    if len(rows) > MAX_BULK_ROWS:
+        raise HTTPException(413, f"At most {MAX_BULK_ROWS} rows per import")
+
+    errors = []
+    valid = []
+
+    for index, row in enumerate(rows):
+        try:
+            valid.append((index, ProductCreate.model_validate(row)))
+        except ValidationError as exc:
+            message = "; ".join(
+                f"{'.'.join(map(str, e['loc'])) or 'row'}: {e['msg']}"
+                for e in exc.errors()
+            )
+            errors.append({"index": index, "error": message})
+
+    categories = _existing(db, Category.id, {p.category_id for _, p in valid})
+    suppliers = _existing(db, Supplier.id, {p.supplier_id for _, p in valid})
+    taken_skus = _existing(db, Product.sku, {p.sku for _, p in valid})
+
+    to_insert = []
+    for index, product in valid:
+        if product.category_id not in categories:
+            error = "Invalid category"
+        elif product.supplier_id not in suppliers:
+            error = "Invalid supplier"
+        elif product.sku in taken_skus:
+            error = "SKU already exists"
+        else:
+            taken_skus.add(product.sku)
+            to_insert.append(product.model_dump())
+            continue
+
+        errors.append({"index": index, "error": error})
+
+    errors.sort(key=lambda e: e["index"])
+
+    if atomic and errors:
+        raise HTTPException(
+            400,
+            {"message": "Import rejected", "errors": errors}
+        )
+
+    for batch in _chunks(to_insert, BULK_BATCH_SIZE):
+        db.execute(insert(Product), batch)
+    db.commit()
+    table_versions.bump("products")
+    if to_insert:
+        reference_cache.invalidate("valuation")
+
+    return {"created": len(to_insert), "errors": errors}
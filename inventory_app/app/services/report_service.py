@@ -0,0 +1,503 @@
+from datetime import date, datetime, time, timedelta
+from math import ceil
+
+from fastapi import HTTPException
+from sqlalchemy import (
+    BigInteger,
+    DateTime,
+    and_,
+    case,
+    cast,
+    func,
+    literal,
+    literal_column,
+    null,
+    or_,
+    select,
+    union_all,
+)
+from sqlalchemy.orm import Session
+
+from app.core.cache import reference_cache
+
+from app.models.product import Product
+from app.models.category import Category
+from app.models.supplier import Supplier
+from app.models.sale import Sale
+from app.models.sales_rollup import SalesDailyRollup
+from app.services.category_service import all_categories
+from app.services.supplier_service import all_suppliers
+
+
+def inventory_statement():
+    return (
+        select(
+            Product.id,
+            Product.name,
+            Product.sku,
+            Product.price,
+            Product.quantity,
+            Category.name.label("category"),
+            Supplier.name.label("supplier")
+        )
+        .join(Category, Product.category_id == Category.id)
+        .join(Supplier, Product.supplier_id == Supplier.id)
+    )
+
+
+def sales_statement():
+    return select(
+        Sale.id,
+        Sale.product_id,
+        Sale.quantity_sold,
+        Sale.unit_price,
+        Sale.created_at
+    )
+
+
+# -------------------------
+# SALES SUMMARY
+# -------------------------
+GRANULARITIES = ("hour", "day", "week", "month")
+
+# buckets (x groups) one summary may return
+MAX_SUMMARY_ROWS = 5000
+
+GROUP_COLUMNS = {
+    "product": (Product.id, Product.name),
+    "category": (Category.id, Category.name),
+    "supplier": (Supplier.id, Supplier.name),
+}
+
+SQLITE_BUCKET_FORMATS = {
+    "hour": "%Y-%m-%d %H:00:00",
+    "day": "%Y-%m-%d",
+    "month": "%Y-%m-01",
+}
+
+
+def time_bucket(column, granularity: str, dialect: str):
+    """
+    Truncate a timestamp column to the start of its hour/day/week/month.
+
+    Constants are inlined rather than bound so the expression renders
+    identically in SELECT and GROUP BY, which PostgreSQL requires.
+    """
+    if dialect == "sqlite":
+        if granularity == "week":
+            # weeks start on Monday, matching date_trunc('week', ...)
+            return func.date(
+                column,
+                literal_column("'weekday 0'"),
+                literal_column("'-6 days'")
+            )
+        return func.strftime(
+            literal_column(f"'{SQLITE_BUCKET_FORMATS[granularity]}'"),
+            column
+        )
+
+    return func.date_trunc(literal_column(f"'{granularity}'"), column)
+
+
+def _as_datetime(value):
+    # SQLite hands buckets back as text, PostgreSQL as timestamps
+    return datetime.fromisoformat(value) if isinstance(value, str) else value
+
+
+def _is_midnight(value: datetime | None) -> bool:
+    return value is None or value.time() == time.min
+
+
+def _rollup_summary_statement(granularity, start, end, dialect, columns):
+    sale_date = SalesDailyRollup.sale_date
+    if dialect != "sqlite":
+        # keep date_trunc on timestamp, not the timestamptz a date promotes to
+        sale_date = cast(sale_date, DateTime)
+
+    bucket = time_bucket(sale_date, granularity, dialect)
+    statement = (
+        select(
+            bucket.label("bucket"),
+            *columns,
+            func.sum(SalesDailyRollup.quantity_sold).label("quantity"),
+            func.sum(SalesDailyRollup.revenue).label("revenue")
+        )
+        .join(Product, SalesDailyRollup.product_id == Product.id)
+        .where(SalesDailyRollup.quantity_sold != 0)
+    )
+
+    if start:
+        statement = statement.where(SalesDailyRollup.sale_date >= start.date())
+    if end:
+        statement = statement.where(SalesDailyRollup.sale_date < end.date())
+
+    return statement, bucket
+
+
+def _raw_summary_statement(granularity, start, end, dialect, columns):
+    bucket = time_bucket(Sale.created_at, granularity, dialect)
+    statement = (
+        select(
+            bucket.label("bucket"),
+            *columns,
+            func.sum(Sale.quantity_sold).label("quantity"),
+            func.sum(Sale.quantity_sold * Sale.unit_price).label("revenue")
+        )
+        .join(Product, Sale.product_id == Product.id)
+    )
+
+    if start:
+        statement = statement.where(Sale.created_at >= start)
+    if end:
+        statement = statement.where(Sale.created_at < end)
+
+    return statement, bucket
+
+
+def sales_summary(
+    db: Session,
+    granularity: str,
+    start: datetime | None = None,
+    end: datetime | None = None,
+    group_by: str | None = None
+) -> list[dict]:
+    """
+    Day and coarser buckets on whole-day ranges are answered from
+    sales_daily_rollup; hourly buckets or ranges that cut through a day
+    fall back to scanning sales.
+
+    Raises 400 past MAX_SUMMARY_ROWS rows instead of building an
+    unbounded response; callers narrow from/to or coarsen the buckets.
+    """
+    dialect = db.get_bind().dialect.name
+
+    columns = []
+    if group_by:
+        key, name = GROUP_COLUMNS[group_by]
+        columns += [key.label(f"{group_by}_id"), name.label(f"{group_by}_name")]
+
+    use_rollup = (
+        granularity != "hour" and _is_midnight(start) and _is_midnight(end)
+    )
+    build = _rollup_summary_statement if use_rollup else _raw_summary_statement
+    statement, bucket = build(granularity, start, end, dialect, columns)
+
+    if group_by == "category":
+        statement = statement.join(Category, Product.category_id == Category.id)
+    elif group_by == "supplier":
+        statement = statement.join(Supplier, Product.supplier_id == Supplier.id)
+
+    group_keys = [bucket] + [c.element for c in columns]
+    statement = statement.group_by(*group_keys).order_by(*group_keys)
+
+    rows = db.execute(statement.limit(MAX_SUMMARY_ROWS + 1)).mappings().all()
+    if len(rows) > MAX_SUMMARY_ROWS:
+        raise HTTPException(
+            400,
+            f"Summary has more than {MAX_SUMMARY_ROWS} rows; narrow "
+            f"from/to, use a coarser granularity or drop group_by"
+        )
+
+    return [
+        {**row, "bucket": _as_datetime(row["bucket"])}
+        for row in rows
+    ]
+
+
+# -------------------------
+# REORDER FORECAST
+# -------------------------
+VELOCITY_WINDOWS = (7, 30, 90)
+MAX_VELOCITY_WINDOW = 365
+
+
+def _sold_column(window: int) -> str:
+    return f"sold_{window}d"
+
+
+def _reorder_statement(
+    as_of: date,
+    windows: tuple[int, ...],
+    cover_days: int,
+    supplier_id: int | None
+):
+    """
+    Units sold per product in each trailing window, read from
+    sales_daily_rollup over the longest window in one pass, joined to the
+    products that sit at or below their reorder point for any window.
+    """
+    rollup = SalesDailyRollup
+    sold = [
+        func.sum(
+            case(
+                (
+                    rollup.sale_date >= as_of - timedelta(days=window),
+                    rollup.quantity_sold
+                ),
+                else_=0
+            )
+        ).label(_sold_column(window))
+        for window in windows
+    ]
+    velocity = (
+        select(rollup.product_id, *sold)
+        .where(
+            rollup.sale_date >= as_of - timedelta(days=max(windows)),
+            rollup.sale_date < as_of
+        )
+        .group_by(rollup.product_id)
+        .subquery("velocity")
+    )
+
+    # quantity / (sold / window) <= cover_days, kept in integers so every
+    # backend filters the same way before any row leaves the database
+    below_reorder_point = or_(*(
+        and_(
+            velocity.c[_sold_column(window)] > 0,
+            Product.quantity * window
+            <= velocity.c[_sold_column(window)] * cover_days
+        )
+        for window in windows
+    ))
+
+    statement = (
+        select(
+            Product.id,
+            Product.name,
+            Product.sku,
+            Product.quantity,
+            Product.supplier_id,
+            Supplier.name.label("supplier_name"),
+            *(velocity.c[_sold_column(window)] for window in windows)
+        )
+        .join(velocity, velocity.c.product_id == Product.id)
+        .join(Supplier, Product.supplier_id == Supplier.id)
+        .where(below_reorder_point)
+    )
+    if supplier_id is not None:
+        statement = statement.where(Product.supplier_id == supplier_id)
+
+    return statement
+
+
+def reorder_report(
+    db: Session,
+    windows: tuple[int, ...] = VELOCITY_WINDOWS,
+    lead_time_days: int = 14,
+    safety_days: int = 7,
+    review_days: int = 30,
+    as_of: date | None = None,
+    supplier_id: int | None = None
+) -> dict:
+    """
+    Draft purchase lists, one per supplier, for products projected to run
+    out before a new order could arrive.
+
+    Velocity is units sold per day over each window of whole days before
+    `as_of`; the forecast uses the fastest window, so a recent spike
+    triggers a reorder without waiting for the long average to catch up.
+    The reorder point is the stock that velocity burns through in
+    lead_time_days + safety_days, and the suggested order tops stock back
+    up to that plus review_days of demand.
+    """
+    # sales are stamped in UTC
+    as_of = as_of or datetime.utcnow().date()
+    cover_days = lead_time_days + safety_days
+
+    rows = db.execute(
+        _reorder_statement(as_of, windows, cover_days, supplier_id)
+    ).mappings()
+
+    purchase_lists = {}
+    for row in rows:
+        velocities = {
+            f"{window}d": row[_sold_column(window)] / window
+            for window in windows
+        }
+        velocity = max(velocities.values())
+        in_stock = max(row["quantity"], 0)
+        days_to_stockout = in_stock / velocity
+        order_quantity = (
+            ceil(velocity * (cover_days + review_days)) - row["quantity"]
+        )
+
+        purchase = purchase_lists.setdefault(row["supplier_id"], {
+            "supplier_id": row["supplier_id"],
+            "supplier_name": row["supplier_name"],
+            "total_units": 0,
+            "items": [],
+        })
+        purchase["total_units"] += order_quantity
+        purchase["items"].append({
+            "product_id": row["id"],
+            "name": row["name"],
+            "sku": row["sku"],
+            "quantity": row["quantity"],
+            "velocity": {
+                key: round(value, 3) for key, value in velocities.items()
+            },
+            "days_to_stockout": round(days_to_stockout, 1),
+            "stockout_date": as_of + timedelta(days=int(days_to_stockout)),
+            "reorder_point": ceil(velocity * cover_days),
+            "order_quantity": order_quantity,
+        })
+
+    suppliers = sorted(purchase_lists.values(), key=lambda p: p["supplier_id"])
+    for purchase in suppliers:
+        purchase["items"].sort(
+            key=lambda item: (item["days_to_stockout"], item["product_id"])
+        )
+
+    return {
+        "as_of": as_of,
+        "windows": list(windows),
+        "lead_time_days": lead_time_days,
+        "safety_days": safety_days,
+        "review_days": review_days,
+        "count": sum(len(p["items"]) for p in suppliers),
+        "suppliers": suppliers,
+    }
+
+
+# -------------------------
+# VALUATION
+# -------------------------
+# GROUPING(category_id, supplier_id) of each result row; a set bit means
+# that column was rolled up
+VALUATION_LEVELS = {
+    0: "by_category_supplier",
+    1: "by_category",
+    2: "by_supplier",
+    3: "total",
+}
+
+
+def _valuation_measures():
+    return (
+        # widen before multiplying: price x quantity can pass 2^31
+        func.sum(cast(Product.price, BigInteger) * Product.quantity)
+        .label("value"),
+        func.sum(Product.quantity).label("units"),
+        func.count().label("skus"),
+    )
+
+
+def valuation_statement(dialect: str):
+    """
+    Stock value, units and SKU count for every category x supplier pair,
+    each category, each supplier and overall, in one statement.
+    """
+    category_id = Product.category_id
+    supplier_id = Product.supplier_id
+
+    if dialect != "sqlite":
+        # CUBE is ROLLUP over both orderings: it adds the per-supplier
+        # subtotals that ROLLUP(category_id, supplier_id) leaves out
+        return (
+            select(
+                category_id,
+                supplier_id,
+                func.grouping(category_id, supplier_id).label("level"),
+                *_valuation_measures()
+            )
+            .group_by(func.cube(category_id, supplier_id))
+        )
+
+    # SQLite has no grouping sets: aggregate the products once per pair,
+    # then roll that small result up with UNION ALL
+    pairs = (
+        select(
+            category_id,
+            supplier_id,
+            *_valuation_measures()
+        )
+        .group_by(category_id, supplier_id)
+        .cte("valuation_pairs")
+    )
+
+    def rollup(level: int):
+        keys = []
+        columns = []
+        for bit, column in ((2, pairs.c.category_id), (1, pairs.c.supplier_id)):
+            if level & bit:
+                columns.append(null().label(column.name))
+            else:
+                keys.append(column)
+                columns.append(column)
+        return (
+            select(
+                *columns,
+                literal(level).label("level"),
+                func.sum(pairs.c.value).label("value"),
+                func.sum(pairs.c.units).label("units"),
+                func.sum(pairs.c.skus).label("skus")
+            )
+            .group_by(*keys)
+        )
+
+    return union_all(*(rollup(level) for level in VALUATION_LEVELS))
+
+
+def _valuation(db: Session) -> dict:
+    dialect = db.get_bind().dialect.name
+
+    report = {name: [] for name in VALUATION_LEVELS.values()}
+    report["total"] = {"value": 0, "units": 0, "skus": 0}
+
+    for row in db.execute(valuation_statement(dialect)).mappings():
+        # PostgreSQL sums integers to numeric
+        measures = {
+            "value": int(row["value"] or 0),
+            "units": int(row["units"] or 0),
+            "skus": int(row["skus"] or 0),
+        }
+        level = VALUATION_LEVELS[row["level"]]
+        if level == "total":
+            report["total"] = measures
+            continue
+
+        keys = {}
+        if level != "by_supplier":
+            keys["category_id"] = row["category_id"]
+        if level != "by_category":
+            keys["supplier_id"] = row["supplier_id"]
+        report[level].append({**keys, **measures})
+
+    for level in ("by_category_supplier", "by_category", "by_supplier"):
+        report[level].sort(key=lambda group: -group["value"])
+
+    return report
+
+
+def inventory_valuation(db: Session) -> dict:
+    """
+    Inventory value (price x quantity) rolled up by category, supplier and
+    both, with a grand total.
+
+    The figures are cached until a write changes a product's price,
+    quantity, category or supplier, or adds or removes a product. Names
+    come from the category and supplier caches, so a rename shows up
+    without recomputing the totals.
+    """
+    report = reference_cache.get_or_load(
+        "valuation", "all", lambda: _valuation(db)
+    )
+
+    categories = {c["id"]: c["name"] for c in all_categories(db)}
+    suppliers = {s["id"]: s["name"] for s in all_suppliers(db)}
+
+    def named(group: dict) -> dict:
+        names = {}
+        if "category_id" in group:
+            names["category"] = categories.get(group["category_id"])
+        if "supplier_id" in group:
+            names["supplier"] = suppliers.get(group["supplier_id"])
+        return {**group, **names}
+
+    return {
+        "total": report["total"],
+        **{
+            level: [named(group) for group in report[level]]
+            for level in ("by_category", "by_supplier", "by_category_supplier")
+        },
+    }
@@ -0,0 +1,85 @@
+from datetime import date
+
+from sqlalchemy import delete, func, insert, select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+
+from app.core.versions import table_versions
+from app.models.sale import Sale
+from app.models.sales_rollup import SalesDailyRollup
+
+UPSERT_DIALECTS = {
+    "postgresql": postgresql.insert,
+    "sqlite": sqlite.insert,
+}
+
+
+def apply_sale_delta(
+    db: Session,
+    sale_date: date,
+    product_id: int,
+    quantity: int,
+    price: int
+) -> None:
+    """
+    Add (or with a negative quantity, remove) sold units to the day's
+    rollup row inside the caller's transaction. `price` is the sale's
+    unit_price, so reversing a sale removes exactly what it booked.
+    """
+    apply_sale_deltas(db, [{
+        "sale_date": sale_date,
+        "product_id": product_id,
+        "quantity_sold": quantity,
+        "revenue": quantity * price,
+    }])
+
+
+def apply_sale_deltas(db: Session, deltas: list[dict]) -> None:
+    """
+    Upsert many rollup deltas with one executemany. Each dict carries
+    sale_date, product_id, quantity_sold and revenue.
+    """
+    if not deltas:
+        return
+
+    upsert = UPSERT_DIALECTS[db.get_bind().dialect.name]
+    statement = upsert(SalesDailyRollup)
+    statement = statement.on_conflict_do_update(
+        index_elements=[
+            SalesDailyRollup.sale_date,
+            SalesDailyRollup.product_id
+        ],
+        set_={
+            "quantity_sold": (
+                SalesDailyRollup.quantity_sold
+                + statement.excluded.quantity_sold
+            ),
+            "revenue": SalesDailyRollup.revenue + statement.excluded.revenue,
+        }
+    )
+    db.execute(statement, deltas)
+
+
+def rebuild_rollup(db: Session) -> int:
+    """
+    Recompute sales_daily_rollup from scratch in one transaction.
+    """
+    sale_date = func.date(Sale.created_at)
+
+    db.execute(delete(SalesDailyRollup))
+    db.execute(
+        insert(SalesDailyRollup).from_select(
+            ["sale_date", "product_id", "quantity_sold", "revenue"],
+            select(
+                sale_date,
+                Sale.product_id,
+                func.sum(Sale.quantity_sold),
+                func.sum(Sale.quantity_sold * Sale.unit_price)
+            )
+            .group_by(sale_date, Sale.product_id)
+        )
+    )
+    db.commit()
+    table_versions.bump("sales")
+
+    return db.scalar(select(func.count()).select_from(SalesDailyRollup))
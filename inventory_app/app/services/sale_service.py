@@ -0,0 +1,310 @@
+from datetime import datetime
+
+from fastapi import HTTPException
+from sqlalchemy import case, delete, insert, select, tuple_, update
+from sqlalchemy.orm import Session
+
+from app.core.cache import reference_cache
+from app.core.pagination import DEFAULT_PAGE_SIZE, decode_cursor, fetch_page
+from app.core.versions import table_versions
+from app.models.sale import Sale
+from app.models.product import Product
+from app.services.rollup_service import apply_sale_delta, apply_sale_deltas
+from app.schemas.sale import SaleCreate
+
+
+# -------------------------
+# STOCK MOVEMENTS
+# -------------------------
+# Stock is changed with a single conditional UPDATE ... RETURNING so the
+# check and the decrement happen atomically in the database. Concurrent
+# sales of the same SKU can neither oversell nor lose an update, and no
+# row lock is held across the round trip.
+def _take_stock(db: Session, product_id: int, quantity: int):
+    return db.execute(
+        update(Product)
+        .where(Product.id == product_id, Product.quantity >= quantity)
+        .values(quantity=Product.quantity - quantity)
+        .returning(Product.id, Product.name, Product.price)
+        .execution_options(synchronize_session=False)
+    ).first()
+
+
+def _return_stock(db: Session, product_id: int, quantity: int):
+    return db.execute(
+        update(Product)
+        .where(Product.id == product_id)
+        .values(quantity=Product.quantity + quantity)
+        .returning(Product.id, Product.price)
+        .execution_options(synchronize_session=False)
+    ).first()
+
+
+def _stock_error(db: Session, product_id: int) -> HTTPException:
+    db.rollback()
+    if db.get(Product, product_id) is None:
+        return HTTPException(404, "Product not found")
+    return HTTPException(400, "Insufficient stock")
+
+
+def create_sale(db: Session, payload: SaleCreate) -> dict:
+    product = _take_stock(db, payload.product_id, payload.quantity_sold)
+    if not product:
+        raise _stock_error(db, payload.product_id)
+
+    sale = Sale(
+        product_id=payload.product_id,
+        quantity_sold=payload.quantity_sold,
+        unit_price=product.price
+    )
+
+    db.add(sale)
+    db.flush()
+
+    apply_sale_delta(
+        db,
+        sale.created_at.date(),
+        product.id,
+        sale.quantity_sold,
+        product.price
+    )
+
+    db.commit()
+    table_versions.bump("sales", "products")
+    reference_cache.invalidate("valuation")
+    db.refresh(sale)
+
+    return {
+        "id": sale.id,
+        "product_id": product.id,
+        "product_name": product.name,
+        "unit_price": sale.unit_price,
+        "quantity_sold": sale.quantity_sold,
+        "created_at": sale.created_at,
+    }
+
+
+def list_sales(
+    db: Session,
+    limit: int = DEFAULT_PAGE_SIZE,
+    cursor: str | None = None
+) -> tuple[list[dict], str | None]:
+    query = (
+        db.query(Sale, Product.id, Product.name)
+        .join(Product, Sale.product_id == Product.id)
+    )
+
+    # (created_at, id) keyset: id breaks ties between sales in the same tick
+    if cursor:
+        last_created_at, last_id = decode_cursor(
+            cursor, datetime.fromisoformat, int
+        )
+        query = query.filter(
+            tuple_(Sale.created_at, Sale.id) < (last_created_at, last_id)
+        )
+
+    sales, next_cursor = fetch_page(
+        query.order_by(Sale.created_at.desc(), Sale.id.desc()),
+        limit,
+        lambda row: (row[0].created_at, row[0].id)
+    )
+
+    result = []
+    for sale, product_id, product_name in sales:
+        result.append({
+            "id": sale.id,
+            "product_id": product_id,
+            "product_name": product_name,
+            "unit_price": sale.unit_price,
+            "quantity_sold": sale.quantity_sold,
+            "created_at": sale.created_at,
+        })
+
+    return result, next_cursor
+
+
+def update_sale(db: Session, sale_id: int, payload: SaleCreate) -> Sale:
+    # A no-op UPDATE ... RETURNING claims the sale before its quantity is
+    # read: a row lock on PostgreSQL and the write lock on SQLite, which
+    # ignores FOR UPDATE. Two edits of one sale cannot both restore its
+    # stock.
+    sale = db.execute(
+        update(Sale)
+        .where(Sale.id == sale_id)
+        .values(quantity_sold=Sale.quantity_sold)
+        .returning(
+            Sale.product_id,
+            Sale.quantity_sold,
+            Sale.unit_price,
+            Sale.created_at
+        )
+        .execution_options(synchronize_session=False)
+    ).first()
+    if not sale:
+        raise HTTPException(404, "Sale not found")
+
+    # restore previous stock, then take the new quantity
+    _return_stock(db, sale.product_id, sale.quantity_sold)
+
+    product = _take_stock(db, payload.product_id, payload.quantity_sold)
+    if not product:
+        raise _stock_error(db, payload.product_id)
+
+    # a quantity edit keeps the price the sale was made at; moving the
+    # sale to another product sells that one at its current price
+    unit_price = (
+        sale.unit_price if payload.product_id == sale.product_id
+        else product.price
+    )
+
+    # reverse exactly what the sale booked, then book the edited sale
+    sale_date = sale.created_at.date()
+    apply_sale_delta(
+        db, sale_date, sale.product_id, -sale.quantity_sold, sale.unit_price
+    )
+    apply_sale_delta(
+        db, sale_date, product.id, payload.quantity_sold, unit_price
+    )
+
+    db.execute(
+        update(Sale)
+        .where(Sale.id == sale_id)
+        .values(
+            product_id=payload.product_id,
+            quantity_sold=payload.quantity_sold,
+            unit_price=unit_price
+        )
+        .execution_options(synchronize_session=False)
+    )
+
+    db.commit()
+    table_versions.bump("sales", "products")
+    reference_cache.invalidate("valuation")
+
+    return db.get(Sale, sale_id)
+
+
+def delete_sale(db: Session, sale_id: int) -> None:
+    # DELETE ... RETURNING claims the sale atomically, so a concurrent
+    # delete of the same sale cannot restore its stock twice
+    sale = db.execute(
+        delete(Sale)
+        .where(Sale.id == sale_id)
+        .returning(
+            Sale.product_id,
+            Sale.quantity_sold,
+            Sale.unit_price,
+            Sale.created_at
+        )
+        .execution_options(synchronize_session=False)
+    ).first()
+    if not sale:
+        raise HTTPException(404, "Sale not found")
+
+    _return_stock(db, sale.product_id, sale.quantity_sold)
+
+    apply_sale_delta(
+        db,
+        sale.created_at.date(),
+        sale.product_id,
+        -sale.quantity_sold,
+        sale.unit_price
+    )
+
+    db.commit()
+    table_versions.bump("sales", "products")
+    reference_cache.invalidate("valuation")
+
+
+# -------------------------
+# BULK INGESTION
+# -------------------------
+MAX_BULK_SALES = 20_000
+BULK_BATCH_SIZE = 500
+
+
+def bulk_create_sales(db: Session, lines: list[SaleCreate]) -> dict:
+    """
+    Record many sale lines (e.g. a POS end-of-shift sync) in one commit.
+
+    Quantities are combined per product and stock is decremented with one
+    conditional UPDATE per batch of products. A product whose combined
+    quantity exceeds its stock is left untouched and all of its lines are
+    rejected.
+    """
+    if len(lines) > MAX_BULK_SALES:
+        raise HTTPException(413, f"At most {MAX_BULK_SALES} lines per request")
+
+    totals: dict[int, int] = {}
+    for line in lines:
+        totals[line.product_id] = (
+            totals.get(line.product_id, 0) + line.quantity_sold
+        )
+
+    prices: dict[int, int] = {}
+    product_ids = list(totals)
+
+    for start in range(0, len(product_ids), BULK_BATCH_SIZE):
+        batch = {
+            product_id: totals[product_id]
+            for product_id in product_ids[start:start + BULK_BATCH_SIZE]
+        }
+        needed = case(batch, value=Product.id)
+
+        decremented = db.execute(
+            update(Product)
+            .where(Product.id.in_(batch), Product.quantity >= needed)
+            .values(quantity=Product.quantity - needed)
+            .returning(Product.id, Product.price)
+            .execution_options(synchronize_session=False)
+        )
+        prices.update(decremented.tuples().all())
+
+    failed = set(totals) - set(prices)
+    existing = set()
+    if failed:
+        existing = set(db.scalars(
+            select(Product.id).where(Product.id.in_(failed))
+        ))
+
+    now = datetime.utcnow()
+    accepted = []
+    rejected = []
+
+    for index, line in enumerate(lines):
+        if line.product_id in prices:
+            accepted.append({
+                "product_id": line.product_id,
+                "quantity_sold": line.quantity_sold,
+                "unit_price": prices[line.product_id],
+                "created_at": now,
+            })
+        else:
+            rejected.append({
+                "index": index,
+                "product_id": line.product_id,
+                "error": (
+                    "Insufficient stock" if line.product_id in existing
+                    else "Product not found"
+                ),
+            })
+
+    if accepted:
+        db.execute(insert(Sale), accepted)
+
+    apply_sale_deltas(db, [
+        {
+            "sale_date": now.date(),
+            "product_id": product_id,
+            "quantity_sold": totals[product_id],
+            "revenue": totals[product_id] * price,
+        }
+        for product_id, price in prices.items()
+    ])
+
+    db.commit()
+    table_versions.bump("sales", "products")
+    reference_cache.invalidate("valuation")
+
+    return {"created": len(accepted), "rejected": rejected}
+
@@ -0,0 +1,274 @@
+"""
+Substring search that an index can answer.
+
+A leading-wildcard ILIKE cannot use a B-tree, so each backend gets its own
+index: pg_trgm GIN indexes on PostgreSQL (which make ILIKE '%x%'
+index-backed) and FTS5 trigram shadow tables, kept in sync by triggers, on
+SQLite. Any other dialect falls back to a plain ILIKE scan.
+"""
+import os
+
+from sqlalchemy import (
+    Column,
+    Integer,
+    MetaData,
+    Table,
+    case,
+    func,
+    literal_column,
+    null,
+    or_,
+    select,
+    text,
+)
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import Session
+
+from app.core.pagination import cursor_values, decode_cursor, fetch_page
+from app.models.category import Category
+from app.models.product import Product
+from app.models.supplier import Supplier
+
+# table name -> searchable columns
+SEARCHABLE = {
+    "products": ("name", "sku"),
+    "categories": ("name",),
+    "suppliers": ("name",),
+}
+
+MODELS = {
+    "products": Product,
+    "categories": Category,
+    "suppliers": Supplier,
+}
+
+# the trigram tokenizer cannot match shorter terms
+MIN_FTS_TERM = 3
+
+# terms matching more rows than this are listed by id instead of ranked
+RANKED_SEARCH_LIMIT = int(os.getenv("RANKED_SEARCH_LIMIT", "500"))
+
+_fts_metadata = MetaData()
+FTS_TABLES = {
+    table: Table(
+        f"{table}_fts",
+        _fts_metadata,
+        Column("rowid", Integer, primary_key=True),
+        *(Column(name) for name in columns)
+    )
+    for table, columns in SEARCHABLE.items()
+}
+
+
+# -------------------------
+# INDEX SETUP
+# -------------------------
+def _install_postgresql(conn) -> None:
+    conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+    for table, columns in SEARCHABLE.items():
+        for column in columns:
+            conn.execute(text(
+                f"CREATE INDEX IF NOT EXISTS ix_{table}_{column}_trgm "
+                f"ON {table} USING gin ({column} gin_trgm_ops)"
+            ))
+
+
+def _install_sqlite(conn) -> None:
+    for table, columns in SEARCHABLE.items():
+        fts = f"{table}_fts"
+        cols = ", ".join(columns)
+        new = ", ".join(f"new.{c}" for c in columns)
+        old = ", ".join(f"old.{c}" for c in columns)
+
+        exists = conn.execute(
+            text("SELECT 1 FROM sqlite_master WHERE name = :name"),
+            {"name": fts}
+        ).first()
+
+        conn.execute(text(
+            f"CREATE VIRTUAL TABLE IF NOT EXISTS {fts} USING fts5("
+            f"{cols}, content='{table}', content_rowid='id', "
+            f"tokenize='trigram')"
+        ))
+        conn.execute(text(
+            f"CREATE TRIGGER IF NOT EXISTS {fts}_ai AFTER INSERT ON {table} "
+            f"BEGIN INSERT INTO {fts}(rowid, {cols}) VALUES (new.id, {new}); END"
+        ))
+        conn.execute(text(
+            f"CREATE TRIGGER IF NOT EXISTS {fts}_ad AFTER DELETE ON {table} "
+            f"BEGIN INSERT INTO {fts}({fts}, rowid, {cols}) "
+            f"VALUES ('delete', old.id, {old}); END"
+        ))
+        conn.execute(text(
+            f"CREATE TRIGGER IF NOT EXISTS {fts}_au AFTER UPDATE ON {table} "
+            f"BEGIN INSERT INTO {fts}({fts}, rowid, {cols}) "
+            f"VALUES ('delete', old.id, {old}); "
+            f"INSERT INTO {fts}(rowid, {cols}) VALUES (new.id, {new}); END"
+        ))
+
+        if not exists:
+            # index rows that were there before the shadow table
+            conn.execute(text(f"INSERT INTO {fts}({fts}) VALUES ('rebuild')"))
+
+
+def install_search_indexes(conn: Connection) -> None:
+    if conn.dialect.name == "postgresql":
+        _install_postgresql(conn)
+    elif conn.dialect.name == "sqlite":
+        _install_sqlite(conn)
+
+
+def drop_search_indexes(conn: Connection, table: str) -> None:
+    """
+    Remove the search index for `table` ahead of a bulk load;
+    `install_search_indexes` recreates and repopulates it afterwards.
+    """
+    if conn.dialect.name == "postgresql":
+        for column in SEARCHABLE[table]:
+            conn.execute(text(f"DROP INDEX IF EXISTS ix_{table}_{column}_trgm"))
+    elif conn.dialect.name == "sqlite":
+        fts = f"{table}_fts"
+        for suffix in ("ai", "ad", "au"):
+            conn.execute(text(f"DROP TRIGGER IF EXISTS {fts}_{suffix}"))
+        conn.execute(text(f"DROP TABLE IF EXISTS {fts}"))
+
+
+# -------------------------
+# QUERYING
+# -------------------------
+def _prefix_boost(columns, term: str):
+    # rows where a column starts with the term rank above mid-string hits
+    return case((or_(*(c.ilike(f"{term}%") for c in columns)), 1.0), else_=0.0)
+
+
+def _uses_fts(dialect: str, term: str) -> bool:
+    return dialect == "sqlite" and len(term) >= MIN_FTS_TERM
+
+
+def _fts_match(table: str, term: str):
+    fts = FTS_TABLES[table]
+    phrase = '"' + term.replace('"', '""') + '"'
+    return fts, literal_column(fts.name).op("MATCH")(phrase)
+
+
+def _match_filter(table: str, term: str):
+    columns = [getattr(MODELS[table], name) for name in SEARCHABLE[table]]
+    return or_(*(c.ilike(f"%{term}%") for c in columns))
+
+
+def apply_search(query, dialect: str, table: str, term: str, hits=None):
+    """
+    Filter an ORM query on `table` to rows matching `term` and return it
+    with a relevance expression (higher is better) to order by. `hits`,
+    the matching ids when already known, replaces the ILIKE filter.
+    """
+    model = MODELS[table]
+    columns = [getattr(model, name) for name in SEARCHABLE[table]]
+    boost = _prefix_boost(columns, term)
+
+    if _uses_fts(dialect, term):
+        fts, match = _fts_match(table, term)
+        query = query.join(fts, fts.c.rowid == model.id).filter(match)
+        # bm25() is lower-is-better; negate so every backend sorts DESC
+        return query, boost - func.bm25(literal_column(fts.name))
+
+    if hits is not None:
+        query = query.filter(model.id.in_(hits))
+    else:
+        query = query.filter(_match_filter(table, term))
+
+    if dialect == "postgresql":
+        similarity = func.greatest(*(func.similarity(c, term) for c in columns))
+        return query, boost + similarity
+
+    return query, boost
+
+
+def filter_matches(query, dialect: str, table: str, term: str):
+    """
+    Filter an ORM query on `table` to rows matching `term` and return it
+    with the id column to order and page by. On SQLite that is the FTS
+    rowid, which FTS5 walks in descending order without sorting its hits.
+    """
+    model = MODELS[table]
+    if _uses_fts(dialect, term):
+        fts, match = _fts_match(table, term)
+        return query.join(fts, fts.c.rowid == model.id).filter(match), fts.c.rowid
+    return query.filter(_match_filter(table, term)), model.id
+
+
+def bounded_matches(
+    db: Session, dialect: str, table: str, term: str
+) -> list[int] | None:
+    """
+    Ids of the rows matching `term`, or None when there are more than
+    RANKED_SEARCH_LIMIT; never reads further than that.
+    """
+    if _uses_fts(dialect, term):
+        fts, match = _fts_match(table, term)
+        hits = select(fts.c.rowid).where(match)
+    else:
+        hits = select(MODELS[table].id).where(_match_filter(table, term))
+    ids = db.scalars(hits.limit(RANKED_SEARCH_LIMIT + 1)).all()
+    return ids if len(ids) <= RANKED_SEARCH_LIMIT else None
+
+
+def search_page(
+    query,
+    dialect: str,
+    table: str,
+    term: str,
+    limit: int,
+    cursor: str | None
+) -> tuple[list, str | None]:
+    """
+    Relevance-ordered keyset page: ORDER BY rank DESC, id DESC with the
+    cursor carrying (rank, id) of the last row.
+
+    Ranking scores every match before the first row comes back, so a term
+    matching more than RANKED_SEARCH_LIMIT rows is listed newest first
+    instead, like the unfiltered list, with an (id,) cursor. The cursor's
+    shape keeps later pages in the mode the first page picked.
+
+    `query` selects plain columns including `id`; the returned rows carry an
+    extra trailing `rank` column (None when listed by id).
+    """
+    model = MODELS[table]
+
+    hits = None
+    if cursor:
+        ranked = len(cursor_values(cursor)) == 2
+    else:
+        hits = bounded_matches(query.session, dialect, table, term)
+        ranked = hits is not None
+
+    if not ranked:
+        query, row_id = filter_matches(query, dialect, table, term)
+        if cursor:
+            last_id, = decode_cursor(cursor, int)
+            query = query.filter(row_id < last_id)
+        return fetch_page(
+            query.add_columns(null().label("rank")).order_by(row_id.desc()),
+            limit,
+            lambda row: (row.id,)
+        )
+
+    query, rank = apply_search(query, dialect, table, term, hits)
+
+    if cursor:
+        last_rank, last_id = decode_cursor(cursor, float, int)
+        query = query.filter(
+            or_(
+                rank < last_rank,
+                (rank == last_rank) & (model.id < last_id)
+            )
+        )
+
+    rows, next_cursor = fetch_page(
+        query.add_columns(rank.label("rank"))
+        .order_by(rank.desc(), model.id.desc()),
+        limit,
+        lambda row: (row.rank, row.id)
+    )
+
+    return rows, next_cursor
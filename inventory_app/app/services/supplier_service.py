@@ -0,0 +1,102 @@
+from fastapi import HTTPException
+from sqlalchemy import select
+from sqlalchemy.engine import Row
+from sqlalchemy.orm import Session
+
+from app.core.cache import reference_cache
+from app.core.pagination import DEFAULT_PAGE_SIZE, decode_cursor, fetch_page
+from app.core.responses import schema_columns
+from app.core.versions import table_versions
+from app.models.supplier import Supplier
+from app.schemas.supplier import SupplierCreate, SupplierOut
+from app.services.search_service import search_page
+
+
+# list endpoints select exactly the response fields, no ORM entities
+LIST_COLUMNS = schema_columns(Supplier, SupplierOut)
+
+
+def create_supplier(db: Session, payload: SupplierCreate) -> Supplier:
+    if db.query(Supplier).filter(Supplier.name.ilike(payload.name)).first():
+        raise HTTPException(status_code=400, detail="Supplier already exists")
+
+    supplier = Supplier(name=payload.name)
+    db.add(supplier)
+    db.commit()
+    table_versions.bump("suppliers")
+    reference_cache.invalidate("suppliers")
+    db.refresh(supplier)
+    return supplier
+
+
+def all_suppliers(db: Session) -> list[dict]:
+    """
+    Every supplier as plain dicts, newest first, served from the
+    reference cache.
+    """
+    return reference_cache.get_or_load(
+        "suppliers",
+        "all",
+        lambda: [
+            {"id": s.id, "name": s.name}
+            for s in db.query(Supplier).order_by(Supplier.id.desc())
+        ]
+    )
+
+
+def supplier_exists(db: Session, supplier_id: int) -> bool:
+    ids = reference_cache.get_or_load(
+        "suppliers",
+        "ids",
+        lambda: frozenset(db.scalars(select(Supplier.id)))
+    )
+    # a miss may just be a supplier created in another worker moments ago
+    return supplier_id in ids or db.get(Supplier, supplier_id) is not None
+
+
+def list_suppliers(
+    db: Session,
+    search: str | None = None,
+    limit: int = DEFAULT_PAGE_SIZE,
+    cursor: str | None = None
+) -> tuple[list[Row], str | None]:
+    query = db.query(*LIST_COLUMNS)
+    if search:
+        dialect = db.get_bind().dialect.name
+        return search_page(query, dialect, "suppliers", search, limit, cursor)
+    if cursor:
+        last_id, = decode_cursor(cursor, int)
+        query = query.filter(Supplier.id < last_id)
+    return fetch_page(
+        query.order_by(Supplier.id.desc()),
+        limit,
+        lambda s: (s.id,)
+    )
+
+
+def update_supplier(
+    db: Session,
+    supplier_id: int,
+    payload: SupplierCreate
+) -> Supplier:
+    supplier = db.get(Supplier, supplier_id)
+    if not supplier:
+        raise HTTPException(status_code=404, detail="Supplier not found")
+
+    supplier.name = payload.name
+    db.commit()
+    table_versions.bump("suppliers")
+    reference_cache.invalidate("suppliers")
+    db.refresh(supplier)
+    return supplier
+
+
+def delete_supplier(db: Session, supplier_id: int) -> None:
+    supplier = db.get(Supplier, supplier_id)
+    if not supplier:
+        raise HTTPException(status_code=404, detail="Supplier not found")
+
+    db.delete(supplier)
+    db.commit()
+    table_versions.bump("suppliers")
+    reference_cache.invalidate("suppliers")
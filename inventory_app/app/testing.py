@@ -0,0 +1,67 @@
+"""
+Query-budget assertions for tests, so an added N+1 fails the suite:
+
+    response = client.put("/api/sales/1", json=payload, headers=auth)
+    assert_query_budget(response, 7)
+
+    with assert_max_queries(0):
+        client.get("/api/reports/valuation", headers=auth)  # cached
+
+Both count statements on the primary and the replica.
+"""
+import re
+from contextlib import contextmanager
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+_DB_TIMING = re.compile(r'(?:^|,)\s*db;[^,]*desc="(\d+) queries"')
+
+
+def response_query_count(response) -> int:
+    """Statement count from the response's Server-Timing header."""
+    header = response.headers.get("server-timing", "")
+    match = _DB_TIMING.search(header)
+    if match is None:
+        raise AssertionError(f"no db Server-Timing entry in {header!r}")
+    return int(match.group(1))
+
+
+def assert_query_budget(response, max_queries: int) -> None:
+    count = response_query_count(response)
+    request = response.request
+    assert count <= max_queries, (
+        f"{request.method} {request.url.path} ran {count} queries, "
+        f"budget is {max_queries}"
+    )
+
+
+@contextmanager
+def assert_max_queries(max_queries: int, engines: list[Engine] | None = None):
+    """
+    Fail if the block runs more than `max_queries` statements on `engines`
+    (the app's primary and replica engines by default), listing them in the
+    message. Counts every thread, so it also covers calls made through
+    TestClient.
+    """
+    if engines is None:
+        from app.core.database import ENGINES
+        engines = list(ENGINES.values())
+
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    for engine in engines:
+        event.listen(engine, "before_cursor_execute", record)
+    try:
+        yield statements
+    finally:
+        for engine in engines:
+            event.remove(engine, "before_cursor_execute", record)
+
+    assert len(statements) <= max_queries, (
+        f"{len(statements)} queries, budget is {max_queries}:\n"
+        + "\n".join(f"  {i}. {s}" for i, s in enumerate(statements, 1))
+    )
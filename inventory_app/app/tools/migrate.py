@@ -0,0 +1,36 @@
+"""
+Apply pending schema migrations.
+
+    python -m app.tools.migrate          # upgrade
+    python -m app.tools.migrate --list   # show status
+"""
+import argparse
+
+from app.core.database import engine
+from app.core.migrations import (
+    applied_migrations,
+    available_migrations,
+    run_migrations,
+)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Apply schema migrations")
+    parser.add_argument("--list", action="store_true", help="show status only")
+    args = parser.parse_args()
+
+    if args.list:
+        done = applied_migrations(engine)
+        for version in available_migrations():
+            print(f"[{'x' if version in done else ' '}] {version}")
+        return
+
+    applied = run_migrations(engine)
+    for version in applied:
+        print(f"applied {version}")
+    if not applied:
+        print("database is up to date")
+
+
+if __name__ == "__main__":
+    main()
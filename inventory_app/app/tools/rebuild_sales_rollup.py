@@ -0,0 +1,24 @@
+"""
+Rebuild the sales_daily_rollup table from the sales table.
+
+    python -m app.tools.rebuild_sales_rollup
+"""
+from app.core.database import SessionLocal, engine
+from app.core.migrations import run_migrations
+from app.services.rollup_service import rebuild_rollup
+
+
+def main() -> None:
+    run_migrations(engine)
+
+    db = SessionLocal()
+    try:
+        rows = rebuild_rollup(db)
+    finally:
+        db.close()
+
+    print(f"sales_daily_rollup rebuilt: {rows} rows")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,540 @@
+"""
+Generate a large synthetic dataset with production-like skew.
+
+- product popularity follows a Zipf law, so a few SKUs sell most units
+- sale timestamps follow weekly and yearly seasonality plus a growth
+  trend, with business-hours peaks
+- stock is sized from each product's recent sales velocity, so best
+  sellers carry more units and a few items are out of stock
+
+Rows are generated in vectorised NumPy batches and bulk loaded in one
+transaction (COPY on PostgreSQL, executemany on SQLite), with secondary
+and search indexes dropped for the load and rebuilt afterwards. Output
+is deterministic for a given --seed.
+
+    python -m app.tools.seed --products 1000000 --sales 20000000 --truncate
+"""
+import argparse
+import io
+import queue
+import threading
+import time
+from datetime import date
+from itertools import chain
+
+import numpy as np
+from sqlalchemy import func, select, text
+
+from app.core.cache import ALL_NAMESPACES, reference_cache
+from app.core.database import SessionLocal, engine
+from app.core.migrations import run_migrations
+from app.core.versions import table_versions
+from app.models.category import Category
+from app.models.product import Product
+from app.models.sale import Sale
+from app.models.sales_rollup import SalesDailyRollup
+from app.models.supplier import Supplier
+from app.services.rollup_service import rebuild_rollup
+from app.services.search_service import (
+    SEARCHABLE,
+    drop_search_indexes,
+    install_search_indexes,
+)
+
+# batches are part of the random stream, so this is fixed, not an option
+BATCH_ROWS = 500_000
+
+RECENT_DAYS = 28
+STOCKOUT_SHARE = 0.03
+
+DEPARTMENTS = [
+    "Electronics", "Home", "Kitchen", "Garden", "Toys", "Sports", "Books",
+    "Clothing", "Shoes", "Beauty", "Health", "Grocery", "Office", "Pets",
+    "Automotive", "Tools", "Music", "Baby", "Jewelry", "Outdoors",
+]
+SUPPLIER_WORDS = [
+    "Northwind", "Contoso", "Acme", "Globex", "Initech", "Umbrella",
+    "Vandelay", "Stark", "Wayne", "Hooli", "Soylent", "Tyrell",
+]
+SUPPLIER_KINDS = ["Trading", "Supply", "Wholesale", "Imports", "Goods"]
+ADJECTIVES = [
+    "steel", "cotton", "wireless", "organic", "compact", "premium", "mini",
+    "ceramic", "bamboo", "carbon", "glass", "leather", "smart", "solar",
+    "thermal", "vintage", "hybrid", "digital", "classic", "portable",
+]
+NOUNS = [
+    "kettle", "charger", "lamp", "bottle", "jacket", "speaker", "mug",
+    "router", "blender", "backpack", "keyboard", "camera", "drill", "towel",
+    "chair", "headphones", "pan", "tent", "watch", "scarf",
+]
+PRODUCT_NAMES = np.array([f"{a} {n}" for a in ADJECTIVES for n in NOUNS])
+
+# Monday .. Sunday
+WEEKDAY_WEIGHTS = np.array([1.0, 0.95, 0.95, 1.0, 1.15, 1.35, 1.2])
+HOUR_WEIGHTS = np.array([
+    0.1, 0.05, 0.05, 0.05, 0.05, 0.1, 0.3, 0.6, 1.0, 1.3, 1.6, 1.9,
+    2.0, 1.8, 1.5, 1.4, 1.5, 1.8, 1.9, 1.6, 1.2, 0.8, 0.4, 0.2,
+])
+
+US_PER_HOUR = 3_600_000_000
+
+# rows per multi-row INSERT on SQLite (3 columns stays far below the
+# bound-parameter limit; larger statements stop paying off)
+SQLITE_ROWS_PER_INSERT = 100
+
+
+# -------------------------
+# DISTRIBUTIONS
+# -------------------------
+def _rng(seed: int, *stream: int) -> np.random.Generator:
+    return np.random.default_rng([seed, *stream])
+
+
+def _cdf(weights: np.ndarray) -> np.ndarray:
+    cdf = np.cumsum(weights, dtype=np.float64)
+    return cdf / cdf[-1]
+
+
+def _sample(cdf: np.ndarray, rng: np.random.Generator, size: int) -> np.ndarray:
+    """0-based indices drawn with the probabilities behind `cdf`."""
+    return np.searchsorted(cdf, rng.random(size), side="right")
+
+
+def zipf_cdf(n: int, exponent: float, rng: np.random.Generator) -> np.ndarray:
+    weights = 1.0 / np.arange(1, n + 1, dtype=np.float64) ** exponent
+    # popularity rank is unrelated to id order
+    rng.shuffle(weights)
+    return _cdf(weights)
+
+
+def zipf_ranks(
+    n: int, exponent: float, rng: np.random.Generator, size: int
+) -> np.ndarray:
+    """
+    0-based popularity ranks from the continuous (bounded power law)
+    approximation of Zipf: inverse-CDF in closed form, so sampling cost
+    does not grow with n the way a CDF search over millions of items does.
+    """
+    u = rng.random(size)
+    if exponent == 1.0:
+        x = np.exp(u * np.log(n + 1))
+    else:
+        a = 1.0 - exponent
+        x = ((np.power(n + 1.0, a) - 1.0) * u + 1.0) ** (1.0 / a)
+    return np.minimum(x.astype(np.int64) - 1, n - 1)
+
+
+def day_cdf(start: date, days: int) -> np.ndarray:
+    dates = np.datetime64(start, "D") + np.arange(days)
+    day_of_year = (dates - dates.astype("datetime64[Y]")).astype(np.int64)
+    # 1970-01-01 was a Thursday
+    weekday = (dates.astype(np.int64) + 3) % 7
+
+    yearly = 1 + 0.35 * np.cos(2 * np.pi * (day_of_year - 350) / 365.25)
+    trend = 1 + 0.25 * np.arange(days) / days
+    return _cdf(WEEKDAY_WEIGHTS[weekday] * yearly * trend)
+
+
+def _batches(total: int):
+    for index, offset in enumerate(range(0, total, BATCH_ROWS)):
+        yield index, offset, min(BATCH_ROWS, total - offset)
+
+
+# Fixed-width text is written straight into a matrix of UCS4 code points
+# and viewed as a numpy str array: far cheaper than per-row formatting.
+def _text(width: int, size: int) -> np.ndarray:
+    return np.empty((size, width), dtype=np.uint32)
+
+
+def _put(out: np.ndarray, position: int, text: str) -> None:
+    out[:, position:position + len(text)] = [ord(c) for c in text]
+
+
+def _put_digits(out: np.ndarray, position: int, values, width: int) -> None:
+    for offset in range(width):
+        out[:, position + width - 1 - offset] = ord("0") + values // 10**offset % 10
+
+
+def _as_str(out: np.ndarray) -> np.ndarray:
+    return out.view(f"U{out.shape[1]}").ravel()
+
+
+def _chars(strings: np.ndarray) -> np.ndarray:
+    """Equal-length strings -> (n, width) code point matrix."""
+    return strings.view(np.uint32).reshape(len(strings), -1)
+
+
+# lookup tables for timestamp text: "HH:MM:SS." per second of the day and
+# "000".."999" for the microsecond digits
+_seconds = np.arange(86_400)
+CLOCK_CHARS = _text(9, len(_seconds))
+_put_digits(CLOCK_CHARS, 0, _seconds // 3600, 2)
+_put(CLOCK_CHARS, 2, ":")
+_put_digits(CLOCK_CHARS, 3, _seconds // 60 % 60, 2)
+_put(CLOCK_CHARS, 5, ":")
+_put_digits(CLOCK_CHARS, 6, _seconds % 60, 2)
+_put(CLOCK_CHARS, 8, ".")
+THOUSANDS_CHARS = _text(3, 1000)
+_put_digits(THOUSANDS_CHARS, 0, np.arange(1000), 3)
+
+
+class Generator:
+
+    def __init__(self, args):
+        self.args = args
+        setup = _rng(args.seed, 0)
+        self.product_order = setup.permutation(args.products)
+        self.category_cdf = zipf_cdf(args.categories, 0.8, setup)
+        self.supplier_cdf = zipf_cdf(args.suppliers, 0.8, setup)
+        self.day_cdf = day_cdf(args.start, args.days)
+        self.hour_cdf = _cdf(HOUR_WEIGHTS)
+        dates = np.datetime64(args.start, "D") + np.arange(args.days)
+        self.date_chars = _chars(
+            np.char.add(np.datetime_as_string(dates), " ").astype("U11")
+        )
+
+    def categories(self) -> dict:
+        n = self.args.categories
+        return {
+            "id": np.arange(1, n + 1),
+            "name": np.array([
+                DEPARTMENTS[i % len(DEPARTMENTS)]
+                + (f" {i // len(DEPARTMENTS) + 1}" if i >= len(DEPARTMENTS) else "")
+                for i in range(n)
+            ]),
+        }
+
+    def suppliers(self) -> dict:
+        n = self.args.suppliers
+        combos = len(SUPPLIER_WORDS) * len(SUPPLIER_KINDS)
+        return {
+            "id": np.arange(1, n + 1),
+            "name": np.array([
+                f"{SUPPLIER_WORDS[i % len(SUPPLIER_WORDS)]} "
+                f"{SUPPLIER_KINDS[i // len(SUPPLIER_WORDS) % len(SUPPLIER_KINDS)]}"
+                + (f" {i // combos + 1}" if i >= combos else "")
+                for i in range(n)
+            ]),
+        }
+
+    def _sale_draws(self, index: int, size: int):
+        rng = _rng(self.args.seed, 2, index)
+        rank = zipf_ranks(self.args.products, self.args.zipf, rng, size)
+        product_id = self.product_order[rank] + 1
+        quantity = np.minimum(rng.geometric(0.55, size), 20)
+        day = _sample(self.day_cdf, rng, size)
+        return rng, product_id, quantity, day
+
+    def stock(self) -> np.ndarray:
+        """
+        Units on hand per product id, sized to its last RECENT_DAYS of
+        sales. Replays the sale draws without building timestamps.
+        """
+        recent = np.zeros(self.args.products + 1)
+        cutoff = self.args.days - RECENT_DAYS
+        for index, _, size in _batches(self.args.sales):
+            _, product_id, quantity, day = self._sale_draws(index, size)
+            mask = day >= cutoff
+            recent += np.bincount(
+                product_id[mask], weights=quantity[mask], minlength=len(recent)
+            )
+
+        rng = _rng(self.args.seed, 3)
+        velocity = recent / RECENT_DAYS
+        cover_days = rng.gamma(2.0, 10.0, len(recent))
+        stock = np.ceil(velocity * cover_days)
+        idle = velocity == 0
+        stock[idle] = rng.integers(0, 50, int(idle.sum()))
+        stock[rng.random(len(recent)) < STOCKOUT_SHARE] = 0
+        return np.maximum(stock, self.args.min_stock).astype(np.int64)
+
+    def _product_draws(self, index: int, size: int):
+        rng = _rng(self.args.seed, 1, index)
+        name = rng.integers(0, len(PRODUCT_NAMES), size)
+        price = np.clip(
+            np.rint(rng.lognormal(3.2, 1.0, size)), 1, 50_000
+        ).astype(np.int64)
+        return rng, name, price
+
+    def prices(self) -> np.ndarray:
+        """
+        Price per product id, for the sales' unit_price. Replays the
+        product draws without building names or SKUs.
+        """
+        prices = np.zeros(self.args.products + 1, dtype=np.int64)
+        for index, offset, size in _batches(self.args.products):
+            _, _, price = self._product_draws(index, size)
+            prices[offset + 1:offset + size + 1] = price
+        return prices
+
+    def products(self, stock: np.ndarray):
+        for index, offset, size in _batches(self.args.products):
+            rng, name, price = self._product_draws(index, size)
+            ids = np.arange(offset + 1, offset + size + 1)
+            sku = _text(12, size)
+            _put(sku, 0, "SKU-")
+            _put_digits(sku, 4, ids, 8)
+            yield {
+                "id": ids,
+                "name": PRODUCT_NAMES[name],
+                "sku": _as_str(sku),
+                "price": price,
+                "quantity": stock[ids],
+                "category_id": _sample(self.category_cdf, rng, size) + 1,
+                "supplier_id": _sample(self.supplier_cdf, rng, size) + 1,
+            }
+
+    def timestamps(self, day: np.ndarray, micros: np.ndarray) -> np.ndarray:
+        """`YYYY-MM-DD HH:MM:SS.ffffff`, the text form both backends accept."""
+        seconds, fraction = np.divmod(micros, 1_000_000)
+        out = _text(26, len(day))
+        out[:, :11] = self.date_chars[day]
+        out[:, 11:20] = CLOCK_CHARS[seconds]
+        out[:, 20:23] = THOUSANDS_CHARS[fraction // 1000]
+        out[:, 23:26] = THOUSANDS_CHARS[fraction % 1000]
+        return _as_str(out)
+
+    def sales(self, prices: np.ndarray):
+        for index, _, size in _batches(self.args.sales):
+            rng, product_id, quantity, day = self._sale_draws(index, size)
+            hour = _sample(self.hour_cdf, rng, size)
+            micros = hour * US_PER_HOUR + rng.integers(0, US_PER_HOUR, size)
+            yield {
+                "product_id": product_id,
+                "quantity_sold": quantity,
+                "unit_price": prices[product_id],
+                "created_at": self.timestamps(day, micros),
+            }
+
+
+# -------------------------
+# BULK LOADING
+# -------------------------
+def _copy(conn, table: str, columns: dict) -> None:
+    # generated text never contains tabs, newlines or backslashes
+    line = "\t".join(["{}"] * len(columns)) + "\n"
+    buffer = io.StringIO("".join(
+        map(line.format, *(values.tolist() for values in columns.values()))
+    ))
+    cursor = conn.connection.cursor()
+    cursor.copy_expert(
+        f"COPY {table} ({', '.join(columns)}) FROM STDIN", buffer
+    )
+
+
+def _executemany(conn, table: str, columns: dict) -> None:
+    """
+    executemany over multi-row VALUES statements: binding is the same but
+    SQLite steps once per chunk instead of once per row.
+    """
+    width = len(columns)
+    flat = list(chain.from_iterable(
+        zip(*(values.tolist() for values in columns.values()))
+    ))
+    chunk = SQLITE_ROWS_PER_INSERT * width
+    full = len(flat) - len(flat) % chunk
+
+    def statement(rows: int) -> str:
+        row = "(" + ", ".join("?" * width) + ")"
+        return (
+            f"INSERT INTO {table} ({', '.join(columns)}) "
+            f"VALUES {', '.join([row] * rows)}"
+        )
+
+    cursor = conn.connection.cursor()
+    cursor.executemany(
+        statement(SQLITE_ROWS_PER_INSERT),
+        (flat[i:i + chunk] for i in range(0, full, chunk))
+    )
+    if full < len(flat):
+        cursor.execute(statement((len(flat) - full) // width), flat[full:])
+
+
+def prefetch(batches, depth: int = 2):
+    """
+    Generate the next batches on a background thread while the current one
+    is inserted; NumPy and the database drivers release the GIL for most
+    of their work, so both sides overlap on a multi-core machine.
+    """
+    pending = queue.Queue(maxsize=depth)
+    done = object()
+
+    def produce():
+        try:
+            for batch in batches:
+                pending.put(batch)
+        except BaseException as exc:
+            pending.put(exc)
+        pending.put(done)
+
+    threading.Thread(target=produce, daemon=True).start()
+    while (item := pending.get()) is not done:
+        if isinstance(item, BaseException):
+            raise item
+        yield item
+
+
+def load(conn, table: str, columns: dict) -> int:
+    if conn.dialect.name == "postgresql":
+        _copy(conn, table, columns)
+    else:
+        _executemany(conn, table, columns)
+    return len(next(iter(columns.values())))
+
+
+SEEDED_MODELS = [Category, Supplier, Product, Sale]
+
+
+def _truncate(conn) -> None:
+    tables = [SalesDailyRollup, Sale, Product, Category, Supplier]
+    if conn.dialect.name == "postgresql":
+        names = ", ".join(model.__tablename__ for model in tables)
+        conn.execute(text(f"TRUNCATE {names} RESTART IDENTITY CASCADE"))
+    else:
+        for model in tables:
+            conn.execute(model.__table__.delete())
+
+
+def _check_empty(conn) -> None:
+    for model in SEEDED_MODELS:
+        if conn.execute(select(func.count()).select_from(model)).scalar():
+            raise SystemExit(
+                f"{model.__tablename__} is not empty; pass --truncate to replace it"
+            )
+
+
+def _reset_sequences(conn) -> None:
+    if conn.dialect.name != "postgresql":
+        return
+    for model in (Category, Supplier, Product):
+        table = model.__tablename__
+        conn.execute(text(
+            f"SELECT setval(pg_get_serial_sequence('{table}', 'id'), "
+            f"(SELECT COALESCE(MAX(id), 1) FROM {table}))"
+        ))
+
+
+def _create_indexes(conn, indexes) -> None:
+    for index in indexes:
+        index.create(conn, checkfirst=True)
+    install_search_indexes(conn)
+
+
+def seed(args) -> dict:
+    if engine.dialect.name not in ("postgresql", "sqlite"):
+        raise SystemExit(f"unsupported database: {engine.dialect.name}")
+
+    run_migrations(engine)
+    generator = Generator(args)
+    timings = {}
+    counts = {}
+
+    with engine.connect() as conn:
+        if conn.dialect.name == "sqlite":
+            conn.exec_driver_sql("PRAGMA synchronous = OFF")
+            conn.exec_driver_sql("PRAGMA cache_size = -262144")
+            conn.commit()
+
+        indexes = [
+            index
+            for model in SEEDED_MODELS
+            for index in model.__table__.indexes
+        ]
+        try:
+            with conn.begin():
+                # before any DDL: pysqlite does not roll DDL back, so a
+                # refused run must not have dropped anything yet
+                if args.truncate:
+                    _truncate(conn)
+                else:
+                    _check_empty(conn)
+
+                for table in SEARCHABLE:
+                    drop_search_indexes(conn, table)
+                for index in indexes:
+                    index.drop(conn, checkfirst=True)
+
+                started = time.perf_counter()
+                counts["categories"] = load(conn, "categories", generator.categories())
+                counts["suppliers"] = load(conn, "suppliers", generator.suppliers())
+
+                stock = generator.stock()
+                counts["products"] = sum(
+                    load(conn, "products", batch)
+                    for batch in prefetch(generator.products(stock))
+                )
+                counts["sales"] = sum(
+                    load(conn, "sales", batch)
+                    for batch in prefetch(generator.sales(generator.prices()))
+                )
+                timings["load"] = time.perf_counter() - started
+
+                started = time.perf_counter()
+                _create_indexes(conn, indexes)
+                _reset_sequences(conn)
+                conn.execute(text("ANALYZE"))
+                timings["indexes"] = time.perf_counter() - started
+        finally:
+            # a failed load rolls back the rows but may leave the indexes
+            # dropped; recreating is a no-op when they are already there
+            with conn.begin():
+                _create_indexes(conn, indexes)
+
+    if not args.skip_rollup:
+        started = time.perf_counter()
+        db = SessionLocal()
+        try:
+            counts["sales_daily_rollup"] = rebuild_rollup(db)
+        finally:
+            db.close()
+        timings["rollup"] = time.perf_counter() - started
+
+    # running servers may have cached the old reference data and ETags
+    reference_cache.invalidate(ALL_NAMESPACES)
+    table_versions.bump("categories", "suppliers", "products", "sales")
+
+    return {"counts": counts, "timings": timings}
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--products", type=int, default=100_000)
+    parser.add_argument("--sales", type=int, default=1_000_000)
+    parser.add_argument("--categories", type=int, default=50)
+    parser.add_argument("--suppliers", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--start", type=date.fromisoformat,
+                        default=date(2025, 1, 1), help="first sale day")
+    parser.add_argument("--days", type=int, default=365)
+    parser.add_argument("--zipf", type=float, default=1.1,
+                        help="popularity exponent; higher is more skewed")
+    parser.add_argument("--min-stock", type=int, default=0,
+                        help="floor for generated stock levels")
+    parser.add_argument("--truncate", action="store_true",
+                        help="replace existing catalogue and sales rows")
+    parser.add_argument("--skip-rollup", action="store_true")
+    return parser.parse_args(argv)
+
+
+def main() -> None:
+    result = seed(parse_args())
+
+    for table, rows in result["counts"].items():
+        print(f"{table:20} {rows:>14,} rows")
+
+    loaded = sum(
+        rows for table, rows in result["counts"].items()
+        if table != "sales_daily_rollup"
+    )
+    timings = result["timings"]
+    print(
+        f"generated + loaded {loaded:,} rows in {timings['load']:.1f}s "
+        f"({loaded / timings['load']:,.0f} rows/s)"
+    )
+    print(f"indexes rebuilt in {timings['indexes']:.1f}s")
+    if "rollup" in timings:
+        print(f"rollup rebuilt in {timings['rollup']:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""
+Compare two JSON reports from benchmarks.endpoints.
+
+Prints per-scenario p50/p95/p99 and throughput changes and exits 1 if any
+scenario's p95 got slower by more than --threshold percent.
+
+    python -m benchmarks.compare before.json after.json --threshold 10
+"""
+import argparse
+import json
+import sys
+
+METRICS = ("p50_ms", "p95_ms", "p99_ms", "rps")
+
+
+def _change(old: float, new: float) -> float:
+    return (new - old) / old * 100 if old else 0.0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("before")
+    parser.add_argument("after")
+    parser.add_argument("--threshold", type=float, default=10.0,
+                        help="allowed p95 slowdown in percent")
+    args = parser.parse_args()
+
+    with open(args.before) as fh:
+        before = json.load(fh)
+    with open(args.after) as fh:
+        after = json.load(fh)
+
+    print(f"{'scenario':40}" + "".join(f"{m:>18}" for m in METRICS))
+    regressions = []
+    for key, new in after["scenarios"].items():
+        old = before["scenarios"].get(key)
+        if old is None:
+            print(f"{key:40}  (new)")
+            continue
+
+        cells = "".join(
+            f"{new[m]:>10.1f} {_change(old[m], new[m]):+6.1f}%" for m in METRICS
+        )
+        print(f"{key:40}{cells}")
+
+        if _change(old["p95_ms"], new["p95_ms"]) > args.threshold:
+            regressions.append(key)
+
+    print(
+        f"peak RSS: {before['peak_rss_mb']} MB -> {after['peak_rss_mb']} MB"
+    )
+    if regressions:
+        print(f"p95 regressions over {args.threshold}%: {', '.join(regressions)}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
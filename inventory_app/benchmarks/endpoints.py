@@ -0,0 +1,453 @@
+"""
+Endpoint benchmark suite: every router against a seeded database.
+
+Seeds a throwaway database with the requested sizes (via app.tools.seed,
+so popularity and timestamps are skewed like production), starts the app under
+uvicorn, then drives each scenario (auth, categories, suppliers, products,
+sales, reports, mixed read/write, ui) at a fixed concurrency. Latency
+percentiles, throughput, status counts and the server's peak RSS are written
+to a JSON file so runs can be compared with `python -m benchmarks.compare`.
+
+Run from the inventory_app directory (temp SQLite unless DATABASE_URL
+points at a throwaway PostgreSQL database):
+
+    python -m benchmarks.endpoints --products 1000000 --sales 20000000 \\
+        --concurrency 16 --requests 500 --output results.json
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime
+
+if not os.getenv("DATABASE_URL"):
+    _db_file = os.path.join(tempfile.mkdtemp(), "endpoints.db")
+    os.environ["DATABASE_URL"] = f"sqlite:///{_db_file}"
+
+import psutil  # noqa: E402
+import requests  # noqa: E402
+
+from app.core.database import engine  # noqa: E402
+from app.tools.seed import DEPARTMENTS, SUPPLIER_WORDS  # noqa: E402
+from app.tools.seed import seed as seed_database  # noqa: E402
+
+USERNAME = "bench"
+PASSWORD = "bench-password"
+
+
+# -------------------------
+# SEEDING
+# -------------------------
+def seed(args) -> None:
+    seed_database(argparse.Namespace(
+        products=args.products,
+        sales=args.sales,
+        categories=args.categories,
+        suppliers=args.suppliers,
+        seed=args.seed,
+        start=date(2025, 1, 1),
+        days=365,
+        zipf=1.1,
+        # every product stays sellable so sale scenarios never hit a
+        # stockout and status codes stay comparable between runs
+        min_stock=1_000_000,
+        truncate=True,
+        skip_rollup=False,
+    ))
+
+
+# -------------------------
+# SERVER
+# -------------------------
+def start_server(args) -> subprocess.Popen:
+    env = dict(os.environ)
+    env.setdefault("JWT_SECRET_KEY", "benchmark-secret")
+
+    proc = subprocess.Popen(
+        [
+            sys.executable, "-m", "uvicorn", "app.main:app",
+            "--host", "127.0.0.1", "--port", str(args.port),
+            "--workers", str(args.workers),
+            "--log-level", "warning",
+        ],
+        env=env
+    )
+
+    for _ in range(300):
+        try:
+            requests.get(f"{args.base}/", timeout=1)
+            return proc
+        except requests.ConnectionError:
+            time.sleep(0.1)
+
+    proc.kill()
+    raise RuntimeError("server did not start")
+
+
+class RssSampler:
+    """Peak resident memory of the server and its worker processes."""
+
+    def __init__(self, pid: int, interval: float = 0.02):
+        self.process = psutil.Process(pid)
+        self.interval = interval
+        self.peak = 0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def _rss(self) -> int:
+        total = 0
+        for proc in [self.process, *self.process.children(recursive=True)]:
+            try:
+                total += proc.memory_info().rss
+            except psutil.NoSuchProcess:
+                pass
+        return total
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            self.peak = max(self.peak, self._rss())
+            time.sleep(self.interval)
+
+    def __enter__(self):
+        self.peak = self._rss()
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._stop.set()
+        self._thread.join()
+
+
+# -------------------------
+# SCENARIOS
+# -------------------------
+def _login(base: str) -> tuple[dict, dict]:
+    requests.post(
+        f"{base}/auth/register",
+        data={"username": USERNAME, "password": PASSWORD}
+    )
+    token = requests.post(
+        f"{base}/auth/login",
+        data={"username": USERNAME, "password": PASSWORD}
+    ).json()["access_token"]
+
+    ui = requests.post(
+        f"{base}/ui/login",
+        data={"username": USERNAME, "password": PASSWORD},
+        allow_redirects=False
+    )
+    return (
+        {"Authorization": f"Bearer {token}"},
+        {"access_token": ui.cookies["access_token"]},
+    )
+
+
+def _mixed_call(s, ctx, i, product: int):
+    kind = i % 10
+    if kind < 4:
+        return s.get("/api/products/", headers=ctx["auth"])
+    if kind < 6:
+        return s.get("/api/sales/", headers=ctx["auth"])
+    if kind < 7:
+        return s.get("/api/categories/", headers=ctx["auth"])
+    if kind < 8:
+        return s.get(
+            "/api/reports/sales/summary", params={"granularity": "month"},
+            headers=ctx["auth"])
+    return s.post(
+        "/api/sales/", json={"product_id": product, "quantity_sold": 1},
+        headers=ctx["auth"])
+
+
+def scenarios(args) -> list[dict]:
+    """
+    Each scenario is `call(session, ctx, i)` for request number i. Heavy
+    ones cap their request count with `max_requests`; searches set
+    `nonempty` so a term that matches nothing counts as an error instead
+    of timing empty pages.
+    """
+    products, categories, suppliers = args.products, args.categories, args.suppliers
+    run_id = int(time.time())
+
+    # prefixes of names the seed tool generated (long enough for the
+    # trigram index)
+    departments = DEPARTMENTS[:min(categories, len(DEPARTMENTS))]
+    supplier_words = SUPPLIER_WORDS[:min(suppliers, len(SUPPLIER_WORDS))]
+
+    def product_id(ctx):
+        return ctx["rng"].randint(1, products)
+
+    return [
+        # auth
+        {"router": "auth", "name": "login", "max_requests": 50,
+         "call": lambda s, ctx, i: s.post(
+             "/auth/login", data={"username": USERNAME, "password": PASSWORD})},
+        {"router": "auth", "name": "register", "max_requests": 50,
+         "call": lambda s, ctx, i: s.post(
+             "/auth/register",
+             data={"username": f"user-{run_id}-{i}", "password": PASSWORD})},
+        # categories
+        {"router": "categories", "name": "list",
+         "call": lambda s, ctx, i: s.get("/api/categories/", headers=ctx["auth"])},
+        {"router": "categories", "name": "search", "nonempty": True,
+         "call": lambda s, ctx, i: s.get(
+             "/api/categories/",
+             params={"search": departments[i % len(departments)][:4]},
+             headers=ctx["auth"])},
+        {"router": "categories", "name": "create",
+         "call": lambda s, ctx, i: s.post(
+             "/api/categories/", json={"name": f"Bench {run_id} {i}"},
+             headers=ctx["auth"])},
+        # suppliers
+        {"router": "suppliers", "name": "list",
+         "call": lambda s, ctx, i: s.get("/api/suppliers/", headers=ctx["auth"])},
+        {"router": "suppliers", "name": "search", "nonempty": True,
+         "call": lambda s, ctx, i: s.get(
+             "/api/suppliers/",
+             params={"search": supplier_words[i % len(supplier_words)][:4]},
+             headers=ctx["auth"])},
+        {"router": "suppliers", "name": "create",
+         "call": lambda s, ctx, i: s.post(
+             "/api/suppliers/", json={"name": f"Bench {run_id} {i}"},
+             headers=ctx["auth"])},
+        # products
+        {"router": "products", "name": "list",
+         "call": lambda s, ctx, i: s.get("/api/products/", headers=ctx["auth"])},
+        {"router": "products", "name": "list_by_category",
+         "call": lambda s, ctx, i: s.get(
+             "/api/products/",
+             params={"category_id": 1 + i % categories, "limit": 200},
+             headers=ctx["auth"])},
+        {"router": "products", "name": "search", "nonempty": True,
+         "call": lambda s, ctx, i: s.get(
+             "/api/products/", params={"search": f"SKU-{1 + i % products:08d}"},
+             headers=ctx["auth"])},
+        {"router": "products", "name": "create",
+         "call": lambda s, ctx, i: s.post(
+             "/api/products/",
+             json={
+                 "name": f"Bench product {i}", "sku": f"B-{run_id}-{i}",
+                 "price": 100, "quantity": 10,
+                 "category_id": 1, "supplier_id": 1,
+             },
+             headers=ctx["auth"])},
+        # sales
+        {"router": "sales", "name": "list",
+         "call": lambda s, ctx, i: s.get("/api/sales/", headers=ctx["auth"])},
+        {"router": "sales", "name": "create",
+         "call": lambda s, ctx, i: s.post(
+             "/api/sales/",
+             json={"product_id": product_id(ctx), "quantity_sold": 1},
+             headers=ctx["auth"])},
+        {"router": "sales", "name": "bulk_100",
+         "call": lambda s, ctx, i: s.post(
+             "/api/sales/bulk",
+             json=[
+                 {"product_id": product_id(ctx), "quantity_sold": 1}
+                 for _ in range(100)
+             ],
+             headers=ctx["auth"])},
+        # reports
+        {"router": "reports", "name": "sales_summary_day_by_category",
+         "call": lambda s, ctx, i: s.get(
+             "/api/reports/sales/summary",
+             params={"granularity": "day", "group_by": "category",
+                     "from": "2025-01-01", "to": "2025-04-01"},
+             headers=ctx["auth"])},
+        {"router": "reports", "name": "sales_summary_month",
+         "call": lambda s, ctx, i: s.get(
+             "/api/reports/sales/summary", params={"granularity": "month"},
+             headers=ctx["auth"])},
+        {"router": "reports", "name": "inventory_ndjson", "max_requests": 5,
+         "call": lambda s, ctx, i: s.get(
+             "/api/reports/inventory", params={"format": "ndjson"},
+             headers=ctx["auth"])},
+        {"router": "reports", "name": "inventory_parquet", "max_requests": 5,
+         "call": lambda s, ctx, i: s.get(
+             "/api/reports/inventory", params={"format": "parquet"},
+             headers=ctx["auth"])},
+        {"router": "reports", "name": "valuation",
+         "call": lambda s, ctx, i: s.get(
+             "/api/reports/valuation", headers=ctx["auth"])},
+        {"router": "reports", "name": "reorder", "max_requests": 5,
+         "call": lambda s, ctx, i: s.get(
+             "/api/reports/reorder", headers=ctx["auth"])},
+        # mixed: 80% reads / 20% writes interleaved, meant for high
+        # --concurrency to show how the server holds up under contention
+        {"router": "mixed", "name": "read_write_80_20",
+         "call": lambda s, ctx, i: _mixed_call(s, ctx, i, product_id(ctx))},
+        # ui
+        *(
+            {"router": "ui", "name": page,
+             "call": lambda s, ctx, i, page=page: s.get(
+                 f"/ui/{page}", cookies=ctx["cookies"])}
+            for page in ("categories", "suppliers", "products", "sales")
+        ),
+    ]
+
+
+class _Session(requests.Session):
+    def __init__(self, base: str):
+        super().__init__()
+        self.base = base
+
+    def request(self, method, url, *a, **kw):
+        kw.setdefault("timeout", 300)
+        return super().request(method, self.base + url, *a, **kw)
+
+
+def percentile(samples: list[float], q: float) -> float:
+    # nearest-rank on sorted samples
+    index = max(0, min(len(samples) - 1, round(q / 100 * len(samples)) - 1))
+    return samples[index]
+
+
+def run_scenario(scenario: dict, args, ctx: dict, proc) -> dict:
+    total = min(args.requests, scenario.get("max_requests", args.requests))
+    local = threading.local()
+
+    def one(i):
+        if not hasattr(local, "session"):
+            local.session = _Session(args.base)
+            local.ctx = {**ctx, "rng": random.Random(args.seed + i)}
+        start = time.perf_counter()
+        try:
+            response = scenario["call"](local.session, local.ctx, i)
+            response.content  # drain streamed bodies
+            status = response.status_code
+        except requests.RequestException:
+            # resets and timeouts under overload count as failures
+            return (time.perf_counter() - start) * 1000, "connection_error"
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        if (
+            scenario.get("nonempty")
+            and status == 200
+            and not response.json()["items"]
+        ):
+            status = "empty"
+        return elapsed_ms, status
+
+    with RssSampler(proc.pid) as rss:
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=args.concurrency) as pool:
+            results = list(pool.map(one, range(total)))
+        elapsed = time.perf_counter() - started
+
+    samples = sorted(ms for ms, _ in results)
+    statuses = {}
+    for _, code in results:
+        statuses[str(code)] = statuses.get(str(code), 0) + 1
+
+    return {
+        "router": scenario["router"],
+        "requests": total,
+        "p50_ms": round(percentile(samples, 50), 2),
+        "p95_ms": round(percentile(samples, 95), 2),
+        "p99_ms": round(percentile(samples, 99), 2),
+        "max_ms": round(samples[-1], 2),
+        "rps": round(total / elapsed, 1),
+        "errors": sum(
+            n for code, n in statuses.items()
+            if not code.isdigit() or int(code) >= 400
+        ),
+        "statuses": statuses,
+        "peak_rss_mb": round(rss.peak / 2**20, 1),
+    }
+
+
+def _git_commit() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--products", type=int, default=10_000)
+    parser.add_argument("--sales", type=int, default=100_000)
+    parser.add_argument("--categories", type=int, default=50)
+    parser.add_argument("--suppliers", type=int, default=50)
+    parser.add_argument("--requests", type=int, default=200,
+                        help="requests per scenario")
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--workers", type=int, default=1,
+                        help="uvicorn worker processes")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--only", action="append", default=[],
+                        help="limit to these routers (repeatable)")
+    parser.add_argument("--output", default="benchmark-results.json")
+    args = parser.parse_args()
+    args.base = f"http://127.0.0.1:{args.port}"
+
+    seed_started = time.perf_counter()
+    seed(args)
+    seed_seconds = time.perf_counter() - seed_started
+
+    proc = start_server(args)
+    try:
+        auth, cookies = _login(args.base)
+        ctx = {"auth": auth, "cookies": cookies}
+
+        results = {}
+        for scenario in scenarios(args):
+            if args.only and scenario["router"] not in args.only:
+                continue
+            key = f"{scenario['router']}.{scenario['name']}"
+            results[key] = run_scenario(scenario, args, ctx, proc)
+            print(
+                f"{key:40} p50 {results[key]['p50_ms']:9.2f}  "
+                f"p99 {results[key]['p99_ms']:9.2f}  "
+                f"{results[key]['rps']:8.1f} rps  "
+                f"errors {results[key]['errors']}"
+            )
+    finally:
+        proc.terminate()
+        try:
+            proc.wait(timeout=30)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            proc.wait()
+
+    report = {
+        "meta": {
+            "commit": _git_commit(),
+            "timestamp": datetime.now().isoformat(timespec="seconds"),
+            "database": engine.dialect.name,
+            "python": platform.python_version(),
+            "cpus": os.cpu_count(),
+            "seed_seconds": round(seed_seconds, 1),
+            "sizes": {
+                "products": args.products,
+                "sales": args.sales,
+                "categories": args.categories,
+                "suppliers": args.suppliers,
+            },
+            "concurrency": args.concurrency,
+            "workers": args.workers,
+            "requests": args.requests,
+        },
+        "peak_rss_mb": max(
+            (r["peak_rss_mb"] for r in results.values()), default=0
+        ),
+        "scenarios": results,
+    }
+
+    with open(args.output, "w") as fh:
+        json.dump(report, fh, indent=2)
+    print(f"wrote {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,238 @@
+"""
+Query-plan check: fail if any hot endpoint sequentially scans a large table.
+
+Seeds a throwaway database, calls each endpoint through the app while
+capturing the SQL it emits on the request engines (primary and replica),
+then EXPLAINs every captured statement with its real parameters on the
+engine that ran it. A check that captures no statements fails too. A full scan of products, sales or sales_daily_rollup
+fails the check (Seq Scan on PostgreSQL; on SQLite a `SCAN <table>` step,
+with or without a full-index walk). On SQLite, an unfiltered scan with a
+LIMIT and no sort step is allowed, because it walks an index in order and
+stops early.
+
+Run from the inventory_app directory:
+
+    python -m benchmarks.explain_check --products 100000 --sales 300000
+
+Exits non-zero when a scan is found, so it can gate CI.
+"""
+import argparse
+import json
+import os
+import random
+import re
+import tempfile
+from datetime import datetime, timedelta
+
+if not os.getenv("DATABASE_URL"):
+    _db_file = os.path.join(tempfile.mkdtemp(), "explain.db")
+    os.environ["DATABASE_URL"] = f"sqlite:///{_db_file}"
+os.environ.setdefault("JWT_SECRET_KEY", "explain-check")
+
+from fastapi.testclient import TestClient  # noqa: E402
+from sqlalchemy import event, insert, text  # noqa: E402
+
+from app.core.database import (  # noqa: E402
+    SessionLocal,
+    async_engine,
+    async_read_engine,
+    engine,
+)
+from app.core.migrations import run_migrations  # noqa: E402
+from app.main import app  # noqa: E402
+from app.models.category import Category  # noqa: E402
+from app.models.product import Product  # noqa: E402
+from app.models.sale import Sale  # noqa: E402
+from app.models.supplier import Supplier  # noqa: E402
+from app.services.rollup_service import rebuild_rollup  # noqa: E402
+
+LARGE_TABLES = {"products", "sales", "sales_daily_rollup"}
+
+RANGE_START = "2025-03-01T00:00:00"
+RANGE_END = "2025-03-15T00:00:00"
+
+# (label, method, path, params, json body); "next" follows the cursor
+# returned by the previous check
+CHECKS = [
+    ("products", "GET", "/api/products/", {}, None),
+    ("products page 2", "GET", "/api/products/", "next", None),
+    ("products by category", "GET", "/api/products/", {"category_id": 3}, None),
+    ("products by supplier", "GET", "/api/products/", {"supplier_id": 2}, None),
+    ("products search", "GET", "/api/products/", {"search": "kettle"}, None),
+    ("categories", "GET", "/api/categories/", {}, None),
+    ("suppliers", "GET", "/api/suppliers/", {}, None),
+    ("sales", "GET", "/api/sales/", {}, None),
+    ("sales page 2", "GET", "/api/sales/", "next", None),
+    ("summary day/product", "GET", "/api/reports/sales/summary",
+     {"granularity": "day", "group_by": "product",
+      "from": RANGE_START, "to": RANGE_END}, None),
+    ("summary hour", "GET", "/api/reports/sales/summary",
+     {"granularity": "hour", "from": RANGE_START, "to": RANGE_END}, None),
+    ("create sale", "POST", "/api/sales/", {},
+     {"product_id": 42, "quantity_sold": 1}),
+    ("update sale", "PUT", "/api/sales/1", {},
+     {"product_id": 43, "quantity_sold": 1}),
+    ("delete sale", "DELETE", "/api/sales/2", {}, None),
+]
+
+NOUNS = ["kettle", "charger", "lamp", "bottle", "jacket", "speaker", "mug"]
+
+
+def seed(products: int, sales: int) -> None:
+    run_migrations(engine)
+    rng = random.Random(7)
+    start = datetime(2025, 1, 1)
+
+    db = SessionLocal()
+    try:
+        db.execute(insert(Category), [{"name": f"Category {i}"} for i in range(50)])
+        db.execute(insert(Supplier), [{"name": f"Supplier {i}"} for i in range(200)])
+        prices = [rng.randint(1, 5000) for _ in range(products)]
+        db.execute(insert(Product), [
+            {
+                "name": f"{rng.choice(NOUNS)} {i}",
+                "sku": f"SKU-{i:07d}",
+                "price": prices[i],
+                "quantity": 1_000_000,
+                "category_id": rng.randint(1, 50),
+                "supplier_id": rng.randint(1, 200),
+            }
+            for i in range(products)
+        ])
+        for offset in range(0, sales, 50_000):
+            product_ids = [
+                rng.randint(1, products)
+                for _ in range(min(50_000, sales - offset))
+            ]
+            db.execute(insert(Sale), [
+                {
+                    "product_id": product_id,
+                    "quantity_sold": rng.randint(1, 5),
+                    "unit_price": prices[product_id - 1],
+                    "created_at": start + timedelta(seconds=rng.randint(0, 365 * 86400)),
+                }
+                for product_id in product_ids
+            ])
+        db.commit()
+        rebuild_rollup(db)
+    finally:
+        db.close()
+
+    with engine.begin() as conn:
+        conn.execute(text("ANALYZE"))
+
+
+def sqlite_scans(conn, statement: str, parameters) -> list[str]:
+    plan = [row[-1] for row in conn.exec_driver_sql(
+        f"EXPLAIN QUERY PLAN {statement}", parameters
+    )]
+    # an unfiltered, unsorted walk in key order stops at LIMIT
+    bounded = (
+        not re.search(r"\bWHERE\b", statement, re.I)
+        and re.search(r"\bLIMIT\b", statement, re.I)
+        and not any(step.startswith("USE TEMP B-TREE") for step in plan)
+    )
+    scans = []
+    for step in plan:
+        match = re.match(
+            r"SCAN (\w+)(?: AS \w+)?(?: USING (?:COVERING )?INDEX \w+)?$", step
+        )
+        if match and match.group(1) in LARGE_TABLES and not bounded:
+            scans.append(step)
+    return scans
+
+
+def postgresql_scans(conn, statement: str, parameters) -> list[str]:
+    plan = conn.exec_driver_sql(
+        f"EXPLAIN (FORMAT JSON) {statement}", parameters
+    ).scalar()
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+
+    scans = []
+    nodes = [plan[0]["Plan"]]
+    while nodes:
+        node = nodes.pop()
+        if node["Node Type"] == "Seq Scan" and node.get("Relation Name") in LARGE_TABLES:
+            scans.append(f"Seq Scan on {node['Relation Name']}")
+        nodes.extend(node.get("Plans", []))
+    return scans
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--products", type=int, default=100_000)
+    parser.add_argument("--sales", type=int, default=300_000)
+    args = parser.parse_args()
+
+    seed(args.products, args.sales)
+
+    # requests run on the async engines, not the sync one seed() used
+    request_engines = {async_engine.sync_engine: async_engine}
+    request_engines[async_read_engine.sync_engine] = async_read_engine
+    captured = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        verb = statement.lstrip().split(None, 1)[0].upper()
+        if verb in ("SELECT", "UPDATE", "DELETE", "WITH"):
+            captured.append((request_engines[conn.engine], statement, parameters))
+
+    explain = sqlite_scans if engine.dialect.name == "sqlite" else postgresql_scans
+
+    async def explain_captured() -> list[str]:
+        # on the engine and driver that ran the statement, in its loop
+        scans = []
+        for async_db, statement, parameters in captured:
+            async with async_db.connect() as conn:
+                scans += await conn.run_sync(explain, statement, parameters)
+        return scans
+    failures = 0
+
+    with TestClient(app) as client:
+        client.post("/auth/register", data={"username": "explain", "password": "x"})
+        token = client.post(
+            "/auth/login", data={"username": "explain", "password": "x"}
+        ).json()["access_token"]
+        headers = {"Authorization": f"Bearer {token}"}
+
+        next_cursor = None
+        for label, method, path, params, body in CHECKS:
+            if params == "next":
+                params = {"cursor": next_cursor}
+
+            for sync_engine in request_engines:
+                event.listen(sync_engine, "before_cursor_execute", capture)
+            try:
+                resp = client.request(method, path, params=params, json=body, headers=headers)
+            finally:
+                for sync_engine in request_engines:
+                    event.remove(sync_engine, "before_cursor_execute", capture)
+
+            if resp.status_code >= 400:
+                raise SystemExit(f"{label}: HTTP {resp.status_code} {resp.text}")
+            if method == "GET" and isinstance(resp.json(), dict):
+                next_cursor = resp.json().get("next_cursor")
+
+            if not captured:
+                failures += 1
+                print(f"FAIL {label}  <- no statements captured")
+                continue
+
+            # EXPLAIN after the request so its transaction is finished
+            count = len(captured)
+            scans = client.portal.call(explain_captured)
+            captured.clear()
+
+            status = "FAIL" if scans else "ok"
+            failures += bool(scans)
+            print(
+                f"{status:<5}{label} ({count} statements)"
+                + (f"  <- {', '.join(scans)}" if scans else "")
+            )
+
+    if failures:
+        raise SystemExit(f"{failures} endpoint check(s) failed")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+"""
+Large-collection JSON responses: validated stdlib json vs. validated orjson
+vs. the Row-tuple fast path.
+
+Seeds --rows products, then serves the same rows three ways from a
+throwaway FastAPI app and times full request round trips:
+
+  json       ORM objects, response_model validation, JSONResponse
+  orjson     ORM objects, response_model validation, ORJSONResponse
+  fast       schema columns as Row tuples -> dicts -> ORJSONResponse
+
+Run from the inventory_app directory:
+
+    python -m benchmarks.json_fast_path --rows 10000 --requests 20
+"""
+import argparse
+import os
+import random
+import statistics
+import tempfile
+import time
+
+if not os.getenv("DATABASE_URL"):
+    _db_file = os.path.join(tempfile.mkdtemp(), "json.db")
+    os.environ["DATABASE_URL"] = f"sqlite:///{_db_file}"
+
+from fastapi import FastAPI  # noqa: E402
+from fastapi.responses import JSONResponse, ORJSONResponse  # noqa: E402
+from fastapi.testclient import TestClient  # noqa: E402
+from sqlalchemy import insert, select  # noqa: E402
+
+from app.core.database import SessionLocal, engine  # noqa: E402
+from app.core.migrations import run_migrations  # noqa: E402
+from app.core.responses import fast_json, row_dicts, schema_columns  # noqa: E402
+from app.models.category import Category  # noqa: E402
+from app.models.product import Product  # noqa: E402
+from app.models.supplier import Supplier  # noqa: E402
+from app.schemas.product import ProductOut  # noqa: E402
+
+
+def seed(rows: int) -> None:
+    run_migrations(engine)
+
+    rng = random.Random(42)
+    db = SessionLocal()
+    try:
+        db.add_all([Category(name="Bench"), Supplier(name="Bench")])
+        db.commit()
+        db.execute(insert(Product), [
+            {
+                "name": f"Product {i}",
+                "sku": f"SKU-{i:07d}",
+                "price": rng.randint(1, 5000),
+                "quantity": rng.randint(0, 500),
+                "category_id": 1,
+                "supplier_id": 1,
+            }
+            for i in range(rows)
+        ])
+        db.commit()
+    finally:
+        db.close()
+
+
+def build_app(rows: int) -> FastAPI:
+    bench = FastAPI()
+
+    def entities():
+        with SessionLocal() as db:
+            return db.query(Product).limit(rows).all()
+
+    @bench.get("/json", response_model=list[ProductOut],
+               response_class=JSONResponse)
+    def as_json():
+        return entities()
+
+    @bench.get("/orjson", response_model=list[ProductOut],
+               response_class=ORJSONResponse)
+    def as_orjson():
+        return entities()
+
+    columns = schema_columns(Product, ProductOut)
+
+    @bench.get("/fast", response_model=list[ProductOut])
+    def as_fast():
+        with SessionLocal() as db:
+            result = db.execute(select(*columns).limit(rows))
+            return fast_json(row_dicts(result, result.keys()))
+
+    return bench
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=10_000)
+    parser.add_argument("--requests", type=int, default=20)
+    args = parser.parse_args()
+
+    seed(args.rows)
+    client = TestClient(build_app(args.rows))
+
+    bodies = {}
+    results = {}
+    for path in ("json", "orjson", "fast"):
+        client.get(f"/{path}")  # warm up
+        timings = []
+        for _ in range(args.requests):
+            start = time.perf_counter()
+            response = client.get(f"/{path}")
+            timings.append(time.perf_counter() - start)
+        bodies[path] = response.json()
+        results[path] = statistics.median(timings)
+
+    assert bodies["json"] == bodies["orjson"] == bodies["fast"]
+
+    base = results["json"]
+    print(f"{'path':8} {'p50 ms':>9} {'req/s':>8} {'rows/s':>12} {'speedup':>8}")
+    for path, p50 in results.items():
+        print(
+            f"{path:8} {p50 * 1000:9.1f} {1 / p50:8.1f} "
+            f"{args.rows / p50:12,.0f} {base / p50:7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
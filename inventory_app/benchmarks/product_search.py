@@ -0,0 +1,125 @@
+"""
+Product search benchmark: indexed search vs. leading-wildcard ILIKE scan.
+
+Seeds a throwaway database with --products rows, then times
+product_service.list_products(search=...) against the old
+`name ILIKE '%x%' OR sku ILIKE '%x%'` full scan for a few terms.
+
+Run from the inventory_app directory (temp SQLite unless DATABASE_URL
+points at a throwaway PostgreSQL database):
+
+    python -m benchmarks.product_search --products 1000000
+"""
+import argparse
+import os
+import random
+import statistics
+import tempfile
+import time
+
+if not os.getenv("DATABASE_URL"):
+    _db_file = os.path.join(tempfile.mkdtemp(), "search.db")
+    os.environ["DATABASE_URL"] = f"sqlite:///{_db_file}"
+
+from sqlalchemy import insert  # noqa: E402
+
+from app.core.database import SessionLocal, engine  # noqa: E402
+from app.core.migrations import run_migrations  # noqa: E402
+from app.models.category import Category  # noqa: E402
+from app.models.product import Product  # noqa: E402
+from app.models.supplier import Supplier  # noqa: E402
+from app.services import product_service  # noqa: E402
+
+WORDS = [
+    "steel", "cotton", "wireless", "organic", "compact", "premium", "mini",
+    "ceramic", "bamboo", "carbon", "glass", "leather", "smart", "solar",
+    "thermal", "vintage", "hybrid", "digital", "classic", "portable",
+]
+NOUNS = [
+    "kettle", "charger", "lamp", "bottle", "jacket", "speaker", "mug",
+    "router", "blender", "backpack", "keyboard", "camera", "drill", "towel",
+]
+TERMS = [
+    "kettle", "ket", "ke", "wireless cam", "ste", "SKU-00042", "zzz-no-match",
+]
+
+
+def seed(products: int) -> None:
+    run_migrations(engine)
+
+    rng = random.Random(42)
+    db = SessionLocal()
+    try:
+        db.add_all([Category(name="Bench"), Supplier(name="Bench")])
+        db.commit()
+
+        batch = []
+        for i in range(products):
+            batch.append({
+                "name": f"{rng.choice(WORDS)} {rng.choice(WORDS)} {rng.choice(NOUNS)}",
+                "sku": f"SKU-{i:07d}",
+                "price": rng.randint(1, 5000),
+                "quantity": rng.randint(0, 500),
+                "category_id": 1,
+                "supplier_id": 1,
+            })
+            if len(batch) == 10_000:
+                db.execute(insert(Product), batch)
+                batch = []
+        if batch:
+            db.execute(insert(Product), batch)
+        db.commit()
+    finally:
+        db.close()
+
+
+def scan(db, term: str):
+    return (
+        db.query(Product)
+        .filter(
+            (Product.name.ilike(f"%{term}%")) |
+            (Product.sku.ilike(f"%{term}%"))
+        )
+        .order_by(Product.id.desc())
+        .limit(50)
+        .all()
+    )
+
+
+def indexed(db, term: str):
+    return product_service.list_products(db, search=term, limit=50)[0]
+
+
+def time_ms(fn, db, term: str, repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn(db, term)
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--products", type=int, default=1_000_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    seed(args.products)
+    print(f"seeded {args.products} products in {time.perf_counter() - started:.1f}s"
+          f" ({engine.dialect.name})")
+
+    db = SessionLocal()
+    try:
+        print(f"{'term':<16}{'ILIKE scan':>14}{'indexed':>12}")
+        for term in TERMS:
+            before = time_ms(scan, db, term, args.repeat)
+            after = time_ms(indexed, db, term, args.repeat)
+            print(f"{term:<16}{before:>11.1f} ms{after:>9.1f} ms")
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+"""
+Hot-SKU sale contention stress test.
+
+Many threads call sale_service.create_sale against one product until its
+stock runs out, then check that nothing was oversold and no decrement was
+lost, and report sustained sales/sec.
+
+Run from the inventory_app directory (uses a temp SQLite file unless
+DATABASE_URL is set, e.g. to a throwaway PostgreSQL database):
+
+    python -m benchmarks.sale_contention --threads 16 --stock 2000
+"""
+import argparse
+import os
+import tempfile
+import threading
+import time
+
+from fastapi import HTTPException
+from sqlalchemy.exc import OperationalError
+
+if not os.getenv("DATABASE_URL"):
+    _db_file = os.path.join(tempfile.mkdtemp(), "contention.db")
+    os.environ["DATABASE_URL"] = f"sqlite:///{_db_file}"
+
+from app.core.database import SessionLocal, engine  # noqa: E402
+from app.core.migrations import run_migrations  # noqa: E402
+from app.models.category import Category  # noqa: E402
+from app.models.product import Product  # noqa: E402
+from app.models.sale import Sale  # noqa: E402
+from app.models.supplier import Supplier  # noqa: E402
+from app.schemas.sale import SaleCreate  # noqa: E402
+from app.services import sale_service  # noqa: E402
+
+
+def seed(stock: int) -> int:
+    run_migrations(engine)
+    db = SessionLocal()
+    try:
+        category = Category(name=f"Hot {time.time_ns()}")
+        supplier = Supplier(name=f"Hot {time.time_ns()}")
+        db.add_all([category, supplier])
+        db.flush()
+        product = Product(
+            name="Hot SKU",
+            sku=f"HOT-{time.time_ns()}",
+            price=100,
+            quantity=stock,
+            category_id=category.id,
+            supplier_id=supplier.id
+        )
+        db.add(product)
+        db.commit()
+        return product.id
+    finally:
+        db.close()
+
+
+def worker(product_id: int, stats: dict, lock: threading.Lock) -> None:
+    payload = SaleCreate(product_id=product_id, quantity_sold=1)
+    sold = rejected = errors = 0
+
+    while True:
+        db = SessionLocal()
+        try:
+            sale_service.create_sale(db, payload)
+            sold += 1
+        except HTTPException:
+            # out of stock: this worker is done
+            rejected += 1
+            break
+        except OperationalError:
+            # e.g. SQLite "database is locked" under write contention
+            errors += 1
+        finally:
+            db.close()
+
+    with lock:
+        stats["sold"] += sold
+        stats["rejected"] += rejected
+        stats["errors"] += errors
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--threads", type=int, default=16)
+    parser.add_argument("--stock", type=int, default=2000)
+    args = parser.parse_args()
+
+    product_id = seed(args.stock)
+    stats = {"sold": 0, "rejected": 0, "errors": 0}
+    lock = threading.Lock()
+
+    threads = [
+        threading.Thread(target=worker, args=(product_id, stats, lock))
+        for _ in range(args.threads)
+    ]
+    started = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - started
+
+    db = SessionLocal()
+    try:
+        remaining = db.get(Product, product_id).quantity
+        recorded = db.query(Sale).filter(Sale.product_id == product_id).count()
+    finally:
+        db.close()
+
+    print(f"dialect:        {engine.dialect.name}")
+    print(f"threads:        {args.threads}")
+    print(f"initial stock:  {args.stock}")
+    print(f"sales accepted: {stats['sold']}")
+    print(f"sales recorded: {recorded}")
+    print(f"stock left:     {remaining}")
+    print(f"db errors:      {stats['errors']}")
+    print(f"sales/sec:      {stats['sold'] / elapsed:.1f}")
+
+    oversold = remaining < 0
+    lost = args.stock - remaining != recorded or recorded != stats["sold"]
+    if oversold or lost:
+        raise SystemExit("FAIL: oversold or lost stock updates")
+    print("OK: no oversell, no lost updates")
+
+
+if __name__ == "__main__":
+    main()
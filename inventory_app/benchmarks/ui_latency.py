@@ -0,0 +1,151 @@
+"""
+UI page latency benchmark.
+
+Starts the app under uvicorn on 127.0.0.1:8000 (the address the old HTTP
+loopback in ui_controller expected) against a throwaway SQLite database,
+seeds it through the JSON API, then times every /ui list page.
+
+Run from the inventory_app directory:
+
+    python -m benchmarks.ui_latency --products 2000 --sales 5000
+
+Check out an older commit and run it again to compare before/after.
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+BASE = "http://127.0.0.1:8000"
+PAGES = ["/ui/categories", "/ui/suppliers", "/ui/products", "/ui/sales"]
+
+
+def start_server(db_path: str) -> subprocess.Popen:
+    env = dict(os.environ)
+    env["DATABASE_URL"] = f"sqlite:///{db_path}"
+    env.setdefault("JWT_SECRET_KEY", "benchmark-secret")
+
+    subprocess.run(
+        [sys.executable, "-m", "app.tools.migrate"], env=env, check=True
+    )
+    proc = subprocess.Popen(
+        [
+            sys.executable, "-m", "uvicorn", "app.main:app",
+            "--host", "127.0.0.1", "--port", "8000",
+            "--log-level", "warning",
+        ],
+        env=env
+    )
+
+    for _ in range(100):
+        try:
+            requests.get(f"{BASE}/", timeout=1)
+            return proc
+        except requests.ConnectionError:
+            time.sleep(0.1)
+
+    proc.kill()
+    raise RuntimeError("server did not start")
+
+
+def seed(session: requests.Session, products: int, sales: int) -> None:
+    session.post(
+        f"{BASE}/auth/register",
+        data={"username": "bench", "password": "bench"}
+    )
+    token = session.post(
+        f"{BASE}/auth/login",
+        data={"username": "bench", "password": "bench"}
+    ).json()["access_token"]
+    headers = {"Authorization": f"Bearer {token}"}
+
+    category = session.post(
+        f"{BASE}/api/categories/", json={"name": "Bench"}, headers=headers
+    ).json()
+    supplier = session.post(
+        f"{BASE}/api/suppliers/", json={"name": "Bench"}, headers=headers
+    ).json()
+
+    for i in range(products):
+        session.post(
+            f"{BASE}/api/products/",
+            json={
+                "name": f"Product {i}",
+                "sku": f"SKU-{i}",
+                "price": 100 + i % 50,
+                "quantity": 1_000_000,
+                "category_id": category["id"],
+                "supplier_id": supplier["id"],
+            },
+            headers=headers
+        )
+
+    for i in range(sales):
+        session.post(
+            f"{BASE}/api/sales/",
+            json={"product_id": 1 + i % max(products, 1), "quantity_sold": 1},
+            headers=headers
+        )
+
+
+def ui_cookies() -> dict:
+    resp = requests.post(
+        f"{BASE}/ui/login",
+        data={"username": "bench", "password": "bench"},
+        allow_redirects=False
+    )
+    return {"access_token": resp.cookies["access_token"]}
+
+
+def time_page(path: str, cookies: dict, requests_: int, concurrency: int) -> dict:
+    def one(_):
+        start = time.perf_counter()
+        resp = requests.get(f"{BASE}{path}", cookies=cookies, timeout=30)
+        resp.raise_for_status()
+        return (time.perf_counter() - start) * 1000
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        samples = sorted(pool.map(one, range(requests_)))
+    elapsed = time.perf_counter() - started
+
+    return {
+        "p50_ms": round(statistics.median(samples), 2),
+        "p95_ms": round(samples[int(len(samples) * 0.95) - 1], 2),
+        "rps": round(requests_ / elapsed, 1),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--products", type=int, default=500)
+    parser.add_argument("--sales", type=int, default=1000)
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=8)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        proc = start_server(os.path.join(tmp, "bench.db"))
+        try:
+            seed(requests.Session(), args.products, args.sales)
+            cookies = ui_cookies()
+            results = {
+                path: time_page(path, cookies, args.requests, args.concurrency)
+                for path in PAGES
+            }
+        finally:
+            proc.terminate()
+            proc.wait()
+
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
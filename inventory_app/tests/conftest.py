@@ -0,0 +1,90 @@
+"""
+Tests run the real app against a throwaway SQLite file. The database URL
+is read when app.core.database is imported, so it is set here first.
+"""
+import os
+import tempfile
+
+_db_dir = tempfile.mkdtemp(prefix="inventory-tests-")
+os.environ["DATABASE_URL"] = f"sqlite:///{_db_dir}/primary.db"
+os.environ.pop("DATABASE_READ_URL", None)
+os.environ.pop("CACHE_INVALIDATION_URL", None)
+os.environ.setdefault("JWT_SECRET_KEY", "test-secret")
+
+import pytest  # noqa: E402
+from fastapi.testclient import TestClient  # noqa: E402
+
+from app.core.cache import ALL_NAMESPACES, reference_cache  # noqa: E402
+from app.core.database import SessionLocal, engine  # noqa: E402
+from app.core.migrations import run_migrations  # noqa: E402
+from app.main import app  # noqa: E402
+from app.models.category import Category  # noqa: E402
+from app.models.product import Product  # noqa: E402
+from app.models.sale import Sale  # noqa: E402
+from app.models.sales_rollup import SalesDailyRollup  # noqa: E402
+from app.models.supplier import Supplier  # noqa: E402
+
+# child tables first
+DATA_TABLES = [SalesDailyRollup, Sale, Product, Category, Supplier]
+
+
+@pytest.fixture(scope="session")
+def client():
+    run_migrations(engine)
+    with TestClient(app) as client:
+        yield client
+
+
+@pytest.fixture(scope="session")
+def auth(client) -> dict:
+    credentials = {"username": "tester", "password": "tester-password"}
+    client.post("/auth/register", data=credentials)
+    token = client.post("/auth/login", data=credentials).json()["access_token"]
+    return {"Authorization": f"Bearer {token}"}
+
+
+@pytest.fixture(autouse=True)
+def clean_tables(client):
+    yield
+    with engine.begin() as conn:
+        for model in DATA_TABLES:
+            conn.execute(model.__table__.delete())
+    reference_cache.invalidate(ALL_NAMESPACES)
+
+
+@pytest.fixture
+def db():
+    session = SessionLocal()
+    try:
+        yield session
+    finally:
+        session.close()
+
+
+@pytest.fixture
+def make_product(client, auth):
+    """Create a product (and its category and supplier) over the API."""
+    created = []
+
+    def make(price: int = 100, quantity: int = 10, **fields) -> dict:
+        n = len(created)
+        if "category_id" not in fields:
+            fields["category_id"] = client.post(
+                "/api/categories/", json={"name": f"Category {n}"}, headers=auth
+            ).json()["id"]
+        if "supplier_id" not in fields:
+            fields["supplier_id"] = client.post(
+                "/api/suppliers/", json={"name": f"Supplier {n}"}, headers=auth
+            ).json()["id"]
+        response = client.post("/api/products/", json={
+            "name": f"Product {n}",
+            "sku": f"SKU-{n}",
+            "price": price,
+            "quantity": quantity,
+            **fields,
+        }, headers=auth)
+        assert response.status_code == 200, response.text
+        created.append(response.json())
+        return response.json()
+
+    return make
@@ -0,0 +1,43 @@
+import asyncio
+
+from app.core import cache, versions
+from app.core.cache import reference_cache
+from app.services import category_service
+
+
+def _on_event_loop() -> bool:
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return False
+    return True
+
+
+def test_redis_calls_run_off_the_event_loop(client, auth, monkeypatch):
+    calls = []
+
+    def record(*args):
+        calls.append((args[0], _on_event_loop()))
+
+    store = versions.RedisVersions("redis://127.0.0.1:1/0")
+    monkeypatch.setattr(store, "_command", record)
+    monkeypatch.setattr(category_service, "table_versions", store)
+
+    backend = cache.RedisInvalidation("redis://127.0.0.1:1/0")
+    monkeypatch.setattr(backend._publisher, "command", record)
+    monkeypatch.setattr(reference_cache, "_backend", backend)
+
+    response = client.post("/api/categories/", json={"name": "Tools"}, headers=auth)
+    assert response.status_code == 201, response.text
+
+    assert sorted(calls) == [("INCR", False), ("PUBLISH", False)]
+
+
+def test_redis_calls_outside_a_request_run_at_once(monkeypatch):
+    calls = []
+    store = versions.RedisVersions("redis://127.0.0.1:1/0")
+    monkeypatch.setattr(store, "_command", lambda *args: calls.append(args))
+
+    store.bump("products")
+
+    assert calls == [("INCR", "inventory:version:products")]
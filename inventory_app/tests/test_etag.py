@@ -0,0 +1,32 @@
+from app.core import etag, versions
+
+
+def _list_categories(client, auth, **headers):
+    return client.get("/api/categories/", headers={**auth, **headers})
+
+
+def test_unchanged_list_is_not_modified(client, auth):
+    first = _list_categories(client, auth)
+    assert first.status_code == 200
+    again = _list_categories(client, auth, **{"If-None-Match": first.headers["ETag"]})
+    assert again.status_code == 304
+
+
+def test_write_changes_the_etag(client, auth):
+    before = _list_categories(client, auth).headers["ETag"]
+    client.post("/api/categories/", json={"name": "Fresh"}, headers=auth)
+    after = _list_categories(client, auth, **{"If-None-Match": before})
+    assert after.status_code == 200
+    assert after.headers["ETag"] != before
+
+
+def test_no_etags_for_several_workers_without_shared_versions(
+    client, auth, monkeypatch
+):
+    monkeypatch.setattr(versions, "CACHE_INVALIDATION_URL", None)
+    monkeypatch.setattr(versions, "WEB_CONCURRENCY", 4)
+    monkeypatch.setattr(etag, "table_versions", versions._store())
+
+    response = _list_categories(client, auth, **{"If-None-Match": "*"})
+    assert response.status_code == 200
+    assert "ETag" not in response.headers
@@ -0,0 +1,63 @@
+"""
+Statement budgets for the hot endpoints. A budget going up means a new
+query per request, so raise one only on purpose.
+"""
+import pytest
+
+from app.testing import assert_max_queries, assert_query_budget
+
+
+@pytest.fixture
+def sale(client, auth, make_product) -> dict:
+    product = make_product(quantity=50)
+    response = client.post(
+        "/api/sales/",
+        json={"product_id": product["id"], "quantity_sold": 2},
+        headers=auth
+    )
+    assert response.status_code == 200, response.text
+    return response.json()
+
+
+@pytest.mark.parametrize("path, params, budget", [
+    ("/api/products/", {}, 1),
+    # a bounded match count picks ranked or id order, then the page
+    ("/api/products/", {"search": "Product"}, 2),
+    ("/api/categories/", {}, 1),
+    ("/api/sales/", {}, 1),
+    ("/api/reports/sales/summary", {}, 1),
+    ("/api/reports/reorder", {}, 1),
+    ("/api/reports/valuation", {}, 3),
+])
+def test_read_budgets(client, auth, sale, path, params, budget):
+    response = client.get(path, params=params, headers=auth)
+    assert response.status_code == 200, response.text
+    assert_query_budget(response, budget)
+
+
+def test_sale_write_budgets(client, auth, sale, make_product):
+    other = make_product(quantity=50)
+
+    response = client.post(
+        "/api/sales/",
+        json={"product_id": other["id"], "quantity_sold": 1},
+        headers=auth
+    )
+    assert_query_budget(response, 4)
+
+    response = client.put(
+        f"/api/sales/{sale['id']}",
+        json={"product_id": other["id"], "quantity_sold": 3},
+        headers=auth
+    )
+    assert_query_budget(response, 7)
+
+    response = client.delete(f"/api/sales/{sale['id']}", headers=auth)
+    assert_query_budget(response, 3)
+
+
+def test_cached_reads_skip_the_database(client, auth, sale):
+    client.get("/api/reports/valuation", headers=auth)
+
+    with assert_max_queries(0):
+        assert client.get("/api/reports/valuation", headers=auth).status_code == 200
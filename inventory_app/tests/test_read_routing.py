@@ -0,0 +1,107 @@
+"""
+Routing between two SQLite files: the suite's primary and an empty
+replica standing in for one that has not caught up yet.
+"""
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from app.core import database, etag, read_routing, versions
+from app.core.migrations import run_migrations
+from app.models.category import Category
+
+
+@pytest.fixture
+def replica(client, tmp_path, monkeypatch):
+    url = f"sqlite:///{tmp_path}/replica.db"
+    sync_engine = create_engine(url)
+    run_migrations(sync_engine)
+    sync_engine.dispose()
+
+    read_engine = database._create_async_engine(url)
+    monkeypatch.setattr(read_routing, "HAS_REPLICA", True)
+    monkeypatch.setattr(read_routing, "AsyncReadSessionLocal", async_sessionmaker(
+        read_engine, autoflush=False, expire_on_commit=False
+    ))
+    yield
+    client.cookies.clear()
+    # its connections belong to the client's event loop
+    client.portal.call(read_engine.dispose)
+
+
+@pytest.fixture
+def no_etags(monkeypatch):
+    monkeypatch.setattr(etag, "table_versions", versions.NoVersions())
+
+
+def _products(client, auth):
+    response = client.get("/api/products/", headers=auth)
+    assert response.status_code == 200, response.text
+    return response
+
+
+def _names(response) -> list[str]:
+    return [row["name"] for row in response.json()["items"]]
+
+
+def test_untagged_reads_go_to_the_replica(
+    client, auth, make_product, replica, no_etags
+):
+    make_product()
+    client.cookies.clear()
+
+    assert _names(_products(client, auth)) == []
+
+
+def test_writer_reads_its_own_writes(
+    client, auth, make_product, replica, no_etags
+):
+    make_product()  # the response sets the read-your-writes cookie
+
+    assert _names(_products(client, auth)) == ["Product 0"]
+
+
+def test_tagged_reads_go_to_the_primary(client, auth, make_product, replica):
+    make_product()
+    client.cookies.clear()
+
+    response = _products(client, auth)
+    assert "ETag" in response.headers
+    assert _names(response) == ["Product 0"]
+
+
+def test_cached_report_is_filled_from_the_primary(
+    client, auth, make_product, replica, no_etags
+):
+    make_product(price=5, quantity=4)
+    client.cookies.clear()
+
+    response = client.get("/api/reports/valuation", headers=auth)
+    assert response.status_code == 200, response.text
+    assert response.json()["total"]["value"] == 20
+    assert response.json()["by_category"][0]["category"] == "Category 0"
+
+
+def test_writes_go_to_the_primary(client, auth, replica, db):
+    response = client.post("/api/categories/", json={"name": "Tools"}, headers=auth)
+    assert response.status_code == 201, response.text
+
+    assert db.get(Category, response.json()["id"]) is not None
+
+
+@pytest.mark.parametrize("fmt", ["csv", "ndjson"])
+def test_exports_go_to_the_replica(client, auth, make_product, replica, fmt):
+    make_product()
+    client.cookies.clear()
+
+    response = client.get(
+        "/api/reports/inventory", params={"format": fmt}, headers=auth
+    )
+    assert response.status_code == 200, response.text
+    assert "ETag" not in response.headers
+    assert "Product 0" not in response.text
+
+    # the JSON form is tagged, so it reads the primary
+    response = client.get("/api/reports/inventory", headers=auth)
+    assert "ETag" in response.headers
+    assert response.json()["count"] == 1
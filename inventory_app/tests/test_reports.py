@@ -0,0 +1,41 @@
+from app.services import report_service
+
+
+def _sell(client, auth, product_id: int) -> None:
+    response = client.post(
+        "/api/sales/",
+        json={"product_id": product_id, "quantity_sold": 1},
+        headers=auth
+    )
+    assert response.status_code == 200, response.text
+
+
+def _summary(client, auth):
+    return client.get(
+        "/api/reports/sales/summary",
+        params={"granularity": "day", "group_by": "product"},
+        headers=auth
+    )
+
+
+def test_summary_within_the_row_cap(client, auth, make_product, monkeypatch):
+    for product in (make_product(), make_product()):
+        _sell(client, auth, product["id"])
+    monkeypatch.setattr(report_service, "MAX_SUMMARY_ROWS", 2)
+
+    response = _summary(client, auth)
+    assert response.status_code == 200, response.text
+    assert response.json()["count"] == 2
+    assert "ETag" in response.headers
+
+
+def test_summary_past_the_row_cap_is_refused(
+    client, auth, make_product, monkeypatch
+):
+    for product in (make_product(), make_product()):
+        _sell(client, auth, product["id"])
+    monkeypatch.setattr(report_service, "MAX_SUMMARY_ROWS", 1)
+
+    response = _summary(client, auth)
+    assert response.status_code == 400
+    assert "more than 1 rows" in response.json()["detail"]
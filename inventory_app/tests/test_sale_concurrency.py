@@ -0,0 +1,121 @@
+"""
+Concurrent sale writes against one hot product: stock may never go
+negative and every accepted change must be reflected in it.
+"""
+import random
+import threading
+from functools import partial
+
+from fastapi import HTTPException
+from sqlalchemy import func, select
+from sqlalchemy.exc import OperationalError
+
+from app.core.database import SessionLocal
+from app.models.product import Product
+from app.models.sale import Sale
+from app.models.sales_rollup import SalesDailyRollup
+from app.schemas.sale import SaleCreate
+from app.services import sale_service
+
+THREADS = 8
+
+
+def _retrying(call):
+    """Run `call(db)` in a fresh session, retrying SQLite lock conflicts."""
+    while True:
+        db = SessionLocal()
+        try:
+            return call(db)
+        except OperationalError:
+            continue
+        finally:
+            db.close()
+
+
+def _run(targets) -> None:
+    """Run each target on its own thread; re-raise the first failure."""
+    errors = []
+
+    def guarded(target) -> None:
+        try:
+            target()
+        except BaseException as exc:
+            errors.append(exc)
+
+    workers = [
+        threading.Thread(target=guarded, args=(target,)) for target in targets
+    ]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    if errors:
+        raise errors[0]
+
+
+def _state(db, product_id: int) -> tuple[int, int, int]:
+    db.expire_all()
+    stock = db.get(Product, product_id).quantity
+    sold = db.scalar(
+        select(func.coalesce(func.sum(Sale.quantity_sold), 0))
+        .where(Sale.product_id == product_id)
+    )
+    rolled_up = db.scalar(
+        select(func.coalesce(func.sum(SalesDailyRollup.quantity_sold), 0))
+        .where(SalesDailyRollup.product_id == product_id)
+    )
+    return stock, sold, rolled_up
+
+
+def test_concurrent_creates_do_not_oversell(db, make_product):
+    product = make_product(quantity=60)
+    accepted = []
+    lock = threading.Lock()
+
+    def sell_until_out() -> None:
+        payload = SaleCreate(product_id=product["id"], quantity_sold=1)
+        while True:
+            try:
+                _retrying(lambda db: sale_service.create_sale(db, payload))
+            except HTTPException as exc:
+                assert exc.status_code == 400
+                return
+            with lock:
+                accepted.append(1)
+
+    _run([sell_until_out] * THREADS)
+
+    assert _state(db, product["id"]) == (0, 60, 60)
+    assert len(accepted) == 60
+
+
+def test_concurrent_updates_lose_no_stock(db, make_product):
+    initial = 40
+    product = make_product(quantity=initial)
+    sale_ids = [
+        sale_service.create_sale(
+            db, SaleCreate(product_id=product["id"], quantity_sold=1)
+        )["id"]
+        for _ in range(4)
+    ]
+
+    def edit_sales(seed: int) -> None:
+        rng = random.Random(seed)
+        for _ in range(15):
+            sale_id = rng.choice(sale_ids)
+            payload = SaleCreate(
+                product_id=product["id"], quantity_sold=rng.randint(1, 12)
+            )
+            try:
+                _retrying(
+                    lambda db: sale_service.update_sale(db, sale_id, payload)
+                )
+            except HTTPException as exc:
+                assert exc.status_code == 400
+
+    _run([partial(edit_sales, seed) for seed in range(THREADS)])
+
+    stock, sold, rolled_up = _state(db, product["id"])
+    assert stock >= 0
+    assert stock == initial - sold
+    assert rolled_up == sold
@@ -0,0 +1,117 @@
+from sqlalchemy import select
+
+from app.models.sales_rollup import SalesDailyRollup
+from app.services.rollup_service import rebuild_rollup
+
+
+def _sell(client, auth, product_id: int, quantity: int) -> dict:
+    response = client.post(
+        "/api/sales/",
+        json={"product_id": product_id, "quantity_sold": quantity},
+        headers=auth
+    )
+    assert response.status_code == 200, response.text
+    return response.json()
+
+
+def _set_price(client, auth, product: dict, price: int) -> None:
+    fields = {k: v for k, v in product.items() if k != "id"}
+    response = client.put(
+        f"/api/products/{product['id']}",
+        json={**fields, "price": price},
+        headers=auth
+    )
+    assert response.status_code == 200, response.text
+
+
+def _summary(client, auth, granularity: str) -> list[tuple[int, int]]:
+    response = client.get(
+        "/api/reports/sales/summary",
+        params={"granularity": granularity},
+        headers=auth
+    )
+    assert response.status_code == 200, response.text
+    return [(row["quantity"], row["revenue"]) for row in response.json()["data"]]
+
+
+def _rollup(db) -> list[tuple[int, int]]:
+    return [
+        (row.quantity_sold, row.revenue)
+        for row in db.scalars(select(SalesDailyRollup))
+    ]
+
+
+def test_delete_after_price_change_reverses_booked_revenue(
+    client, auth, db, make_product
+):
+    product = make_product(price=100, quantity=10)
+    first = _sell(client, auth, product["id"], 2)
+    _sell(client, auth, product["id"], 1)
+
+    _set_price(client, auth, product, 200)
+    assert client.delete(f"/api/sales/{first['id']}", headers=auth).status_code == 200
+
+    assert _summary(client, auth, "day") == [(1, 100)]
+    assert _summary(client, auth, "hour") == [(1, 100)]
+    assert _rollup(db) == [(1, 100)]
+
+
+def test_update_keeps_sale_price_unless_product_changes(
+    client, auth, db, make_product
+):
+    product = make_product(price=100, quantity=10)
+    other = make_product(price=30, quantity=10)
+    sale = _sell(client, auth, product["id"], 2)
+
+    _set_price(client, auth, product, 200)
+    response = client.put(
+        f"/api/sales/{sale['id']}",
+        json={"product_id": product["id"], "quantity_sold": 3},
+        headers=auth
+    )
+    assert response.status_code == 200, response.text
+    assert _summary(client, auth, "day") == [(3, 300)]
+
+    response = client.put(
+        f"/api/sales/{sale['id']}",
+        json={"product_id": other["id"], "quantity_sold": 3},
+        headers=auth
+    )
+    assert response.status_code == 200, response.text
+    assert _summary(client, auth, "day") == [(3, 90)]
+    assert _summary(client, auth, "hour") == [(3, 90)]
+
+
+def test_rebuild_matches_incremental_rollup(client, auth, db, make_product):
+    product = make_product(price=100, quantity=50)
+    _sell(client, auth, product["id"], 4)
+    _set_price(client, auth, product, 150)
+    _sell(client, auth, product["id"], 2)
+    client.post(
+        "/api/sales/bulk",
+        json=[{"product_id": product["id"], "quantity_sold": 1}],
+        headers=auth
+    )
+
+    incremental = _rollup(db)
+    rebuild_rollup(db)
+    assert _rollup(db) == incremental == [(7, 850)]
+
+
+def test_sale_lists_show_the_booked_price(client, auth, make_product):
+    product = make_product(price=100, quantity=10)
+    sale = _sell(client, auth, product["id"], 3)
+    assert sale["unit_price"] == 100
+
+    _set_price(client, auth, product, 250)
+
+    listed = client.get("/api/sales/", headers=auth).json()["items"]
+    assert [(s["unit_price"], s["quantity_sold"]) for s in listed] == [(100, 3)]
+
+    page = client.get(
+        "/ui/sales",
+        cookies={"access_token": auth["Authorization"].removeprefix("Bearer ")}
+    )
+    assert page.status_code == 200, page.text
+    assert "₹ 300" in page.text
+    assert "₹ 750" not in page.text
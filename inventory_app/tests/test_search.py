@@ -0,0 +1,42 @@
+import pytest
+
+from app.services import search_service
+
+
+def _search(client, auth, term: str, **params) -> dict:
+    response = client.get(
+        "/api/products/", params={"search": term, **params}, headers=auth
+    )
+    assert response.status_code == 200, response.text
+    return response.json()
+
+
+@pytest.fixture
+def widgets(make_product):
+    # created oldest first; only the last one starts with the term
+    return [
+        make_product(name=name)
+        for name in ("Blue widget", "Red widget", "Green widget", "Widget stand")
+    ]
+
+
+@pytest.mark.parametrize("term", ["widget", "wi"])
+def test_few_matches_are_ranked(client, auth, widgets, term):
+    names = [row["name"] for row in _search(client, auth, term)["items"]]
+
+    assert names[0] == "Widget stand"
+    assert sorted(names) == sorted(w["name"] for w in widgets)
+
+
+@pytest.mark.parametrize("term", ["widget", "wi"])
+def test_many_matches_are_listed_newest_first(
+    client, auth, widgets, monkeypatch, term
+):
+    monkeypatch.setattr(search_service, "RANKED_SEARCH_LIMIT", 2)
+
+    first = _search(client, auth, term, limit=3)
+    second = _search(client, auth, term, limit=3, cursor=first["next_cursor"])
+
+    ids = [row["id"] for row in first["items"] + second["items"]]
+    assert ids == sorted((w["id"] for w in widgets), reverse=True)
+    assert second["next_cursor"] is None
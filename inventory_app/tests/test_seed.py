@@ -0,0 +1,45 @@
+import pytest
+from sqlalchemy import text
+
+from app.models.product import Product
+from app.tools import seed as seed_tool
+
+SMALL = ["--products", "20", "--sales", "50", "--categories", "3",
+         "--suppliers", "3", "--skip-rollup"]
+
+
+def _schema(db) -> set[str]:
+    return set(db.scalars(text("SELECT name FROM sqlite_master")))
+
+
+def _search(client, auth, term: str) -> list[str]:
+    response = client.get("/api/products/", params={"search": term}, headers=auth)
+    assert response.status_code == 200, response.text
+    return [row["name"] for row in response.json()["items"]]
+
+
+def test_refused_seed_leaves_the_schema_alone(client, auth, db, make_product):
+    make_product(name="Blue Widget")
+    before = _schema(db)
+
+    with pytest.raises(SystemExit):
+        seed_tool.seed(seed_tool.parse_args(SMALL))
+
+    assert _schema(db) == before
+    assert _search(client, auth, "Widget") == ["Blue Widget"]
+
+
+def test_failed_load_restores_the_indexes(client, auth, db, monkeypatch):
+    before = _schema(db)
+
+    def broken(self, prices):
+        raise RuntimeError("load failed")
+        yield
+
+    monkeypatch.setattr(seed_tool.Generator, "sales", broken)
+    with pytest.raises(RuntimeError):
+        seed_tool.seed(seed_tool.parse_args(SMALL))
+
+    assert _schema(db) == before
+    assert db.query(Product).count() == 0
+    assert {"products_fts", "products_fts_ai"} <= before